@@ -13,13 +13,13 @@ from pathlib import Path
 from typing import List, Optional
 import time
 import json
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import multiprocessing as mp
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from core.epub_processor import EPUBProcessor, ProcessingResult
+from core.epub_processor import EPUBProcessor, ProcessingResult, process_epub_file
 from utils.config import load_config
 from utils.logger import setup_logging, ProgressLogger
 
@@ -75,11 +75,13 @@ class BatchProcessor:
                 results.append(result)
                 progress.update()
         else:
-            # Parallel processing
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # Parallel processing across processes; parsing and cleaning are CPU-bound
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
                 # Submit all tasks
                 future_to_file = {
-                    executor.submit(self._process_single_file, epub_file, output_base_dir): epub_file
+                    executor.submit(
+                        process_epub_file, epub_file, self.config, output_base_dir / epub_file.stem
+                    ): epub_file
                     for epub_file in epub_files
                 }
 
@@ -88,6 +90,7 @@ class BatchProcessor:
                     epub_file = future_to_file[future]
                     try:
                         result = future.result()
+                        self._log_result(epub_file, result)
                         results.append(result)
                         progress.update()
                     except Exception as e:
@@ -123,11 +126,7 @@ class BatchProcessor:
 
             # Process the file
             result = processor.process_epub(epub_file, output_dir)
-
-            if result.success:
-                self.logger.info(f"✅ Completed: {epub_file.name}")
-            else:
-                self.logger.error(f"❌ Failed: {epub_file.name} - {result.error_message}")
+            self._log_result(epub_file, result)
 
             return result
 
@@ -143,6 +142,13 @@ class BatchProcessor:
                 error_message=str(e)
             )
 
+    def _log_result(self, epub_file: Path, result: ProcessingResult) -> None:
+        """Log the outcome of processing a single file."""
+        if result.success:
+            self.logger.info(f"✅ Completed: {epub_file.name}")
+        else:
+            self.logger.error(f"❌ Failed: {epub_file.name} - {result.error_message}")
+
     def _filter_completed_files(self, epub_files: List[Path], output_base_dir: Path) -> List[Path]:
         """Filter out already processed files when resuming."""
         remaining_files = []
@@ -289,13 +289,15 @@ def cli():
 
 @cli.command()
 @click.argument('epub_file', type=click.Path(exists=True, path_type=Path))
-def validate(epub_file: Path):
+@click.option('--deep', is_flag=True,
+              help='Also parse the full book to check metadata and content')
+def validate(epub_file: Path, deep: bool):
     """Validate an EPUB file."""
     try:
         config = load_config()
         processor = EPUBProcessor(config, progress_tracker=None)
 
-        issues = processor.validate_epub(epub_file)
+        issues = processor.validate_epub(epub_file, deep=deep)
 
         if issues:
             click.echo("❌ Validation Issues:")
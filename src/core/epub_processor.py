@@ -6,20 +6,58 @@ using OmniParser for EPUB extraction and text cleaning for TTS optimization.
 """
 
 import logging
+import os
 import time
 from pathlib import Path
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, replace
 import json
 import shutil
+import zipfile
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from omniparser import parse_document
 from omniparser.models import Document as OmniDocument
-from core.text_cleaner import TextCleaner, Chapter, CleaningStats
+from core.text_cleaner import TextCleaner, Chapter, CleaningStats, count_words
 from utils.config import Config
 
 logger = logging.getLogger(__name__)
 
+# Number of converted OmniParser metadata objects kept per processor
+METADATA_CACHE_SIZE = 8
+
+
+def _write_json(output_path: Path, data: Any) -> None:
+    """
+    Write data as indented UTF-8 JSON, using orjson when it is installed.
+
+    orjson serializes straight to UTF-8 bytes in C, while json.dump with an
+    indent falls back to the pure-Python encoder, which dominates saving a
+    book-length result. Output layout matches json.dump(indent=2,
+    ensure_ascii=False).
+
+    Args:
+        output_path: File to write
+        data: JSON-serializable data
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            payload = None  # Let json report unsupported types as before
+        if payload is not None:
+            with open(output_path, 'wb') as f:
+                f.write(payload)
+            return
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
 
 @dataclass
 class ProcessingResult:
@@ -43,8 +81,7 @@ class ProcessingResult:
 
     def save_to_json(self, output_path: Path) -> None:
         """Save result to JSON file."""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        _write_json(output_path, self.to_dict())
         logger.info(f"Processing result saved to {output_path}")
 
 
@@ -67,12 +104,34 @@ class EPUBProcessor:
         # Initialize text cleaner for epub2tts-specific cleaning
         self.cleaner = TextCleaner()
 
+        # Converted metadata keyed by id() of the OmniParser metadata object
+        self._metadata_cache: Dict[int, tuple] = {}
+
         # Create temp directory if needed
         self.temp_dir = Path(config.processing.temp_dir)
         self.temp_dir.mkdir(parents=True, exist_ok=True)
 
         logger.info(f"EPUB processor initialized with OmniParser and temp dir: {self.temp_dir}")
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Keep only plain configuration when pickling for worker processes.
+
+        The text cleaner may hold native pattern databases and the progress
+        tracker may hold UI handles, neither of which can cross a process
+        boundary. Both are rebuilt or dropped on unpickle.
+        """
+        return {'config': self.config, 'temp_dir': self.temp_dir}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Rebuild the processor from pickled configuration."""
+        self.config = state['config']
+        self.temp_dir = state['temp_dir']
+        self.progress_tracker = None
+        self.cleaner = TextCleaner()
+        self._metadata_cache = {}
+        self.temp_dir.mkdir(parents=True, exist_ok=True)
+
     def _omni_to_epub2tts_chapter(self, omni_chapter, chapter_num: int) -> Chapter:
         """
         Convert OmniParser Chapter to epub2tts Chapter.
@@ -96,7 +155,30 @@ class EPUBProcessor:
 
     def _omni_metadata_to_dict(self, omni_metadata) -> Dict[str, Any]:
         """
-        Convert OmniParser Metadata to dictionary.
+        Convert OmniParser Metadata to dictionary, reusing earlier conversions.
+
+        Args:
+            omni_metadata: OmniParser metadata object
+
+        Returns:
+            Metadata dictionary
+        """
+        # The cache entry keeps the metadata object alive, so its id() cannot be reused
+        cached = self._metadata_cache.get(id(omni_metadata))
+        if cached is not None and cached[0] is omni_metadata:
+            return dict(cached[1])
+
+        metadata_dict = self._convert_omni_metadata(omni_metadata)
+
+        if len(self._metadata_cache) >= METADATA_CACHE_SIZE:
+            self._metadata_cache.pop(next(iter(self._metadata_cache)))
+        self._metadata_cache[id(omni_metadata)] = (omni_metadata, metadata_dict)
+
+        return dict(metadata_dict)
+
+    def _convert_omni_metadata(self, omni_metadata) -> Dict[str, Any]:
+        """
+        Convert OmniParser Metadata to dictionary without caching.
 
         Args:
             omni_metadata: OmniParser metadata object
@@ -177,22 +259,36 @@ class EPUBProcessor:
                 for idx, ch in enumerate(omni_doc.chapters)
             ]
 
-            # Apply epub2tts text cleaning to full content
-            logger.info("Applying epub2tts text cleaning...")
-            cleaned_content = self.cleaner.clean_text(omni_doc.content)
-            cleaning_stats = self.cleaner.get_cleaning_stats()
-
-            # Clean chapter content too
-            logger.info("Cleaning individual chapter content...")
-            for chapter in chapters:
-                chapter.content = self.cleaner.clean_text(chapter.content)
-
             # Convert metadata
             metadata_dict = self._omni_metadata_to_dict(omni_doc.metadata)
 
             # Convert images
             image_info = self._omni_images_to_list(omni_doc.images)
 
+            # Only the raw text is needed from here on. Drop the parsed document
+            # so the uncleaned book text can be freed as soon as it is cleaned,
+            # instead of staying alive alongside the cleaned copies.
+            raw_content = omni_doc.content
+            del omni_doc
+
+            # Apply epub2tts text cleaning to the full content and each chapter.
+            # The chapters are cleaned in worker processes for large books,
+            # while this process cleans the full content alongside them.
+            logger.info("Applying epub2tts text cleaning to content and chapters...")
+            chapter_texts = [chapter.content for chapter in chapters]
+            with self.cleaner.parallel_cleaning(
+                chapter_texts, max_workers=self.config.processing.max_parallel_jobs
+            ) as cleaned_chapters:
+                del chapter_texts
+
+                # The uncleaned full text is freed as soon as it is cleaned
+                cleaned_content, cleaning_stats = self.cleaner.clean_text_with_stats(raw_content)
+                del raw_content
+
+                # Each raw chapter is released as its cleaned text replaces it
+                for chapter, (cleaned_chapter, _) in zip(chapters, cleaned_chapters):
+                    chapter.content = cleaned_chapter
+
             # Apply chapter post-processing
             chapters = self._post_process_chapters(chapters)
 
@@ -295,31 +391,31 @@ class EPUBProcessor:
         """
         max_words = self.config.chapters.max_words_per_chunk
         words = chapter.content.split()
-        chunks = []
-
-        for i in range(0, len(words), max_words):
-            chunk_words = words[i:i + max_words]
-            chunk_content = ' '.join(chunk_words)
+        total_words = len(words)
 
-            # Create more descriptive titles for split chapters
-            part_num = len(chunks) + 1
-            if len(chunks) == 0 and len(words) <= max_words:
-                # If it's the only chunk, don't add "Part 1"
-                chunk_title = chapter.title
-            else:
-                chunk_title = f"{chapter.title} - Part {part_num}"
-
-            chunk_num = starting_num + len(chunks)
-
-            chunk = Chapter(
-                chapter_num=chunk_num,
-                title=chunk_title,
-                content=chunk_content,
-                word_count=len(chunk_words),
-                estimated_duration=len(chunk_words) / 200.0,
-                confidence=chapter.confidence
+        # Chunk boundaries are word offsets, so the loop runs once per chunk
+        # and the per-word work stays inside str.split / str.join
+        spans = [
+            (start, min(start + max_words, total_words))
+            for start in range(0, total_words, max_words)
+        ]
+        # If it's the only chunk, don't add "Part 1"
+        single_chunk = total_words <= max_words
+        title = chapter.title
+        confidence = chapter.confidence
+        # The chunk count is known up front, so size the list once
+        chunks: List[Optional[Chapter]] = [None] * len(spans)
+
+        for part_index, (start, end) in enumerate(spans):
+            chunk_word_count = end - start
+            chunks[part_index] = Chapter(
+                chapter_num=starting_num + part_index,
+                title=title if single_chunk else f"{title} - Part {part_index + 1}",
+                content=' '.join(words[start:end]),
+                word_count=chunk_word_count,
+                estimated_duration=chunk_word_count / 200.0,
+                confidence=confidence
             )
-            chunks.append(chunk)
 
         logger.debug(f"Split chapter into {len(chunks)} chunks (chapters {starting_num}-{starting_num + len(chunks) - 1})")
         return chunks
@@ -363,8 +459,7 @@ class EPUBProcessor:
                 'chapters': [asdict(chapter) for chapter in chapters],
                 'images': image_info
             }
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(result_data, f, indent=2, ensure_ascii=False)
+            _write_json(json_file, result_data)
 
         # Save individual chapters if configured
         if self.config.output.save_intermediate:
@@ -379,19 +474,20 @@ class EPUBProcessor:
         # Save metadata
         if self.config.output.create_metadata:
             metadata_file = output_dir / f"{base_name}_metadata.json"
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
+            _write_json(metadata_file, metadata)
 
         # Generate table of contents
         if self.config.output.generate_toc:
             toc_file = output_dir / f"{base_name}_toc.txt"
+            toc_lines = ["Table of Contents\n", "=================\n\n"]
+            toc_lines.extend(
+                f"Chapter {chapter.chapter_num}: {chapter.title}\n"
+                f"  Words: {chapter.word_count}\n"
+                f"  Estimated duration: {chapter.estimated_duration:.1f} minutes\n\n"
+                for chapter in chapters
+            )
             with open(toc_file, 'w', encoding='utf-8') as f:
-                f.write("Table of Contents\n")
-                f.write("=================\n\n")
-                for chapter in chapters:
-                    f.write(f"Chapter {chapter.chapter_num}: {chapter.title}\n")
-                    f.write(f"  Words: {chapter.word_count}\n")
-                    f.write(f"  Estimated duration: {chapter.estimated_duration:.1f} minutes\n\n")
+                f.writelines(toc_lines)
 
         # Copy images from OmniParser's extracted paths if they exist
         if image_info:
@@ -401,7 +497,8 @@ class EPUBProcessor:
             copied_count = 0
             for info in image_info:
                 source_path = Path(info.get('file_path', ''))
-                if source_path.exists() and source_path.is_file():
+                # is_file() is False for missing paths, so one stat covers both checks
+                if source_path.is_file():
                     dest_file = images_dir / source_path.name
                     shutil.copy2(source_path, dest_file)
 
@@ -416,12 +513,17 @@ class EPUBProcessor:
 
         logger.info(f"Results saved to {output_dir}")
 
-    def validate_epub(self, epub_path: Path) -> List[str]:
+    def validate_epub(self, epub_path: Path, deep: bool = False) -> List[str]:
         """
-        Validate EPUB file using OmniParser.
+        Validate EPUB file structure, optionally with a full OmniParser parse.
+
+        The default check only reads the ZIP central directory and the
+        mimetype entry, which is enough to reject files that are not EPUBs
+        without paying for a full parse.
 
         Args:
             epub_path: Path to EPUB file
+            deep: Also parse the book with OmniParser and check its content
 
         Returns:
             List of validation issues (empty if valid)
@@ -447,7 +549,27 @@ class EPUBProcessor:
         except Exception as e:
             issues.append(f"Cannot read file stats: {e}")
 
-        # Try to parse with OmniParser to validate format
+        # Check the EPUB container structure
+        try:
+            with zipfile.ZipFile(epub_path) as epub_zip:
+                names = set(epub_zip.namelist())
+                if 'META-INF/container.xml' not in names:
+                    issues.append("Missing META-INF/container.xml - not a valid EPUB container")
+                if 'mimetype' not in names:
+                    issues.append("Missing mimetype entry - not a valid EPUB container")
+                elif epub_zip.read('mimetype').strip() != b'application/epub+zip':
+                    issues.append("Unexpected mimetype - not an EPUB file")
+        except zipfile.BadZipFile:
+            issues.append("File is not a valid ZIP archive - not an EPUB file")
+            return issues
+        except Exception as e:
+            issues.append(f"Cannot read EPUB container: {e}")
+            return issues
+
+        if not deep:
+            return issues
+
+        # Parse with OmniParser to validate content
         try:
             omni_doc = parse_document(epub_path)
             if not omni_doc.metadata or not omni_doc.metadata.title:
@@ -481,7 +603,7 @@ class EPUBProcessor:
 
             # Get content metrics
             text_length = len(omni_doc.content)
-            estimated_words = omni_doc.metadata.word_count or len(omni_doc.content.split())
+            estimated_words = omni_doc.metadata.word_count or count_words(omni_doc.content)
             estimated_processing_time = text_length / 10000  # Rough estimate
 
             info = {
@@ -500,4 +622,30 @@ class EPUBProcessor:
 
         except Exception as e:
             logger.error(f"Error getting EPUB info: {e}")
-            return {'error': str(e)}
\ No newline at end of file
+            return {'error': str(e)}
+
+
+def process_epub_file(epub_path: Path, config: Config, output_dir: Optional[Path] = None) -> ProcessingResult:
+    """
+    Process a single EPUB in a worker process.
+
+    Builds a fresh EPUBProcessor with a temp directory unique to the current
+    process, so it can be used directly with ProcessPoolExecutor to spread a
+    batch of books across CPU cores.
+
+    Args:
+        epub_path: Path to EPUB file
+        config: Configuration object
+        output_dir: Optional output directory for results
+
+    Returns:
+        ProcessingResult for the book
+    """
+    worker_temp_dir = Path(config.processing.temp_dir) / f"pid_{os.getpid()}"
+    # Books already run one per process, so clean each book's texts in-process
+    worker_config = replace(
+        config,
+        processing=replace(config.processing, temp_dir=str(worker_temp_dir), max_parallel_jobs=1)
+    )
+    processor = EPUBProcessor(worker_config)
+    return processor.process_epub(epub_path, output_dir)
@@ -5,17 +5,101 @@ This module provides comprehensive text cleaning and preprocessing
 specifically designed for Text-to-Speech applications.
 """
 
+import json
 import logging
+import os
 import regex as re
-from typing import Dict, List, Optional, Tuple, Any
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple, Any
 from dataclasses import dataclass
 from pathlib import Path
-import ftfy
+import numpy as np
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 from utils.config import load_regex_patterns
 
 logger = logging.getLogger(__name__)
 
+# Whitespace normalization as one alternation. Line-edge runs are tried
+# first so they are removed rather than collapsed.
+WHITESPACE_PATTERN = re.compile(
+    r'(?P<edge>^[ \t]+|[ \t]+$)'
+    r'|(?P<spaces> {2,})'
+    r'|(?P<newlines>\n{3,})',
+    re.MULTILINE
+)
+WHITESPACE_REPLACEMENTS = {'edge': '', 'spaces': ' ', 'newlines': '\n\n'}
+
+# Pause rules that depend on context; literal markers use str.replace instead
+CHAPTER_START_PATTERN = re.compile(r'\[CHAPTER_START: ([^\]]+)\]')
+PUNCTUATION_PAUSE_PATTERNS = [
+    ('question_end', '?', re.compile(r'\?(\s+)')),
+    ('exclamation_end', '!', re.compile(r'!(\s+)')),
+]
+CLAUSE_PAUSE_PATTERNS = [
+    ('comma_pause', ',', re.compile(r',(\s+)')),
+    ('sentence_end', '.', re.compile(r'\.(\s+)')),
+]
+
+# ASCII characters ftfy may still rewrite: HTML entities, line breaks and
+# control characters. ASCII text without them passes through ftfy unchanged.
+FTFY_ASCII_TRIGGERS = re.compile(r'[&\r\x00-\x08\x0b\x0c\x0e-\x1f\x7f]')
+
+# ftfy module, imported on first use
+_ftfy = None
+
+# Lookup table of code points str.split() treats as whitespace. None lie
+# above U+3000; the extra last entry stands in for every higher code point.
+WHITESPACE_TABLE = np.array([chr(cp).isspace() for cp in range(0x3001)] + [False])
+ASCII_WHITESPACE = WHITESPACE_TABLE[:128]
+
+# Texts shorter than this are counted with str.split(), which is cheaper there
+VECTOR_WORD_COUNT_MIN_CHARS = 4096
+
+# Characters that end the literal prefix of a pattern
+LITERAL_ANCHOR_STOP_CHARS = frozenset('.^$*+?{}[]()|')
+
+# Below this many fusable multi-character replacements, sequential
+# str.replace calls are faster than one Aho-Corasick scan
+AUTOMATON_MIN_KEYS = 12
+
+# Compiled pattern sets shared by cleaners built from identical rules
+_COMPILED_PATTERN_CACHE: Dict[str, Dict[str, Any]] = {}
+COMPILED_PATTERN_CACHE_SIZE = 4
+
+# Below this many characters in total, worker start-up costs more than it saves
+PARALLEL_CLEANING_MIN_CHARS = 200_000
+
+# Pause lengths used when a rule is missing from pause_rules
+DEFAULT_PAUSES = {
+    'chapter_start': 2.0,
+    'question_end': 0.3,
+    'exclamation_end': 0.2,
+    'dialogue_end': 0.3,
+    'header_end': 1.0,
+    'comma_pause': 0.5,
+    'sentence_end': 0.5,
+    'paragraph_end': 0.5,
+}
+
 
 @dataclass
 class CleaningStats:
@@ -62,8 +146,11 @@ class TextCleaner:
         Args:
             rules_path: Path to regex patterns YAML file
         """
+        self.rules_path = rules_path
         self.rules = load_regex_patterns(rules_path)
-        self.compiled_patterns = self._compile_patterns()
+        self.compiled_patterns = self._get_compiled_patterns()
+        # Hyperscan scratch space is per cleaner; databases may be shared
+        self._hyperscan_scratch = self._allocate_hyperscan_scratch()
         self.stats = CleaningStats(0, 0, 0, 0, 0)
 
     def clean_text(self, text: str) -> str:
@@ -92,8 +179,7 @@ class TextCleaner:
 
         try:
             # Step 1: Fix encoding issues
-            cleaned_text = ftfy.fix_text(cleaned_text)
-            logger.debug("Applied encoding fixes")
+            cleaned_text = self._fix_encoding(cleaned_text)
 
             # Step 2: Apply removal patterns
             cleaned_text = self._apply_removal_patterns(cleaned_text)
@@ -126,6 +212,138 @@ class TextCleaner:
             logger.error(f"Error during text cleaning: {e}")
             return text  # Return original text on error
 
+    def _fix_encoding(self, text: str) -> str:
+        """
+        Fix encoding issues with ftfy, skipping text it would not change.
+
+        Args:
+            text: Text to fix
+
+        Returns:
+            Text with encoding issues fixed
+        """
+        if text.isascii() and not FTFY_ASCII_TRIGGERS.search(text):
+            logger.debug("Skipped encoding fixes for plain ASCII text")
+            return text
+
+        global _ftfy
+        if _ftfy is None:
+            import ftfy
+            _ftfy = ftfy
+
+        text = _ftfy.fix_text(text)
+        logger.debug("Applied encoding fixes")
+        return text
+
+    def clean_texts_parallel(
+        self,
+        texts: List[str],
+        max_workers: Optional[int] = None
+    ) -> List[Tuple[str, CleaningStats]]:
+        """
+        Clean several independent texts, spreading them across processes.
+
+        Each worker process builds its own TextCleaner once and reuses it for
+        every text it receives. Small batches are cleaned in-process, where
+        starting workers would cost more than it saves.
+
+        Args:
+            texts: Texts to clean, such as the chapters of a book
+            max_workers: Maximum worker processes (capped at the CPU count)
+
+        Returns:
+            List of (cleaned_text, cleaning_stats) in the same order as texts
+        """
+        with self.parallel_cleaning(texts, max_workers) as results:
+            return list(results)
+
+    @contextmanager
+    def parallel_cleaning(
+        self,
+        texts: List[str],
+        max_workers: Optional[int] = None
+    ) -> Iterator[Iterator[Tuple[str, CleaningStats]]]:
+        """
+        Start cleaning texts in worker processes and yield their results.
+
+        Every text is handed to the workers on entry, so the caller can do
+        other work, such as cleaning another text in this process, while
+        they run. Small batches are instead cleaned in-process as the
+        results are iterated.
+
+        Args:
+            texts: Texts to clean
+            max_workers: Maximum worker processes (capped at the CPU count)
+
+        Yields:
+            Iterator of (cleaned_text, cleaning_stats) in the same order as texts
+        """
+        cpu_count = os.cpu_count() or 1
+        max_workers = min(max_workers or cpu_count, cpu_count, len(texts))
+        total_chars = sum(len(text) for text in texts if text)
+
+        if max_workers <= 1 or total_chars < PARALLEL_CLEANING_MIN_CHARS:
+            yield (self.clean_text_with_stats(text) for text in texts)
+            return
+
+        logger.info(f"Cleaning {len(texts)} texts with {max_workers} worker processes")
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_cleaning_worker,
+            initargs=(self.rules_path,)
+        ) as executor:
+            yield executor.map(_clean_in_worker, texts)
+
+    def clean_text_with_stats(self, text: str) -> Tuple[str, CleaningStats]:
+        """Clean one text and return it with the stats of this text alone."""
+        self.stats = CleaningStats(0, 0, 0, 0, 0)
+        cleaned = self.clean_text(text)
+        return cleaned, self.get_cleaning_stats()
+
+    def _get_compiled_patterns(self) -> Dict[str, Any]:
+        """
+        Get compiled patterns for the loaded rules, reusing earlier compiles.
+
+        Compiled sets are cached by the content of the rules, so every
+        cleaner built from the same rules file shares one compile.
+
+        Returns:
+            Dictionary of compiled patterns
+        """
+        try:
+            cache_key = json.dumps(self.rules, sort_keys=True, default=str)
+        except (TypeError, ValueError):
+            return self._compile_patterns()
+
+        compiled = _COMPILED_PATTERN_CACHE.get(cache_key)
+        if compiled is None:
+            compiled = self._compile_patterns()
+            if compiled:
+                if len(_COMPILED_PATTERN_CACHE) >= COMPILED_PATTERN_CACHE_SIZE:
+                    _COMPILED_PATTERN_CACHE.pop(next(iter(_COMPILED_PATTERN_CACHE)))
+                _COMPILED_PATTERN_CACHE[cache_key] = compiled
+        else:
+            logger.debug("Reusing compiled cleaning patterns")
+
+        return compiled
+
+    def _allocate_hyperscan_scratch(self) -> Dict[str, Any]:
+        """
+        Allocate Hyperscan scratch space for this cleaner's databases.
+
+        Returns:
+            Mapping of pattern group to scratch space
+        """
+        scratch = {}
+        for group, hs_group in self.compiled_patterns.get('hyperscan', {}).items():
+            if hs_group is None:
+                continue
+            try:
+                scratch[group] = hyperscan.Scratch(hs_group['database'])
+            except Exception as e:
+                logger.debug(f"Could not allocate Hyperscan scratch for {group} patterns: {e}")
+        return scratch
+
     def _compile_patterns(self) -> Dict[str, Any]:
         """
         Compile regex patterns for better performance.
@@ -141,9 +359,16 @@ class TextCleaner:
                 compiled['remove'] = []
                 for pattern_config in self.rules['cleaning_rules']['remove']:
                     pattern = pattern_config['pattern']
-                    flags = re.MULTILINE if pattern_config.get('multiline', False) else 0
+                    multiline = pattern_config.get('multiline', False)
+                    regex, engine = self._compile_rule_regex(
+                        pattern, multiline, pattern_config.get('engine', 'regex')
+                    )
                     compiled_pattern = {
-                        'regex': re.compile(pattern, flags),
+                        'regex': regex,
+                        'engine': engine,
+                        'pattern': pattern,
+                        'anchor': self._literal_anchor(pattern),
+                        'multiline': multiline,
                         'name': pattern_config.get('name', 'unnamed'),
                         'replacement': pattern_config.get('replacement', '')
                     }
@@ -154,19 +379,45 @@ class TextCleaner:
                 compiled['transform'] = []
                 for pattern_config in self.rules['cleaning_rules']['transform']:
                     pattern = pattern_config['pattern']
-                    flags = re.MULTILINE if pattern_config.get('multiline', False) else 0
+                    multiline = pattern_config.get('multiline', False)
+                    regex, engine = self._compile_rule_regex(
+                        pattern, multiline, pattern_config.get('engine', 'regex')
+                    )
                     compiled_pattern = {
-                        'regex': re.compile(pattern, flags),
+                        'regex': regex,
+                        'engine': engine,
+                        'pattern': pattern,
+                        'anchor': self._literal_anchor(pattern),
+                        'multiline': multiline,
                         'name': pattern_config.get('name', 'unnamed'),
                         'replacement': pattern_config.get('replacement', '')
                     }
                     compiled['transform'].append(compiled_pattern)
 
+            # Group TTS replacements into translate tables and plain replaces
+            if 'cleaning_rules' in self.rules and 'tts_replacements' in self.rules['cleaning_rules']:
+                compiled['tts_replacements'] = self._compile_tts_replacements(
+                    self.rules['cleaning_rules']['tts_replacements']
+                )
+
             # Compile chapter detection patterns
             if 'chapter_detection' in self.rules:
                 compiled['chapters'] = []
-                for pattern in self.rules['chapter_detection']['patterns']:
-                    compiled['chapters'].append(re.compile(pattern, re.MULTILINE | re.IGNORECASE))
+                for index, pattern in enumerate(self.rules['chapter_detection']['patterns']):
+                    compiled['chapters'].append({
+                        'regex': re.compile(pattern, re.MULTILINE | re.IGNORECASE),
+                        'pattern': pattern,
+                        'multiline': True,
+                        'ignorecase': True,
+                        'name': f'chapter_pattern_{index + 1}'
+                    })
+
+            # Build Hyperscan databases so each group is located in a single scan
+            compiled['hyperscan'] = {
+                group: self._build_hyperscan_database(compiled[group])
+                for group in ('remove', 'transform', 'chapters')
+                if group in compiled
+            }
 
             logger.info(f"Compiled {len(compiled)} pattern groups")
             return compiled
@@ -175,6 +426,321 @@ class TextCleaner:
             logger.error(f"Error compiling patterns: {e}")
             return {}
 
+    @staticmethod
+    def _compile_rule_regex(pattern: str, multiline: bool, engine: str) -> Tuple[Any, str]:
+        """
+        Compile a cleaning rule with the engine it asks for.
+
+        Rules with ``engine: re2`` use Google RE2, whose automaton-based
+        matching runs in linear time and so cannot backtrack catastrophically.
+        RE2 rejects backreferences and lookarounds, and its \\d, \\w, \\s and
+        \\b are ASCII-only, which is why it is opt-in per rule. Rules RE2
+        cannot compile, or any rule when RE2 is not installed, use the regex
+        module.
+
+        Args:
+            pattern: Rule pattern
+            multiline: Whether ^ and $ match at line boundaries
+            engine: Requested engine, 'regex' or 're2'
+
+        Returns:
+            Tuple of (compiled pattern, engine used)
+        """
+        if engine == 're2':
+            if RE2_AVAILABLE:
+                try:
+                    return re2.compile(f'(?m){pattern}' if multiline else pattern), 're2'
+                except re2.error as e:
+                    logger.warning(f"RE2 cannot compile '{pattern}' ({e}), using regex instead")
+            else:
+                logger.debug(f"RE2 not installed, compiling '{pattern}' with regex")
+
+        return re.compile(pattern, re.MULTILINE if multiline else 0), 'regex'
+
+    @staticmethod
+    def _literal_anchor(pattern: str) -> str:
+        """
+        Extract a literal prefix that every match of a pattern must contain.
+
+        Only the plain literal characters at the start of the pattern (after
+        an optional ^) are taken, stopping at the first regex construct. A
+        character followed by an optional quantifier is dropped. Patterns with
+        alternation or inline flags get no anchor, since their prefix is not
+        guaranteed to appear verbatim.
+
+        Args:
+            pattern: Rule pattern
+
+        Returns:
+            Required literal substring, or '' if none could be extracted
+        """
+        if '|' in pattern or '(?' in pattern:
+            return ''
+
+        anchor = []
+        position = 1 if pattern.startswith('^') else 0
+        while position < len(pattern):
+            char = pattern[position]
+            if char == '\\':
+                escaped = pattern[position + 1:position + 2]
+                if not escaped or escaped.isalnum():
+                    break
+                char = escaped
+                position += 2
+            elif char in LITERAL_ANCHOR_STOP_CHARS:
+                break
+            else:
+                position += 1
+
+            if pattern[position:position + 1] in ('?', '*', '{'):
+                break
+            anchor.append(char)
+            if pattern[position:position + 1] == '+':
+                break
+
+        return ''.join(anchor)
+
+    def _build_hyperscan_database(self, pattern_configs: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Compile one Hyperscan database for a group of patterns.
+
+        Patterns Hyperscan supports exactly are compiled with leftmost start
+        reporting, so a single scan locates their matches. The rest (empty
+        matches, backreferences, lookarounds) are compiled in prefilter mode,
+        which may report false positives but never misses a match, and are
+        only used to decide whether the regex needs to run at all.
+
+        Args:
+            pattern_configs: Compiled pattern configurations of one group
+
+        Returns:
+            Dictionary with the database and the set of exactly matched
+            pattern indexes, or None if Hyperscan is unavailable or fails
+        """
+        if not HYPERSCAN_AVAILABLE or not pattern_configs:
+            return None
+
+        try:
+            expressions = []
+            flags = []
+            exact_ids = set()
+            for index, pattern_config in enumerate(pattern_configs):
+                expression = pattern_config['pattern'].encode('utf-8')
+                base_flags = hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+                if pattern_config['multiline']:
+                    base_flags |= hyperscan.HS_FLAG_MULTILINE
+                if pattern_config.get('ignorecase'):
+                    base_flags |= hyperscan.HS_FLAG_CASELESS
+
+                exact_flags = base_flags | hyperscan.HS_FLAG_SOM_LEFTMOST
+                if self._hyperscan_supports(expression, exact_flags):
+                    flags.append(exact_flags)
+                    exact_ids.add(index)
+                else:
+                    flags.append(
+                        base_flags
+                        | hyperscan.HS_FLAG_PREFILTER
+                        | hyperscan.HS_FLAG_ALLOWEMPTY
+                        | hyperscan.HS_FLAG_SINGLEMATCH
+                    )
+                expressions.append(expression)
+
+            database = hyperscan.Database()
+            database.compile(
+                expressions=expressions,
+                ids=list(range(len(expressions))),
+                elements=len(expressions),
+                flags=flags
+            )
+            return {'database': database, 'exact': exact_ids}
+
+        except Exception as e:
+            logger.warning(f"Hyperscan database unavailable, using regex only: {e}")
+            return None
+
+    @staticmethod
+    def _hyperscan_supports(expression: bytes, flags: int) -> bool:
+        """
+        Check whether Hyperscan can compile a single expression with flags.
+
+        Args:
+            expression: UTF-8 encoded pattern
+            flags: Hyperscan compile flags
+
+        Returns:
+            True if the expression compiles
+        """
+        try:
+            hyperscan.Database().compile(expressions=[expression], ids=[0], elements=1, flags=[flags])
+            return True
+        except Exception:
+            return False
+
+    def _scan_patterns(self, group: str, text: str) -> Optional[Dict[int, List[Tuple[int, int]]]]:
+        """
+        Scan text once for every pattern of a group.
+
+        Args:
+            group: Pattern group name ('remove', 'transform' or 'chapters')
+            text: Text to scan
+
+        Returns:
+            Mapping of pattern index to (start, end) character spans. Patterns
+            missing from the mapping cannot match. Spans are only meaningful for
+            exactly matched patterns. None means every pattern must run.
+        """
+        hs_group = self.compiled_patterns.get('hyperscan', {}).get(group)
+        if hs_group is None:
+            return None
+
+        data = text.encode('utf-8')
+        hits: Dict[int, List[Tuple[int, int]]] = {}
+
+        def on_match(pattern_id, start, end, flags, context):
+            hits.setdefault(pattern_id, []).append((start, end))
+
+        try:
+            hs_group['database'].scan(
+                data,
+                match_event_handler=on_match,
+                scratch=self._hyperscan_scratch.get(group)
+            )
+            if len(data) != len(text):
+                hits = self._hits_to_char_offsets(data, hits, hs_group['exact'])
+        except Exception as e:
+            logger.debug(f"Hyperscan scan failed for {group} patterns: {e}")
+            return None
+
+        return hits
+
+    @staticmethod
+    def _hits_to_char_offsets(
+        data: bytes,
+        hits: Dict[int, List[Tuple[int, int]]],
+        exact_ids: set
+    ) -> Dict[int, List[Tuple[int, int]]]:
+        """
+        Convert UTF-8 byte offsets reported by Hyperscan to str offsets.
+
+        Args:
+            data: UTF-8 encoded text that was scanned
+            hits: Byte spans per pattern index
+            exact_ids: Pattern indexes whose spans are used
+
+        Returns:
+            Hits with character spans for exactly matched patterns
+        """
+        offsets = sorted({
+            offset
+            for pattern_id, spans in hits.items() if pattern_id in exact_ids
+            for span in spans
+            for offset in span
+        })
+
+        char_offsets = {}
+        char_pos = 0
+        previous = 0
+        for offset in offsets:
+            char_pos += len(data[previous:offset].decode('utf-8'))
+            char_offsets[offset] = char_pos
+            previous = offset
+
+        return {
+            pattern_id: (
+                [(char_offsets[start], char_offsets[end]) for start, end in spans]
+                if pattern_id in exact_ids else spans
+            )
+            for pattern_id, spans in hits.items()
+        }
+
+    @staticmethod
+    def _substitute_at_hits(
+        regex, replacement: str, text: str, spans: List[Tuple[int, int]]
+    ) -> Tuple[str, int]:
+        """
+        Apply a substitution, starting regex searches only where matches exist.
+
+        Hyperscan reports the leftmost start for every match end, so no match
+        can start before the smallest reported start among spans ending after
+        the current position. Each search begins there, which keeps the regex
+        engine's own leftmost-first match selection while skipping the text
+        in between.
+
+        Args:
+            regex: Compiled pattern
+            replacement: Replacement template
+            text: Text to process
+            spans: (start, end) character spans reported for this pattern
+
+        Returns:
+            Tuple of (text with the substitution applied, substitutions made)
+        """
+        spans = sorted(spans, key=lambda span: span[1])
+
+        # Smallest start among the spans from each index onwards
+        suffix_min_start = [0] * len(spans)
+        running = len(text)
+        for index in range(len(spans) - 1, -1, -1):
+            running = min(running, spans[index][0])
+            suffix_min_start[index] = running
+
+        pieces = []
+        pos = 0
+        index = 0
+        while True:
+            while index < len(spans) and spans[index][1] <= pos:
+                index += 1
+            if index == len(spans):
+                break
+
+            match = regex.search(text, max(pos, suffix_min_start[index]))
+            if match is None:
+                break
+            if match.end() == match.start():
+                # Empty matches follow special rules in sub(); let the regex engine handle them
+                return regex.subn(replacement, text)
+
+            pieces.append(text[pos:match.start()])
+            pieces.append(match.expand(replacement))
+            pos = match.end()
+
+        if not pieces:
+            return text, 0
+
+        count = len(pieces) // 2
+        pieces.append(text[pos:])
+        return ''.join(pieces), count
+
+    def _apply_pattern(
+        self,
+        group: str,
+        index: int,
+        pattern_config: Dict[str, Any],
+        text: str,
+        hits: Optional[Dict[int, List[Tuple[int, int]]]]
+    ) -> Tuple[str, int]:
+        """
+        Apply one compiled pattern, using Hyperscan hits when available.
+
+        Args:
+            group: Pattern group name
+            index: Pattern index within the group
+            pattern_config: Compiled pattern configuration
+            text: Text to process
+            hits: Result of _scan_patterns for the current text
+
+        Returns:
+            Tuple of (text with the pattern applied, substitutions made)
+        """
+        # The RE2 wrapper re-encodes the whole text on every search, so RE2
+        # rules substitute in one call rather than searching hit by hit
+        if (hits is not None and pattern_config['engine'] == 'regex'
+                and index in self.compiled_patterns['hyperscan'][group]['exact']):
+            return self._substitute_at_hits(
+                pattern_config['regex'], pattern_config['replacement'], text, hits[index]
+            )
+        return pattern_config['regex'].subn(pattern_config['replacement'], text)
+
     def _apply_removal_patterns(self, text: str) -> str:
         """
         Apply removal patterns to text.
@@ -188,14 +754,29 @@ class TextCleaner:
         if 'remove' not in self.compiled_patterns:
             return text
 
-        for pattern_config in self.compiled_patterns['remove']:
+        hits = self._scan_patterns('remove', text)
+        hits_stale = False
+
+        for index, pattern_config in enumerate(self.compiled_patterns['remove']):
+            if hits_stale:
+                # Offsets shift and replacements can create new matches
+                hits = self._scan_patterns('remove', text)
+                hits_stale = False
+
+            if hits is not None:
+                if index not in hits:
+                    continue
+            elif pattern_config['anchor'] not in text:
+                # Without Hyperscan, a missing literal prefix rules out a match
+                continue
+
             try:
-                old_text = text
-                text = pattern_config['regex'].sub(pattern_config['replacement'], text)
+                text, count = self._apply_pattern('remove', index, pattern_config, text, hits)
 
-                if text != old_text:
+                if count:
                     self.stats.patterns_applied += 1
                     logger.debug(f"Applied removal pattern: {pattern_config['name']}")
+                    hits_stale = hits is not None
 
             except Exception as e:
                 self.stats.errors_encountered += 1
@@ -216,15 +797,30 @@ class TextCleaner:
         if 'transform' not in self.compiled_patterns:
             return text
 
-        for pattern_config in self.compiled_patterns['transform']:
+        hits = self._scan_patterns('transform', text)
+        hits_stale = False
+
+        for index, pattern_config in enumerate(self.compiled_patterns['transform']):
+            if hits_stale:
+                # Offsets shift and replacements can create new matches
+                hits = self._scan_patterns('transform', text)
+                hits_stale = False
+
+            if hits is not None:
+                if index not in hits:
+                    continue
+            elif pattern_config['anchor'] not in text:
+                # Without Hyperscan, a missing literal prefix rules out a match
+                continue
+
             try:
-                old_text = text
-                text = pattern_config['regex'].sub(pattern_config['replacement'], text)
+                text, count = self._apply_pattern('transform', index, pattern_config, text, hits)
 
-                if text != old_text:
+                if count:
                     self.stats.transformations_made += 1
                     self.stats.patterns_applied += 1
                     logger.debug(f"Applied transformation: {pattern_config['name']}")
+                    hits_stale = hits is not None
 
             except Exception as e:
                 self.stats.errors_encountered += 1
@@ -232,6 +828,111 @@ class TextCleaner:
 
         return text
 
+    @staticmethod
+    def _compile_tts_replacements(replacements: Dict[str, str]) -> Tuple[Tuple[Any, ...], ...]:
+        """
+        Turn TTS replacements into an ordered sequence of rewrite steps.
+
+        Consecutive single-character keys are folded into one str.translate
+        table. Each table entry is the result of running that character
+        through the original replacements in order, so chained replacements
+        behave exactly as before. Multi-character keys remain str.replace
+        steps in their original position, and consecutive ones are fused
+        into a single Aho-Corasick automaton when that cannot change the
+        result (see _automaton_step).
+
+        Args:
+            replacements: Mapping of text to its TTS-friendly replacement
+
+        Returns:
+            Tuple of ('translate', table, keys), ('automaton', automaton, keys)
+            and ('replace', key, value) steps
+        """
+        steps = []
+        run: List[Tuple[str, str]] = []
+
+        def translate_step(run: List[Tuple[str, str]]) -> Optional[Tuple[Any, ...]]:
+            table = {}
+            for char, _ in run:
+                result = char
+                for key, value in run:
+                    result = result.replace(key, value)
+                if result != char:
+                    table[ord(char)] = result
+            if not table:
+                return None
+            return ('translate', table, ''.join(key for key, _ in run))
+
+        for key, value in replacements.items():
+            if len(key) == 1:
+                run.append((key, value))
+                continue
+            if run:
+                steps.append(translate_step(run))
+                run = []
+            steps.append(('replace', key, value))
+        if run:
+            steps.append(translate_step(run))
+
+        fused = []
+        replace_run: List[Tuple[str, str]] = []
+        for step in steps:
+            if step is not None and step[0] == 'replace':
+                replace_run.append(step[1:])
+                continue
+            fused.extend(TextCleaner._automaton_step(replace_run))
+            replace_run = []
+            if step is not None:
+                fused.append(step)
+        fused.extend(TextCleaner._automaton_step(replace_run))
+
+        return tuple(fused)
+
+    @staticmethod
+    def _automaton_step(run: List[Tuple[str, str]]) -> List[Tuple[Any, ...]]:
+        """
+        Fuse consecutive multi-character replacements into one automaton.
+
+        A single leftmost, non-overlapping scan gives the same result as the
+        sequential str.replace calls as long as no two keys can overlap and
+        every replacement value is non-empty and free of key characters, so
+        no earlier replacement can create or destroy a match for a later one. Runs that
+        do not meet this, are shorter than AUTOMATON_MIN_KEYS, or when
+        pyahocorasick is unavailable, are left as individual replace steps.
+
+        Args:
+            run: Consecutive (key, value) pairs with multi-character keys
+
+        Returns:
+            List with one ('automaton', automaton, keys) step, or the
+            original ('replace', key, value) steps
+        """
+        replace_steps = [('replace', key, value) for key, value in run]
+        if not AHOCORASICK_AVAILABLE or len(run) < AUTOMATON_MIN_KEYS:
+            return replace_steps
+
+        keys = [key for key, _ in run]
+        key_chars = set(''.join(keys))
+        if any(not value or key_chars.intersection(value) for _, value in run):
+            return replace_steps
+
+        for first in keys:
+            for second in keys:
+                if first != second and second in first:
+                    return replace_steps
+                # A suffix of one key that is a prefix of another lets two
+                # matches overlap (self-overlap is resolved like str.replace)
+                if first != second and any(
+                    first.endswith(second[:size]) for size in range(1, min(len(first), len(second)))
+                ):
+                    return replace_steps
+
+        automaton = ahocorasick.Automaton()
+        for key, value in run:
+            automaton.add_word(key, (len(key), value))
+        automaton.make_automaton()
+        return [('automaton', automaton, tuple(keys))]
+
     def _apply_tts_replacements(self, text: str) -> str:
         """
         Apply TTS-friendly character replacements.
@@ -242,15 +943,32 @@ class TextCleaner:
         Returns:
             Text with TTS replacements
         """
-        if 'cleaning_rules' not in self.rules or 'tts_replacements' not in self.rules['cleaning_rules']:
+        steps = self.compiled_patterns.get('tts_replacements')
+        if not steps:
             return text
 
-        replacements = self.rules['cleaning_rules']['tts_replacements']
-
-        for char, replacement in replacements.items():
-            if char in text:
-                text = text.replace(char, replacement)
-                logger.debug(f"Replaced '{char}' with '{replacement}'")
+        for step in steps:
+            if step[0] == 'translate':
+                _, table, keys = step
+                text = text.translate(table)
+                logger.debug(f"Translated TTS characters: {keys!r}")
+            elif step[0] == 'automaton':
+                _, automaton, keys = step
+                parts = []
+                position = 0
+                for end, (length, replacement) in automaton.iter_long(text):
+                    parts.append(text[position:end - length + 1])
+                    parts.append(replacement)
+                    position = end + 1
+                if parts:
+                    parts.append(text[position:])
+                    text = ''.join(parts)
+                    logger.debug(f"Replaced TTS sequences: {keys!r}")
+            else:
+                _, key, replacement = step
+                if key in text:
+                    text = text.replace(key, replacement)
+                    logger.debug(f"Replaced '{key}' with '{replacement}'")
 
         return text
 
@@ -258,24 +976,18 @@ class TextCleaner:
         """
         Normalize whitespace in text.
 
+        Collapses space runs and blank-line runs and strips spaces and tabs
+        from both ends of every line, all in a single regex pass.
+
         Args:
             text: Text to normalize
 
         Returns:
             Text with normalized whitespace
         """
-        # Replace multiple spaces with single space
-        text = re.sub(r' {2,}', ' ', text)
-
-        # Replace multiple newlines with double newline (paragraph break)
-        text = re.sub(r'\n{3,}', '\n\n', text)
-
-        # Remove trailing whitespace from lines
-        text = re.sub(r'[ \t]+$', '', text, flags=re.MULTILINE)
-
-        # Remove leading whitespace from lines (except intended indentation)
-        text = re.sub(r'^[ \t]+', '', text, flags=re.MULTILINE)
-
+        text = WHITESPACE_PATTERN.sub(
+            lambda match: WHITESPACE_REPLACEMENTS[match.lastgroup], text
+        )
         return text.strip()
 
     def add_pause_markers(self, text: str) -> str:
@@ -290,6 +1002,9 @@ class TextCleaner:
         - After sentences ending with "!": [PAUSE: 0.2]
         - After dialogue: [PAUSE: 0.3]
 
+        Literal markers are rewritten with str.replace, and rules whose
+        trigger character does not occur in the text are skipped.
+
         Args:
             text: Text to process
 
@@ -301,69 +1016,31 @@ class TextCleaner:
 
         pause_rules = self.rules['pause_rules']
 
-        # Chapter start pauses
-        chapter_pause = pause_rules.get('chapter_start', 2.0)
-        text = re.sub(
-            r'\[CHAPTER_START: ([^\]]+)\]',
-            rf'[CHAPTER_START: \1][PAUSE: {chapter_pause}]',
-            text
-        )
-
-        # Question pauses
-        question_pause = pause_rules.get('question_end', 0.3)
-        text = re.sub(
-            r'\?(\s+)',
-            rf'?[PAUSE: {question_pause}]\1',
-            text
-        )
+        def pause(rule: str) -> str:
+            return f"[PAUSE: {pause_rules.get(rule, DEFAULT_PAUSES[rule])}]"
 
-        # Exclamation pauses
-        exclamation_pause = pause_rules.get('exclamation_end', 0.2)
-        text = re.sub(
-            r'!(\s+)',
-            rf'![PAUSE: {exclamation_pause}]\1',
-            text
-        )
-
-        # Dialogue pauses
-        dialogue_pause = pause_rules.get('dialogue_end', 0.3)
-        text = re.sub(
-            r'\[DIALOGUE_END\]',
-            rf'[DIALOGUE_END][PAUSE: {dialogue_pause}]',
-            text
-        )
+        # Chapter start pauses
+        if '[CHAPTER_START: ' in text:
+            text = CHAPTER_START_PATTERN.sub(
+                rf'[CHAPTER_START: \1]{pause("chapter_start")}', text
+            )
 
-        # Header end pauses
-        header_pause = pause_rules.get('header_end', 1.0)
-        text = re.sub(
-            r'\[HEADER_END\]',
-            rf'[PAUSE: {header_pause}]',
-            text
-        )
+        # Question and exclamation pauses
+        for rule, char, pattern in PUNCTUATION_PAUSE_PATTERNS:
+            if char in text:
+                text = pattern.sub(rf'{char}{pause(rule)}\1', text)
 
-        # Comma pauses
-        comma_pause = pause_rules.get('comma_pause', 0.5)
-        text = re.sub(
-            r',(\s+)',
-            rf',[PAUSE: {comma_pause}]\1',
-            text
-        )
+        # Dialogue and header end pauses
+        text = text.replace('[DIALOGUE_END]', '[DIALOGUE_END]' + pause('dialogue_end'))
+        text = text.replace('[HEADER_END]', pause('header_end'))
 
-        # Sentence end pauses (periods)
-        sentence_pause = pause_rules.get('sentence_end', 0.5)
-        text = re.sub(
-            r'\.(\s+)',
-            rf'.[PAUSE: {sentence_pause}]\1',
-            text
-        )
+        # Comma and sentence end pauses
+        for rule, char, pattern in CLAUSE_PAUSE_PATTERNS:
+            if char in text:
+                text = pattern.sub(rf'{char}{pause(rule)}\1', text)
 
         # Paragraph pauses (double newlines)
-        paragraph_pause = pause_rules.get('paragraph_end', 0.5)
-        text = re.sub(
-            r'\n\n',
-            rf'\n[PAUSE: {paragraph_pause}]\n',
-            text
-        )
+        text = text.replace('\n\n', f"\n{pause('paragraph_end')}\n")
 
         return text
 
@@ -429,9 +1106,16 @@ class TextCleaner:
         if 'chapters' not in self.compiled_patterns:
             return chapters
 
+        # One Hyperscan pass shows which patterns can match, so the book is
+        # only searched with those instead of with every pattern in turn
+        hits = self._scan_patterns('chapters', text)
+
         # Try each chapter detection pattern
-        for pattern in self.compiled_patterns['chapters']:
-            matches = list(pattern.finditer(text))
+        for index, pattern_config in enumerate(self.compiled_patterns['chapters']):
+            if hits is not None and index not in hits:
+                continue
+
+            matches = list(pattern_config['regex'].finditer(text))
 
             if matches:
                 logger.info(f"Found {len(matches)} chapters using pattern detection")
@@ -469,7 +1153,7 @@ class TextCleaner:
         Returns:
             Chapter object with metadata
         """
-        word_count = len(content.split())
+        word_count = count_words(content)
 
         # Estimate reading duration (200 words per minute average)
         estimated_duration = word_count / 200.0
@@ -519,4 +1203,46 @@ class TextCleaner:
         except Exception as e:
             errors.append(f"General pattern compilation error: {e}")
 
-        return errors
\ No newline at end of file
+        return errors
+
+
+def count_words(text: str) -> int:
+    """
+    Count whitespace-separated words, exactly as len(text.split()) would.
+
+    Long texts are counted as word starts in a vectorized whitespace mask,
+    which avoids building a list with one string object per word.
+
+    Args:
+        text: Text to count
+
+    Returns:
+        Number of words
+    """
+    if len(text) < VECTOR_WORD_COUNT_MIN_CHARS:
+        return len(text.split())
+
+    if text.isascii():
+        is_space = ASCII_WHITESPACE[np.frombuffer(text.encode('ascii'), dtype=np.uint8)]
+    else:
+        codepoints = np.frombuffer(text.encode('utf-32-le'), dtype='<u4')
+        is_space = WHITESPACE_TABLE[np.minimum(codepoints, len(WHITESPACE_TABLE) - 1)]
+
+    # A word starts at every non-space character preceded by a space (or at index 0)
+    starts = np.count_nonzero(is_space[:-1] & ~is_space[1:])
+    return int(starts) + (0 if is_space[0] else 1)
+
+
+# Cleaner owned by each worker process of parallel_cleaning
+_worker_cleaner: Optional[TextCleaner] = None
+
+
+def _init_cleaning_worker(rules_path: Optional[Path]) -> None:
+    """Build the per-process cleaner once when a worker starts."""
+    global _worker_cleaner
+    _worker_cleaner = TextCleaner(rules_path)
+
+
+def _clean_in_worker(text: str) -> Tuple[str, CleaningStats]:
+    """Clean one text in a worker process and return it with its stats."""
+    return _worker_cleaner.clean_text_with_stats(text)
@@ -5,25 +5,30 @@ This module provides integration with ElevenLabs API for high-quality text-to-sp
 synthesis as an alternative to the Kokoro TTS pipeline.
 """
 
+import hashlib
 import logging
+import os
 import time
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Callable, Dict, Iterable, List, Optional, Any, Set, Tuple, Union
 from dataclasses import dataclass
-import numpy as np
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from tqdm import tqdm
 
 # Import ElevenLabs client
 try:
     from elevenlabs.client import ElevenLabs
     from elevenlabs import VoiceSettings
+    from elevenlabs.core.api_error import ApiError
     ELEVENLABS_AVAILABLE = True
 except ImportError:
     ELEVENLABS_AVAILABLE = False
 
+from utils.audio_cache import AudioCache, DEFAULT_CACHE_ROOT
+from utils.audio_files import concatenate_mp3_files
+from utils.rate_limiter import AdaptiveConcurrencyLimiter, backoff_delay, retry_after_seconds
 from utils.config import TTSConfig
+from utils.http_client import HTTP_TIMEOUT, create_http_client
 from utils.secrets import get_elevenlabs_api_key
 from utils.logger import PerformanceLogger, ProgressLogger
 from ui.progress_tracker import (
@@ -33,6 +38,182 @@ from ui.progress_tracker import (
 
 logger = logging.getLogger(__name__)
 
+# Write buffer for streaming audio to disk
+AUDIO_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# How API errors are handled, by the status in the error body and by HTTP
+# status code. Anything not listed is retried with backoff.
+API_ERROR_DETAIL_KINDS = {
+    'quota_exceeded': 'quota',
+    'voice_not_found': 'voice_not_found',
+    'invalid_api_key': 'auth',
+    'too_many_concurrent_requests': 'rate_limit',
+    'system_busy': 'rate_limit',
+}
+API_ERROR_STATUS_KINDS = {
+    401: 'auth',
+    402: 'quota',
+    403: 'auth',
+    429: 'rate_limit',
+    503: 'rate_limit',
+}
+
+# Speech rate used to estimate audio duration from text length
+ESTIMATED_CHARACTERS_PER_MINUTE = 150
+
+# How long voice lookups are reused before asking the API again (seconds)
+VOICE_CACHE_TTL = 300.0
+
+# Text processing markers, matched in a single pass. Pauses and emphasis map
+# to SSML (supported by ElevenLabs), the rest to plain narration.
+MARKER_PATTERN = re.compile(
+    r'\[(?:'
+    r'PAUSE: (?P<pause>[\d.]+)'
+    r'|EMPHASIS_STRONG: (?P<strong>[^\]]+)'
+    r'|EMPHASIS_MILD: (?P<mild>[^\]]+)'
+    r'|DIALOGUE_(?:START|END)'
+    r'|CHAPTER_START: (?P<chapter>[^\]]+)'
+    r'|IMAGE: (?P<image>[^\]]+)'
+    r')\]'
+)
+MARKER_TEMPLATES = {
+    'pause': '<break time="{}s"/>',
+    'strong': '<emphasis level="strong">{}</emphasis>',
+    'mild': '<emphasis level="moderate">{}</emphasis>',
+    'chapter': 'Chapter: {}. ',
+    'image': 'Image description: {}. ',
+}
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# Abbreviations whose full stop does not end a sentence. Splitting after
+# them would start a chunk mid-sentence, e.g. "Mr." | "Smith".
+SENTENCE_ABBREVIATIONS = (
+    'Mr', 'Mrs', 'Ms', 'Dr', 'Prof', 'St', 'Jr', 'Sr', 'Mt',
+    'Capt', 'Col', 'Gen', 'Lt', 'Sgt', 'Rev', 'vs', 'e.g', 'i.e',
+)
+
+# Boundaries for splitting text into API-sized chunks. Besides the
+# abbreviations, single capital initials ("J. R. R. Tolkien") are not
+# treated as sentence ends, except for the pronoun "I".
+SENTENCE_BOUNDARY_PATTERN = re.compile(
+    r'(?<=[.!?])'
+    + ''.join(rf'(?<!\b{re.escape(abbreviation)}\.)' for abbreviation in SENTENCE_ABBREVIATIONS)
+    + r'(?<!\b[A-HJ-Z]\.)\s+'
+)
+CLAUSE_BOUNDARY_PATTERN = re.compile(r'(?<=[,;:])\s+')
+
+
+def render_marker(match: re.Match) -> str:
+    """Get the replacement text for a MARKER_PATTERN match."""
+    group = match.lastgroup
+    if group is None:
+        # Dialogue markers are dropped
+        return ''
+    return MARKER_TEMPLATES[group].format(match.group(group))
+
+
+def classify_api_error(error: Exception) -> str:
+    """
+    Classify a synthesis error to decide how to handle it.
+
+    API errors are classified by the status in the response body and
+    the HTTP status code. Other exceptions fall back to matching the
+    error message.
+
+    Args:
+        error: Exception raised by a synthesis request
+
+    Returns:
+        One of 'rate_limit', 'quota', 'auth', 'voice_not_found' or 'retry'
+    """
+    if isinstance(error, ApiError) and error.status_code is not None:
+        detail = error.body.get('detail') if isinstance(error.body, dict) else None
+        detail_status = detail.get('status') if isinstance(detail, dict) else None
+        if detail_status in API_ERROR_DETAIL_KINDS:
+            return API_ERROR_DETAIL_KINDS[detail_status]
+        return API_ERROR_STATUS_KINDS.get(error.status_code, 'retry')
+
+    error_str = str(error).lower()
+    if "rate limit" in error_str or "429" in error_str:
+        return 'rate_limit'
+    if "quota" in error_str or "insufficient credits" in error_str:
+        return 'quota'
+    if "unauthorized" in error_str or "invalid api key" in error_str:
+        return 'auth'
+    if "voice" in error_str and "not found" in error_str:
+        return 'voice_not_found'
+    return 'retry'
+
+
+def split_text_for_api(text: str, limit: int) -> List[str]:
+    """
+    Split text into chunks of at most limit characters.
+
+    Whole sentences are packed greedily into each chunk. Sentences longer
+    than the limit are broken into smaller pieces first.
+
+    Args:
+        text: Text to split
+        limit: Maximum characters per chunk
+
+    Returns:
+        List of text chunks
+    """
+    chunks = []
+    current_parts: List[str] = []
+    current_len = 0
+
+    for sentence in SENTENCE_BOUNDARY_PATTERN.split(text):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+
+        pieces = _split_long_sentence(sentence, limit) if len(sentence) > limit else (sentence,)
+        for piece in pieces:
+            if current_parts and current_len + 1 + len(piece) > limit:
+                chunks.append(" ".join(current_parts))
+                current_parts = []
+                current_len = 0
+
+            current_len += len(piece) + (1 if current_parts else 0)
+            current_parts.append(piece)
+
+    if current_parts:
+        chunks.append(" ".join(current_parts))
+
+    return chunks
+
+
+def _split_long_sentence(sentence: str, limit: int) -> List[str]:
+    """
+    Break a sentence that exceeds the chunk limit into pieces.
+
+    Pieces end at clause punctuation (, ; :) where possible so that the
+    seams between separately synthesized chunks fall on natural pauses,
+    then at word boundaries. Words longer than the limit are cut.
+
+    Args:
+        sentence: Sentence longer than limit
+        limit: Maximum characters per piece
+
+    Returns:
+        List of pieces, each within limit
+    """
+    pieces = []
+
+    for clause in CLAUSE_BOUNDARY_PATTERN.split(sentence):
+        if len(clause) <= limit:
+            pieces.append(clause)
+            continue
+
+        for word in clause.split():
+            if len(word) <= limit:
+                pieces.append(word)
+            else:
+                pieces.extend(word[i:i + limit] for i in range(0, len(word), limit))
+
+    return pieces
+
 
 @dataclass
 class ElevenLabsResult:
@@ -45,6 +226,7 @@ class ElevenLabsResult:
     error_message: Optional[str] = None
     processing_time: float = 0.0
     voice_id: Optional[str] = None
+    cache_hit: bool = False
 
 
 class ElevenLabsTTSPipeline:
@@ -52,6 +234,12 @@ class ElevenLabsTTSPipeline:
     TTS pipeline using ElevenLabs API for high-quality speech synthesis.
     """
 
+    # Voice IDs confirmed to exist during this process
+    _validated_voices: Set[str] = set()
+
+    # Voice lookups shared by all pipelines: (kind, key) -> (fetched at, response)
+    _voice_cache: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+
     def __init__(self, config: TTSConfig, progress_tracker: Optional[ProgressTracker] = None):
         """
         Initialize ElevenLabs TTS pipeline.
@@ -69,6 +257,8 @@ class ElevenLabsTTSPipeline:
         self.config = config
         self.progress_tracker = progress_tracker
         self.client = None
+        self.http_client = None
+        self.account_key = ""
         self.is_initialized = False
 
         # ElevenLabs specific settings
@@ -78,8 +268,21 @@ class ElevenLabsTTSPipeline:
         self.similarity_boost = getattr(config, 'elevenlabs_similarity_boost', 0.75)
         self.style = getattr(config, 'elevenlabs_style', 0.0)
         self.max_chunk_chars = getattr(config, 'elevenlabs_max_chunk_chars', 2500)
+        self.optimize_streaming_latency = getattr(config, 'elevenlabs_optimize_streaming_latency', 2)
+        self.output_format = getattr(config, 'elevenlabs_output_format', 'mp3_44100_128')
+        self.max_concurrency = max(1, getattr(config, 'elevenlabs_max_concurrency', 3))
+        self.reencode_merge = getattr(config, 'elevenlabs_reencode_merge', False)
+        self.validate_voice = getattr(config, 'elevenlabs_validate_voice', False)
         self.max_retries = 3
         self.retry_delay = 1.0  # Base delay for exponential backoff
+        self.rate_limiter = AdaptiveConcurrencyLimiter(self.max_concurrency)
+        self._voice_settings = VoiceSettings(
+            stability=self.stability,
+            similarity_boost=self.similarity_boost,
+            style=self.style,
+            use_speaker_boost=True
+        )
+        self.cache = self._create_cache()
 
         logger.info(f"Initializing ElevenLabs TTS pipeline with voice: {self.voice_id}")
         self._initialize_client()
@@ -94,15 +297,23 @@ class ElevenLabsTTSPipeline:
                     "or set ELEVENLABS_API_KEY environment variable."
                 )
 
-            self.client = ElevenLabs(api_key=api_key)
+            # Identifies the account in shared caches without keeping the key
+            self.account_key = hashlib.blake2b(api_key.encode('utf-8'), digest_size=8).hexdigest()
 
-            # Test the connection by getting voice info
-            try:
-                voice = self.client.voices.get(self.voice_id)
-                logger.info(f"Connected to ElevenLabs API. Using voice: {voice.name}")
-            except Exception as e:
-                logger.warning(f"Could not verify voice {self.voice_id}: {e}")
-                # Continue anyway - voice validation will happen during synthesis
+            self.http_client = create_http_client()
+            self.client = ElevenLabs(api_key=api_key, httpx_client=self.http_client, timeout=HTTP_TIMEOUT)
+
+            # Optionally test the connection by getting voice info. This costs
+            # a round trip, so each voice is only checked once per process;
+            # otherwise an invalid voice surfaces on the first synthesis.
+            if self.validate_voice and self.voice_id not in self._validated_voices:
+                try:
+                    voice = self.client.voices.get(self.voice_id)
+                    self._validated_voices.add(self.voice_id)
+                    logger.info(f"Connected to ElevenLabs API. Using voice: {voice.name}")
+                except Exception as e:
+                    logger.warning(f"Could not verify voice {self.voice_id}: {e}")
+                    # Continue anyway - voice validation will happen during synthesis
 
             self.is_initialized = True
             logger.info("ElevenLabs TTS pipeline initialized successfully")
@@ -111,7 +322,76 @@ class ElevenLabsTTSPipeline:
             logger.error(f"Failed to initialize ElevenLabs client: {e}")
             raise RuntimeError(f"Cannot initialize ElevenLabs TTS: {e}")
 
-    def process_chunk(self, text: str, output_path: str, chunk_id: str = "") -> ElevenLabsResult:
+    def _create_cache(self) -> Optional[AudioCache]:
+        """Create the synthesized audio cache, if enabled."""
+        if not getattr(self.config, 'elevenlabs_cache_enabled', True):
+            return None
+
+        cache_dir = getattr(self.config, 'elevenlabs_cache_dir', None) or f"{DEFAULT_CACHE_ROOT}/elevenlabs"
+        max_mb = getattr(self.config, 'elevenlabs_cache_max_mb', None)
+        try:
+            return AudioCache(cache_dir, max_bytes=max_mb * 1024 * 1024 if max_mb else None)
+        except OSError as e:
+            logger.warning(f"ElevenLabs audio cache disabled, cannot use {cache_dir}: {e}")
+            return None
+
+    def _cache_key(self, text: str) -> str:
+        """Build the audio cache key for text with the current voice settings."""
+        return AudioCache.make_key(
+            text,
+            voice_id=self.voice_id,
+            model_id=self.model_id,
+            stability=self.stability,
+            similarity_boost=self.similarity_boost,
+            style=self.style,
+            use_speaker_boost=True,
+            output_format=self.output_format,
+            optimize_streaming_latency=self.optimize_streaming_latency
+        )
+
+    def _synthesize_cached(self, text: str, output_path: Path) -> bool:
+        """
+        Synthesize text to a file, reusing cached audio for identical requests.
+
+        Args:
+            text: Preprocessed text to synthesize
+            output_path: Audio file to write
+
+        Returns:
+            True if the audio came from the cache
+        """
+        if self.cache is None:
+            self._synthesize_with_retry(text, output_path)
+            return False
+
+        key = self._cache_key(text)
+        if self.cache.copy_to(key, output_path):
+            return True
+
+        self._synthesize_with_retry(text, output_path)
+        try:
+            self.cache.put_file(key, output_path)
+        except OSError as e:
+            logger.warning(f"Could not cache ElevenLabs audio: {e}")
+        return False
+
+    def close(self) -> None:
+        """Close pooled HTTP connections and the audio cache index."""
+        if self.http_client is not None:
+            self.http_client.close()
+            self.http_client = None
+        if self.cache is not None:
+            self.cache.close()
+        self.client = None
+        self.is_initialized = False
+
+    def process_chunk(
+        self,
+        text: str,
+        output_path: str,
+        chunk_id: str = "",
+        preprocessed: bool = False
+    ) -> ElevenLabsResult:
         """
         Process a single text chunk through ElevenLabs TTS.
 
@@ -119,6 +399,7 @@ class ElevenLabsTTSPipeline:
             text: Text to convert to speech
             output_path: Path for output audio file
             chunk_id: Optional identifier for this chunk
+            preprocessed: Whether text has already been through _preprocess_text
 
         Returns:
             ElevenLabsResult with processing information
@@ -129,7 +410,7 @@ class ElevenLabsTTSPipeline:
                 error_message="ElevenLabs client not initialized"
             )
 
-        start_time = time.time()
+        start_time = time.monotonic()
 
         # Emit start event
         if self.progress_tracker:
@@ -141,8 +422,8 @@ class ElevenLabsTTSPipeline:
 
         try:
             with PerformanceLogger(f"ElevenLabs TTS chunk processing: {chunk_id}"):
-                # Preprocess text for TTS
-                processed_text = self._preprocess_text(text)
+                # Preprocess text for TTS, unless the caller already did
+                processed_text = text if preprocessed else self._preprocess_text(text)
 
                 if not processed_text.strip():
                     logger.warning(f"Empty text after preprocessing: {chunk_id}")
@@ -156,22 +437,15 @@ class ElevenLabsTTSPipeline:
                     logger.info(f"Text too long ({len(processed_text)} chars), chunking for {chunk_id}")
                     return self._process_long_text(processed_text, output_path, chunk_id)
 
-                # Generate audio using ElevenLabs API
-                audio_data = self._synthesize_with_retry(processed_text)
-
-                # Save audio file
                 output_path = Path(output_path)
                 output_path.parent.mkdir(parents=True, exist_ok=True)
 
-                # ElevenLabs returns audio data directly
-                with open(output_path, 'wb') as f:
-                    f.write(audio_data)
-
-                # Calculate duration (approximate based on characters and speech rate)
-                # Rough estimate: ~150 characters per minute for average speech
-                estimated_duration = len(processed_text) / 150 * 60
+                # Generate audio using ElevenLabs API, unless already cached,
+                # streaming it straight into the output file
+                cache_hit = self._synthesize_cached(processed_text, output_path)
 
-                processing_time = time.time() - start_time
+                estimated_duration = self._estimate_duration(len(processed_text))
+                processing_time = time.monotonic() - start_time
 
                 logger.debug(
                     f"ElevenLabs TTS chunk completed: {chunk_id} "
@@ -195,7 +469,8 @@ class ElevenLabsTTSPipeline:
                     characters_processed=len(processed_text),
                     text_processed=processed_text,
                     processing_time=processing_time,
-                    voice_id=self.voice_id
+                    voice_id=self.voice_id,
+                    cache_hit=cache_hit
                 )
 
         except Exception as e:
@@ -213,78 +488,108 @@ class ElevenLabsTTSPipeline:
             return ElevenLabsResult(
                 success=False,
                 error_message=error_msg,
-                processing_time=time.time() - start_time
+                processing_time=time.monotonic() - start_time
             )
 
-    def _synthesize_with_retry(self, text: str) -> bytes:
+    def _synthesize_with_retry(self, text: str, output_path: Path) -> None:
         """
         Synthesize text with retry logic for rate limiting and API errors.
 
+        Audio is written to disk as it arrives instead of being buffered in
+        memory. It goes to a .partial sibling that is renamed into place once
+        complete, so a failed attempt never leaves a truncated output file.
+
         Args:
             text: Text to synthesize
-
-        Returns:
-            Audio data as bytes
+            output_path: Audio file to write
 
         Raises:
             Exception: If all retry attempts fail
         """
         for attempt in range(self.max_retries + 1):
             try:
-                # Use ElevenLabs text_to_speech.convert method with voice settings
-                audio_data = self.client.text_to_speech.convert(
-                    voice_id=self.voice_id,
-                    text=text,
-                    model_id=self.model_id,
-                    voice_settings=VoiceSettings(
-                        stability=self.stability,
-                        similarity_boost=self.similarity_boost,
-                        style=self.style,
-                        use_speaker_boost=True
+                # The slot is held until the response body is fully read, since
+                # the request counts against the concurrency limit while audio
+                # streams in
+                with self.rate_limiter.slot() as generation:
+                    # Use ElevenLabs text_to_speech.convert method with voice settings
+                    audio_stream = self.client.text_to_speech.convert(
+                        voice_id=self.voice_id,
+                        text=text,
+                        model_id=self.model_id,
+                        output_format=self.output_format,
+                        optimize_streaming_latency=self.optimize_streaming_latency,
+                        voice_settings=self._voice_settings
                     )
-                )
 
-                # Convert generator to bytes if needed
-                if hasattr(audio_data, '__iter__') and not isinstance(audio_data, bytes):
-                    audio_bytes = b''.join(audio_data)
-                else:
-                    audio_bytes = audio_data
+                    # The SDK yields the response body in chunks as it streams in
+                    if isinstance(audio_stream, bytes):
+                        audio_stream = [audio_stream]
+                    self._write_audio_stream(audio_stream, output_path)
 
-                return audio_bytes
+                self.rate_limiter.on_success()
+                return
 
             except Exception as e:
-                error_str = str(e).lower()
+                error_kind = classify_api_error(e)
 
                 # Handle rate limiting
-                if "rate limit" in error_str or "429" in error_str:
-                    delay = self.retry_delay * (2 ** attempt)
-                    logger.warning(f"Rate limit hit, waiting {delay}s before retry {attempt + 1}")
+                if error_kind == 'rate_limit':
+                    self.rate_limiter.on_rate_limited(generation)
+                    if attempt == self.max_retries:
+                        raise RuntimeError(
+                            f"ElevenLabs synthesis failed after {self.max_retries + 1} attempts: {e}"
+                        ) from e
+                    # Wait as long as the server asks, if it says
+                    delay = retry_after_seconds(getattr(e, 'headers', None))
+                    if delay is None:
+                        delay = backoff_delay(attempt, self.retry_delay)
+                    logger.warning(f"Rate limit hit, waiting {delay:.1f}s before retry {attempt + 1}")
                     time.sleep(delay)
                     continue
 
                 # Handle quota exceeded
-                elif "quota" in error_str or "insufficient credits" in error_str:
-                    raise RuntimeError(f"ElevenLabs quota exceeded: {e}")
+                elif error_kind == 'quota':
+                    raise RuntimeError(f"ElevenLabs quota exceeded: {e}") from e
 
                 # Handle authentication errors
-                elif "unauthorized" in error_str or "invalid api key" in error_str:
-                    raise RuntimeError(f"ElevenLabs authentication failed: {e}")
+                elif error_kind == 'auth':
+                    raise RuntimeError(f"ElevenLabs authentication failed: {e}") from e
 
                 # Handle invalid voice
-                elif "voice" in error_str and "not found" in error_str:
-                    raise RuntimeError(f"Invalid voice ID {self.voice_id}: {e}")
+                elif error_kind == 'voice_not_found':
+                    raise RuntimeError(f"Invalid voice ID {self.voice_id}: {e}") from e
 
                 # Other errors - retry with exponential backoff
                 else:
                     if attempt < self.max_retries:
-                        delay = self.retry_delay * (2 ** attempt)
-                        logger.warning(f"ElevenLabs API error (attempt {attempt + 1}): {e}. Retrying in {delay}s")
+                        delay = backoff_delay(attempt, self.retry_delay)
+                        logger.warning(f"ElevenLabs API error (attempt {attempt + 1}): {e}. Retrying in {delay:.1f}s")
                         time.sleep(delay)
                         continue
                     else:
                         raise
 
-        raise RuntimeError(f"ElevenLabs synthesis failed after {self.max_retries + 1} attempts")
+    @staticmethod
+    def _write_audio_stream(chunks: Iterable[bytes], output_path: Path) -> None:
+        """
+        Write streamed audio chunks to a file atomically.
+
+        Args:
+            chunks: Audio data chunks
+            output_path: Destination file
+        """
+        partial_path = output_path.with_name(output_path.name + '.partial')
+        try:
+            with open(partial_path, 'wb', buffering=AUDIO_WRITE_BUFFER_SIZE) as f:
+                for chunk in chunks:
+                    f.write(chunk)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(partial_path, output_path)
+        except BaseException:
+            partial_path.unlink(missing_ok=True)
+            raise
 
     def _process_long_text(self, text: str, output_path: str, chunk_id: str) -> ElevenLabsResult:
         """
@@ -298,51 +603,56 @@ class ElevenLabsTTSPipeline:
         Returns:
             ElevenLabsResult with merged audio
         """
+        start_time = time.monotonic()
         try:
             # Split text into smaller chunks
             chunks = self._split_text_for_api(text)
             logger.info(f"Split long text into {len(chunks)} chunks for {chunk_id}")
 
-            audio_segments = []
-            total_chars = 0
-            start_time = time.time()
+            output_path = Path(output_path)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Process each chunk
-            for i, chunk_text in enumerate(chunks):
-                if not chunk_text.strip():
-                    continue
+            part_paths = []
+            total_chars = 0
+            cache_hits = 0
 
-                try:
-                    audio_data = self._synthesize_with_retry(chunk_text)
-                    audio_segments.append(audio_data)
-                    total_chars += len(chunk_text)
+            try:
+                # Process each chunk into its own part file
+                for i, chunk_text in enumerate(chunks):
+                    if not chunk_text.strip():
+                        continue
 
-                    # Add small delay between chunks to be respectful of API limits
-                    time.sleep(0.5)
+                    part_path = output_path.with_name(f"{output_path.stem}.part{i:03d}{output_path.suffix}")
+                    try:
+                        # Sub-chunks are cached individually, so a rerun only
+                        # synthesizes the ones that failed before
+                        cache_hit = self._synthesize_cached(chunk_text, part_path)
+                        part_paths.append(part_path)
+                        total_chars += len(chunk_text)
 
-                except Exception as e:
-                    logger.warning(f"Failed to process chunk {i+1}/{len(chunks)} for {chunk_id}: {e}")
-                    # Continue with remaining chunks
-                    continue
+                        if cache_hit:
+                            cache_hits += 1
 
-            if not audio_segments:
-                raise RuntimeError("No audio segments generated successfully")
+                    except Exception as e:
+                        logger.warning(f"Failed to process chunk {i+1}/{len(chunks)} for {chunk_id}: {e}")
+                        # Continue with remaining chunks
+                        continue
 
-            # Merge audio segments
-            merged_audio = b''.join(audio_segments)
+                if not part_paths:
+                    raise RuntimeError("No audio segments generated successfully")
 
-            # Save merged audio
-            output_path = Path(output_path)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+                # Join the parts' MP3 frames, dropping the ID3 tags of all
+                # but the first part
+                concatenate_mp3_files(part_paths, output_path)
 
-            with open(output_path, 'wb') as f:
-                f.write(merged_audio)
+            finally:
+                for part_path in part_paths:
+                    part_path.unlink(missing_ok=True)
 
-            # Calculate estimated duration
-            estimated_duration = total_chars / 150 * 60  # ~150 chars per minute
-            processing_time = time.time() - start_time
+            estimated_duration = self._estimate_duration(total_chars)
+            processing_time = time.monotonic() - start_time
 
-            logger.info(f"Successfully merged {len(audio_segments)} audio segments for {chunk_id}")
+            logger.info(f"Successfully merged {len(part_paths)} audio segments for {chunk_id}")
 
             return ElevenLabsResult(
                 success=True,
@@ -351,7 +661,8 @@ class ElevenLabsTTSPipeline:
                 characters_processed=total_chars,
                 text_processed=text,
                 processing_time=processing_time,
-                voice_id=self.voice_id
+                voice_id=self.voice_id,
+                cache_hit=cache_hits == len(part_paths)
             )
 
         except Exception as e:
@@ -360,9 +671,14 @@ class ElevenLabsTTSPipeline:
             return ElevenLabsResult(
                 success=False,
                 error_message=error_msg,
-                processing_time=time.time() - start_time if 'start_time' in locals() else 0
+                processing_time=time.monotonic() - start_time
             )
 
+    @staticmethod
+    def _estimate_duration(characters: int) -> float:
+        """Estimate the audio duration in seconds for a number of characters."""
+        return characters / ESTIMATED_CHARACTERS_PER_MINUTE * 60
+
     def _split_text_for_api(self, text: str) -> List[str]:
         """
         Split text into chunks suitable for ElevenLabs API.
@@ -373,59 +689,31 @@ class ElevenLabsTTSPipeline:
         Returns:
             List of text chunks
         """
-        chunks = []
-        current_chunk = ""
-
-        # Split by sentences first
-        sentences = re.split(r'(?<=[.!?])\s+', text)
-
-        for sentence in sentences:
-            # If adding this sentence would exceed limit, start new chunk
-            if len(current_chunk) + len(sentence) + 1 > self.max_chunk_chars:
-                if current_chunk:
-                    chunks.append(current_chunk.strip())
-                    current_chunk = sentence
-                else:
-                    # Sentence itself is too long, split by words
-                    words = sentence.split()
-                    temp_chunk = ""
-                    for word in words:
-                        if len(temp_chunk) + len(word) + 1 > self.max_chunk_chars:
-                            if temp_chunk:
-                                chunks.append(temp_chunk.strip())
-                                temp_chunk = word
-                            else:
-                                # Word itself is too long, truncate it
-                                chunks.append(word[:self.max_chunk_chars])
-                        else:
-                            temp_chunk += " " + word if temp_chunk else word
-                    if temp_chunk:
-                        current_chunk = temp_chunk
-            else:
-                current_chunk += " " + sentence if current_chunk else sentence
-
-        # Add final chunk if exists
-        if current_chunk:
-            chunks.append(current_chunk.strip())
-
-        return [chunk for chunk in chunks if chunk.strip()]
+        return split_text_for_api(text, self.max_chunk_chars)
 
     def batch_process(
         self,
         text_chunks: List[Dict[str, str]],
         output_dir: Path,
-        parallel: bool = False  # ElevenLabs API rate limits make parallel risky
+        parallel: bool = True
     ) -> List[ElevenLabsResult]:
         """
         Process multiple text chunks.
 
+        Synthesis time is spent waiting on the API, so chunks are sent
+        concurrently, up to the plan's concurrent request limit
+        (elevenlabs_max_concurrency). Requests that are actually in flight
+        are governed by an adaptive limiter that backs off when the API
+        returns rate limit errors and recovers as requests succeed.
+
         Args:
-            text_chunks: List of dictionaries with 'text' and 'id' keys
+            text_chunks: List of dictionaries with 'text' and 'id' keys, and
+                optionally 'preprocessed' when the text is already preprocessed
             output_dir: Output directory for audio files
-            parallel: Whether to use parallel processing (not recommended for ElevenLabs)
+            parallel: Whether to send chunks concurrently
 
         Returns:
-            List of ElevenLabsResult objects
+            List of ElevenLabsResult objects, in the order of text_chunks
         """
         if not self.is_initialized:
             logger.error("ElevenLabs client not initialized")
@@ -442,34 +730,42 @@ class ElevenLabsTTSPipeline:
                 current_item=f"Batch processing {len(text_chunks)} chunks"
             ))
 
-        results = []
+        results: List[Optional[ElevenLabsResult]] = [None] * len(text_chunks)
+        completed = 0
         progress = ProgressLogger("ElevenLabs TTS processing", len(text_chunks))
+        # One worker more than the request limit prepares the next chunk
+        # (preprocessing, cache lookup) while every request slot is busy;
+        # the rate limiter keeps in-flight requests within the limit
+        max_workers = min(self.max_concurrency + 1, len(text_chunks)) if parallel else 1
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            future_to_index = {}
+            for i, chunk in enumerate(text_chunks):
+                chunk_id = chunk.get('id', f"chunk_{i}")
+                output_path = output_dir / f"{chunk_id}.mp3"  # ElevenLabs outputs MP3
+
+                future = executor.submit(
+                    self.process_chunk,
+                    chunk['text'],
+                    str(output_path),
+                    chunk_id,
+                    chunk.get('preprocessed', False)
+                )
+                future_to_index[future] = i
 
-        # For ElevenLabs, prefer sequential processing to respect rate limits
-        for i, chunk in enumerate(text_chunks):
-            chunk_id = chunk.get('id', f"chunk_{i}")
-            output_path = output_dir / f"{chunk_id}.mp3"  # ElevenLabs outputs MP3
-
-            result = self.process_chunk(
-                chunk['text'],
-                str(output_path),
-                chunk_id
-            )
-            results.append(result)
-            progress.update()
+            for future in as_completed(future_to_index):
+                results[future_to_index[future]] = future.result()
+                completed += 1
+                progress.update()
 
-            # Emit progress event
-            if self.progress_tracker:
-                self.progress_tracker.emit_event(create_progress_event(
-                    PipelineType.TTS,
-                    completed_items=len(results),
-                    total_items=len(text_chunks),
-                    current_item=f"Processed {len(results)}/{len(text_chunks)} chunks"
-                ))
-
-            # Add delay between chunks to respect rate limits
-            if i < len(text_chunks) - 1:  # Don't delay after the last chunk
-                time.sleep(1.0)
+                # Emit progress event
+                if self.progress_tracker:
+                    self.progress_tracker.emit_event(create_progress_event(
+                        PipelineType.TTS,
+                        completed_items=completed,
+                        total_items=len(text_chunks),
+                        current_item=f"Processed {completed}/{len(text_chunks)} chunks"
+                    ))
 
         progress.finish()
 
@@ -477,10 +773,11 @@ class ElevenLabsTTSPipeline:
         successful = [r for r in results if r.success]
         failed = [r for r in results if not r.success]
         total_chars = sum(r.characters_processed for r in successful)
+        cache_hits = sum(r.cache_hit for r in successful)
 
         logger.info(
             f"Batch ElevenLabs TTS processing completed: "
-            f"{len(successful)} successful, {len(failed)} failed, "
+            f"{len(successful)} successful ({cache_hits} from cache), {len(failed)} failed, "
             f"{total_chars} characters processed"
         )
 
@@ -505,8 +802,11 @@ class ElevenLabsTTSPipeline:
         """
         logger.info(f"Processing {len(chapters)} chapters for ElevenLabs TTS")
 
-        # Prepare text chunks from chapters
+        # Prepare text chunks from chapters. Long chapters are split into
+        # API-sized parts up front, so their parts are synthesized
+        # concurrently alongside other chapters and stitched afterwards.
         text_chunks = []
+        chapter_chunk_ids = []
         for i, chapter in enumerate(chapters):
             chapter_num = chapter.get('chapter_num', i + 1)
             chapter_title = chapter.get('title', f'Chapter {chapter_num}')
@@ -516,17 +816,36 @@ class ElevenLabsTTSPipeline:
             clean_title = clean_title.replace(' ', '_')[:20]  # Limit length
 
             chunk_id = f"chapter_{chapter_num:03d}_{clean_title}"
-
-            text_chunks.append({
-                'id': chunk_id,
-                'text': chapter['content'],
-                'title': chapter_title,
-                'chapter_num': chapter_num
-            })
+            chapter_chunk_ids.append(chunk_id)
+
+            # Empty chapters are still submitted so they are reported as failed
+            parts = self._split_text_for_api(self._preprocess_text(chapter['content'])) or ['']
+            for j, part in enumerate(parts):
+                text_chunks.append({
+                    'id': chunk_id if len(parts) == 1 else f"{chunk_id}_part{j:03d}",
+                    'text': part,
+                    'preprocessed': True,
+                    'parent': chunk_id,
+                    'title': chapter_title,
+                    'chapter_num': chapter_num
+                })
 
         # Process all chunks
         chapter_dir = output_dir / "chapters"
-        results = self.batch_process(text_chunks, chapter_dir, parallel=False)
+        part_results = self.batch_process(text_chunks, chapter_dir)
+
+        # Stitch the parts of split chapters back into one file per chapter
+        results_by_chapter: Dict[str, List[ElevenLabsResult]] = {}
+        for chunk, result in zip(text_chunks, part_results):
+            results_by_chapter.setdefault(chunk['parent'], []).append(result)
+
+        results = []
+        for chunk_id in chapter_chunk_ids:
+            chapter_results = results_by_chapter[chunk_id]
+            if len(chapter_results) == 1:
+                results.append(chapter_results[0])
+            else:
+                results.append(self._stitch_parts(chapter_results, chapter_dir / f"{chunk_id}.mp3", chunk_id))
 
         # Collect successful audio files
         successful_results = [r for r in results if r.success]
@@ -539,6 +858,7 @@ class ElevenLabsTTSPipeline:
             'failed_chapters': len(results) - len(successful_results),
             'total_audio_duration': sum(r.duration for r in successful_results),
             'total_characters_processed': total_chars,
+            'cache_hits': sum(r.cache_hit for r in part_results),
             'chapter_files': audio_files,
             'merged_file': None,
             'voice_id': self.voice_id,
@@ -548,32 +868,84 @@ class ElevenLabsTTSPipeline:
         # Merge into final audiobook if requested and we have audio files
         if merge_final and audio_files:
             try:
-                from pydub import AudioSegment
-
                 merged_file = output_dir / "audiobook.mp3"
                 logger.info(f"Merging {len(audio_files)} audio files to {merged_file}")
 
-                # Load first audio file
-                combined = AudioSegment.from_mp3(audio_files[0])
-
-                # Add remaining files
-                for audio_file in audio_files[1:]:
-                    if Path(audio_file).exists():
-                        next_audio = AudioSegment.from_mp3(audio_file)
-                        combined = combined + next_audio  # Simple concatenation
-
-                # Export merged audio
-                combined.export(str(merged_file), format="mp3", bitrate="192k")
+                if self.reencode_merge:
+                    self._merge_with_pydub(audio_files, merged_file)
+                else:
+                    # Chapters share one MP3 encoding, so their frames can be
+                    # joined directly without decoding and re-encoding
+                    concatenate_mp3_files(audio_files, merged_file)
                 processing_summary['merged_file'] = str(merged_file)
 
-                duration_minutes = len(combined) / 1000 / 60
-                logger.info(f"ElevenLabs audiobook merge completed: {duration_minutes:.1f} minutes")
+                duration_minutes = processing_summary['total_audio_duration'] / 60
+                logger.info(f"ElevenLabs audiobook merge completed: ~{duration_minutes:.1f} minutes")
 
             except Exception as e:
                 logger.error(f"Failed to merge ElevenLabs audio files: {e}")
 
         return processing_summary
 
+    def _stitch_parts(
+        self,
+        part_results: List[ElevenLabsResult],
+        output_path: Path,
+        chunk_id: str
+    ) -> ElevenLabsResult:
+        """
+        Join the audio of separately synthesized parts of one chapter.
+
+        Failed parts are skipped with a warning, matching _process_long_text.
+
+        Args:
+            part_results: Results for the chapter's parts, in order
+            output_path: Chapter audio file to write
+            chunk_id: Chapter chunk identifier
+
+        Returns:
+            ElevenLabsResult for the whole chapter
+        """
+        successful = [r for r in part_results if r.success]
+        failed = len(part_results) - len(successful)
+        if failed:
+            logger.warning(f"Failed to process {failed}/{len(part_results)} parts for {chunk_id}")
+        if not successful:
+            return ElevenLabsResult(
+                success=False,
+                error_message=f"No audio segments generated successfully for {chunk_id}",
+                voice_id=self.voice_id
+            )
+
+        part_paths = [Path(r.audio_path) for r in successful]
+        try:
+            concatenate_mp3_files(part_paths, output_path)
+        finally:
+            for part_path in part_paths:
+                part_path.unlink(missing_ok=True)
+
+        logger.info(f"Successfully merged {len(part_paths)} audio segments for {chunk_id}")
+
+        return ElevenLabsResult(
+            success=True,
+            audio_path=str(output_path),
+            duration=sum(r.duration for r in successful),
+            characters_processed=sum(r.characters_processed for r in successful),
+            text_processed=" ".join(r.text_processed for r in successful),
+            processing_time=sum(r.processing_time for r in successful),
+            voice_id=self.voice_id,
+            cache_hit=all(r.cache_hit for r in successful)
+        )
+
+    @staticmethod
+    def _merge_with_pydub(audio_files: List[str], merged_file: Path) -> None:
+        """Merge audio files by decoding them and re-encoding the result."""
+        from pydub import AudioSegment
+
+        segments = [AudioSegment.from_mp3(audio_file) for audio_file in audio_files if Path(audio_file).exists()]
+        combined = sum(segments[1:], segments[0])
+        combined.export(str(merged_file), format="mp3", bitrate="192k")
+
     def _preprocess_text(self, text: str) -> str:
         """
         Preprocess text for optimal ElevenLabs TTS synthesis.
@@ -584,30 +956,46 @@ class ElevenLabsTTSPipeline:
         Returns:
             Preprocessed text optimized for ElevenLabs TTS
         """
-        # Remove or replace TTS-unfriendly patterns
-        processed = text
+        # Replace all TTS markers in one scan, then clean up extra whitespace
+        processed = MARKER_PATTERN.sub(render_marker, text)
+        processed = WHITESPACE_PATTERN.sub(' ', processed).strip()
 
-        # Handle pause markers (ElevenLabs supports SSML)
-        processed = re.sub(r'\[PAUSE: ([\d.]+)\]', r'<break time="\1s"/>', processed)
+        return processed
 
-        # Handle emphasis markers
-        processed = re.sub(r'\[EMPHASIS_STRONG: ([^\]]+)\]', r'<emphasis level="strong">\1</emphasis>', processed)
-        processed = re.sub(r'\[EMPHASIS_MILD: ([^\]]+)\]', r'<emphasis level="moderate">\1</emphasis>', processed)
+    def _get_voice(self) -> Any:
+        """Get the current voice, reusing a recent lookup."""
+        return self._cached_voice_lookup(
+            'voice', f"{self.account_key}:{self.voice_id}",
+            lambda: self.client.voices.get(self.voice_id)
+        )
 
-        # Handle dialogue markers
-        processed = re.sub(r'\[DIALOGUE_START\]', '', processed)
-        processed = re.sub(r'\[DIALOGUE_END\]', '', processed)
+    def _get_all_voices(self) -> Any:
+        """Get the account's voice catalogue, reusing a recent lookup."""
+        return self._cached_voice_lookup('all_voices', self.account_key, self.client.voices.get_all)
 
-        # Handle chapter markers
-        processed = re.sub(r'\[CHAPTER_START: ([^\]]+)\]', r'Chapter: \1. ', processed)
+    def _cached_voice_lookup(self, kind: str, key: str, fetch: Callable[[], Any]) -> Any:
+        """
+        Return a voice API response from the shared cache or fetch it.
 
-        # Handle image descriptions
-        processed = re.sub(r'\[IMAGE: ([^\]]+)\]', r'Image description: \1. ', processed)
+        Voices rarely change during a run, so responses are reused for
+        VOICE_CACHE_TTL seconds. Failed lookups are not cached.
 
-        # Clean up extra whitespace
-        processed = re.sub(r'\s+', ' ', processed).strip()
+        Args:
+            kind: Type of lookup
+            key: Lookup key within the kind
+            fetch: Function calling the API on a miss
 
-        return processed
+        Returns:
+            API response
+        """
+        cache_key = (kind, key)
+        entry = self._voice_cache.get(cache_key)
+        if entry is not None and time.monotonic() - entry[0] < VOICE_CACHE_TTL:
+            return entry[1]
+
+        value = fetch()
+        self._voice_cache[cache_key] = (time.monotonic(), value)
+        return value
 
     def get_voice_info(self) -> Dict[str, Any]:
         """Get information about current voice and available voices."""
@@ -615,11 +1003,13 @@ class ElevenLabsTTSPipeline:
             return {"error": "ElevenLabs client not initialized"}
 
         try:
-            # Get current voice info
-            current_voice = self.client.voices.get(self.voice_id)
-
-            # Get all available voices
-            all_voices = self.client.voices.get_all()
+            # Get current voice info and all available voices. The lookups are
+            # independent, so on a cache miss both requests run concurrently.
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                current_voice_future = executor.submit(self._get_voice)
+                all_voices_future = executor.submit(self._get_all_voices)
+                current_voice = current_voice_future.result()
+                all_voices = all_voices_future.result()
 
             return {
                 "current_voice": {
@@ -654,7 +1044,7 @@ class ElevenLabsTTSPipeline:
             if not self.is_initialized:
                 return []
 
-            all_voices = self.client.voices.get_all()
+            all_voices = self._get_all_voices()
             return [voice.voice_id for voice in all_voices.voices]
         except Exception as e:
             logger.error(f"Failed to get available voices: {e}")
@@ -7,30 +7,113 @@ using the ElevenLabs API with advanced features and optimizations.
 
 import logging
 import os
+import threading
 import time
-import re
+import wave
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
-from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Any, Union
+from dataclasses import dataclass, replace
 import json
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from itertools import repeat
 from pydub import AudioSegment
 from tqdm import tqdm
 
 # ElevenLabs imports
-from elevenlabs.client import ElevenLabs, AsyncElevenLabs
+from elevenlabs.client import ElevenLabs
 from elevenlabs import Voice, VoiceSettings
 
+from pipelines.elevenlabs_tts import (
+    MARKER_PATTERN, WHITESPACE_PATTERN, classify_api_error, render_marker, split_text_for_api
+)
+from utils.audio_cache import AudioCache, DEFAULT_CACHE_ROOT
+from utils.audio_files import concatenate_mp3_files, link_or_copy
+from utils.audio_merge import ffmpeg_merge, join_segments, probe_durations, stream_merge
 from utils.config import TTSConfig
+from utils.http_client import HTTP_MAX_KEEPALIVE_CONNECTIONS, HTTP_TIMEOUT, create_http_client
+from utils.rate_limiter import AdaptiveConcurrencyLimiter, backoff_delay, retry_after_seconds
 from utils.logger import PerformanceLogger, ProgressLogger
 from utils.secrets import load_secrets
 from ui.progress_tracker import (
-    ProgressTracker, PipelineType, EventType,
+    ProgressCoalescer, ProgressTracker, PipelineType, EventType,
     create_start_event, create_progress_event, create_complete_event, create_error_event
 )
 
 logger = logging.getLogger(__name__)
 
+# Write buffer for audio streamed from the API
+AUDIO_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Raw 16-bit mono PCM output formats, named pcm_<sample rate>
+PCM_FORMAT_PREFIX = "pcm_"
+
+# Below this many characters in total, worker start-up costs more than it saves
+PARALLEL_PREPARE_MIN_CHARS = 200_000
+
+
+def preprocess_text(text: str) -> str:
+    """
+    Preprocess text for optimal ElevenLabs TTS synthesis.
+
+    Args:
+        text: Raw text to preprocess
+
+    Returns:
+        Preprocessed text optimized for ElevenLabs TTS
+    """
+    # Replace all TTS markers in one scan (the same SSML rendering as the
+    # main ElevenLabs pipeline), then clean up extra whitespace
+    processed = MARKER_PATTERN.sub(render_marker, text)
+    return WHITESPACE_PATTERN.sub(' ', processed).strip()
+
+
+def _prepare_chapter(index: int, chapter: Dict[str, str], max_chars: int) -> List[Dict[str, Any]]:
+    """
+    Split a chapter into preprocessed text chunks.
+
+    Runs in worker processes, so it only uses its arguments.
+
+    Args:
+        index: Position of the chapter in the book
+        chapter: Chapter dictionary with 'title', 'content', etc.
+        max_chars: Maximum characters per chunk
+
+    Returns:
+        Chunk dictionaries for batch_process, in reading order
+    """
+    chapter_num = chapter.get('chapter_num', index + 1)
+    chapter_title = chapter.get('title', f'Chapter {chapter_num}')
+    chapter_content = chapter['content']
+
+    # Clean title for filename
+    clean_title = "".join(c for c in chapter_title if c.isalnum() or c in ' -_')
+    clean_title = clean_title.replace(' ', '_')[:20]
+
+    # Split long chapters into smaller chunks
+    if len(chapter_content) <= max_chars:
+        content_chunks = [chapter_content]
+    else:
+        content_chunks = split_text_for_api(chapter_content, max_chars)
+
+    text_chunks = []
+    for j, chunk in enumerate(content_chunks):
+        if len(content_chunks) > 1:
+            chunk_id = f"chapter_{chapter_num:03d}_{clean_title}_part_{j+1:02d}"
+        else:
+            chunk_id = f"chapter_{chapter_num:03d}_{clean_title}"
+
+        text_chunks.append({
+            'id': chunk_id,
+            'text': preprocess_text(chunk),
+            'preprocessed': True,
+            'title': chapter_title,
+            'chapter_num': chapter_num,
+            'part': j + 1 if len(content_chunks) > 1 else 1,
+            'total_parts': len(content_chunks)
+        })
+
+    return text_chunks
+
 
 @dataclass
 class ElevenLabsTTSResult:
@@ -43,6 +126,7 @@ class ElevenLabsTTSResult:
     processing_time: float = 0.0
     characters_processed: int = 0
     api_calls_made: int = 0
+    cache_hit: bool = False
 
 
 @dataclass
@@ -51,7 +135,7 @@ class ElevenLabsConfig:
     api_key: str
     voice_id: str = "JBFqnCBsd6RMkjVDRZzb"  # Default voice
     model_id: str = "eleven_multilingual_v2"  # Recommended model
-    output_format: str = "mp3_44100_128"
+    output_format: str = "mp3_44100_128"  # pcm_<rate> formats are saved as WAV files
     stability: float = 0.5
     similarity_boost: float = 0.5
     style: float = 0.0
@@ -60,6 +144,11 @@ class ElevenLabsConfig:
     max_retries: int = 3
     retry_delay: float = 1.0
     rate_limit_delay: float = 2.0
+    max_concurrency: int = 3  # Concurrent requests allowed by the plan
+    cache_dir: Optional[str] = f"{DEFAULT_CACHE_ROOT}/elevenlabs"  # None disables the audio cache
+    cache_max_bytes: Optional[int] = 2 * 1024 ** 3  # LRU eviction beyond this; None for no limit
+    crossfade_ms: int = 100  # 0 joins MP3 chapters without re-encoding them
+    audiobook_bitrate: str = "128k"  # Bitrate when the merged audiobook has to be encoded
 
 
 class ElevenLabsTTSPipeline:
@@ -80,13 +169,29 @@ class ElevenLabsTTSPipeline:
         """
         self.progress_tracker = progress_tracker
         self.client = None
+        self.http_client = None
         self.config = config or self._load_default_config()
         self.is_initialized = False
 
         # API usage tracking
         self.total_characters_processed = 0
         self.total_api_calls = 0
+        self.total_cache_hits = 0
         self.session_start_time = time.time()
+        self._stats_lock = threading.Lock()
+
+        # Concurrent requests start at the plan limit, are halved when the API
+        # throttles and grow back one at a time as requests succeed
+        self.rate_limiter = AdaptiveConcurrencyLimiter(self.config.max_concurrency)
+
+        # Voice settings are fixed by the config, so build them once for all chunks
+        self._voice_settings = VoiceSettings(
+            stability=self.config.stability,
+            similarity_boost=self.config.similarity_boost,
+            style=self.config.style,
+            use_speaker_boost=self.config.use_speaker_boost
+        )
+        self.cache = self._create_cache()
 
         logger.info("Initializing ElevenLabs TTS pipeline")
         self._initialize_client()
@@ -107,7 +212,18 @@ class ElevenLabsTTSPipeline:
     def _initialize_client(self) -> None:
         """Initialize the ElevenLabs client."""
         try:
-            self.client = ElevenLabs(api_key=self.config.api_key)
+            # One pooled HTTP client shared by all requests, so concurrent
+            # and consecutive chunks reuse open connections. Keep enough idle
+            # connections for every concurrent request, or the extras are
+            # closed and reopened for each chunk over HTTP/1.1
+            self.http_client = create_http_client(
+                max_keepalive_connections=max(HTTP_MAX_KEEPALIVE_CONNECTIONS, self.config.max_concurrency)
+            )
+            self.client = ElevenLabs(
+                api_key=self.config.api_key,
+                httpx_client=self.http_client,
+                timeout=HTTP_TIMEOUT
+            )
 
             # Test the connection by listing voices
             try:
@@ -124,6 +240,54 @@ class ElevenLabsTTSPipeline:
             logger.error(f"Failed to initialize ElevenLabs client: {e}")
             raise RuntimeError(f"Cannot initialize ElevenLabs TTS: {e}")
 
+    def close(self) -> None:
+        """Close pooled HTTP connections and the audio cache index."""
+        if self.http_client is not None:
+            self.http_client.close()
+            self.http_client = None
+        if self.cache is not None:
+            self.cache.close()
+        self.client = None
+        self.is_initialized = False
+
+    def __enter__(self) -> "ElevenLabsTTSPipeline":
+        """Use the pipeline as a context manager that closes it on exit."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Release connections and the cache index."""
+        self.close()
+
+    @property
+    def audio_extension(self) -> str:
+        """File extension of the audio files this pipeline writes."""
+        return "wav" if self.config.output_format.startswith(PCM_FORMAT_PREFIX) else "mp3"
+
+    def _create_cache(self) -> Optional[AudioCache]:
+        """Create the synthesized audio cache, if configured."""
+        if not self.config.cache_dir:
+            return None
+
+        try:
+            return AudioCache(self.config.cache_dir, extension=self.audio_extension,
+                              max_bytes=self.config.cache_max_bytes)
+        except OSError as e:
+            logger.warning(f"ElevenLabs audio cache disabled, cannot use {self.config.cache_dir}: {e}")
+            return None
+
+    def _cache_key(self, text: str) -> str:
+        """Build the audio cache key for text with the configured voice settings."""
+        return AudioCache.make_key(
+            text,
+            voice_id=self.config.voice_id,
+            model_id=self.config.model_id,
+            output_format=self.config.output_format,
+            stability=self.config.stability,
+            similarity_boost=self.config.similarity_boost,
+            style=self.config.style,
+            use_speaker_boost=self.config.use_speaker_boost
+        )
+
     def get_available_voices(self) -> List[Dict[str, str]]:
         """Get list of available voices from ElevenLabs."""
         if not self.is_initialized:
@@ -159,42 +323,15 @@ class ElevenLabsTTSPipeline:
         if len(text) <= max_chars:
             return [text]
 
-        chunks = []
-        current_chunk = ""
+        return split_text_for_api(text, max_chars)
 
-        # Split by sentences first
-        sentences = re.split(r'(?<=[.!?])\s+', text)
-
-        for sentence in sentences:
-            if len(current_chunk) + len(sentence) + 1 <= max_chars:
-                current_chunk += " " + sentence if current_chunk else sentence
-            else:
-                if current_chunk:
-                    chunks.append(current_chunk.strip())
-                    current_chunk = sentence
-                else:
-                    # Handle very long sentences - split by words
-                    words = sentence.split()
-                    temp_chunk = ""
-                    for word in words:
-                        if len(temp_chunk) + len(word) + 1 <= max_chars:
-                            temp_chunk += " " + word if temp_chunk else word
-                        else:
-                            if temp_chunk:
-                                chunks.append(temp_chunk.strip())
-                                temp_chunk = word
-                            else:
-                                # Truncate extremely long words
-                                chunks.append(word[:max_chars])
-                    if temp_chunk:
-                        current_chunk = temp_chunk
-
-        if current_chunk:
-            chunks.append(current_chunk.strip())
-
-        return [chunk for chunk in chunks if chunk.strip()]
-
-    def process_chunk(self, text: str, output_path: str, chunk_id: str = "") -> ElevenLabsTTSResult:
+    def process_chunk(
+        self,
+        text: str,
+        output_path: Union[str, Path],
+        chunk_id: str = "",
+        preprocessed: bool = False
+    ) -> ElevenLabsTTSResult:
         """
         Process a single text chunk through ElevenLabs TTS.
 
@@ -202,10 +339,23 @@ class ElevenLabsTTSPipeline:
             text: Text to convert to speech
             output_path: Path for output audio file
             chunk_id: Optional identifier for this chunk
+            preprocessed: Whether text has already been through preprocess_text
 
         Returns:
             ElevenLabsTTSResult with processing information
         """
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        return self._process_chunk(text, output_path, chunk_id, preprocessed)
+
+    def _process_chunk(
+        self,
+        text: str,
+        output_path: Path,
+        chunk_id: str,
+        preprocessed: bool
+    ) -> ElevenLabsTTSResult:
+        """Process a chunk whose output directory already exists."""
         if not self.is_initialized:
             return ElevenLabsTTSResult(
                 success=False,
@@ -225,7 +375,7 @@ class ElevenLabsTTSPipeline:
         try:
             with PerformanceLogger(f"ElevenLabs TTS chunk processing: {chunk_id}"):
                 # Preprocess text
-                processed_text = self._preprocess_text(text)
+                processed_text = text if preprocessed else self._preprocess_text(text)
 
                 if not processed_text.strip():
                     logger.warning(f"Empty text after preprocessing: {chunk_id}")
@@ -234,24 +384,21 @@ class ElevenLabsTTSPipeline:
                         error_message="Empty text after preprocessing"
                     )
 
-                # Create voice settings
-                voice_settings = VoiceSettings(
-                    stability=self.config.stability,
-                    similarity_boost=self.config.similarity_boost,
-                    style=self.config.style,
-                    use_speaker_boost=self.config.use_speaker_boost
-                )
+                # Identical text with identical settings gives the same audio,
+                # so reuse it from the cache instead of calling the API
+                cache_key = self._cache_key(processed_text) if self.cache else None
+                cache_hit = cache_key is not None and self.cache.copy_to(cache_key, output_path)
 
-                # Generate audio with retry logic
-                audio_data = self._generate_audio_with_retry(
-                    processed_text, voice_settings
-                )
+                file_size = None
+                if not cache_hit:
+                    # Generate audio with retry logic, streaming it to the file
+                    file_size = self._generate_audio_with_retry(processed_text, output_path)
 
-                # Save audio file
-                output_path = Path(output_path)
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-
-                self._save_audio(audio_data, output_path)
+                    if cache_key is not None:
+                        try:
+                            self.cache.put_file(cache_key, output_path)
+                        except OSError as e:
+                            logger.warning(f"Could not cache ElevenLabs audio: {e}")
 
                 # Calculate duration (estimate based on average speaking rate)
                 # ElevenLabs doesn't provide duration info, so we estimate
@@ -260,8 +407,11 @@ class ElevenLabsTTSPipeline:
                 processing_time = time.time() - start_time
 
                 # Update tracking
-                self.total_characters_processed += len(processed_text)
-                self.total_api_calls += 1
+                api_calls_made = 0 if cache_hit else 1
+                with self._stats_lock:
+                    self.total_characters_processed += len(processed_text)
+                    self.total_api_calls += api_calls_made
+                    self.total_cache_hits += int(cache_hit)
 
                 logger.debug(
                     f"ElevenLabs TTS chunk completed: {chunk_id} "
@@ -275,7 +425,7 @@ class ElevenLabsTTSPipeline:
                         current_item=chunk_id or "Unknown chunk",
                         duration=estimated_duration,
                         processing_time=processing_time,
-                        file_size=output_path.stat().st_size if output_path.exists() else 0
+                        file_size=file_size if file_size is not None else output_path.stat().st_size
                     ))
 
                 return ElevenLabsTTSResult(
@@ -285,7 +435,8 @@ class ElevenLabsTTSPipeline:
                     text_processed=processed_text,
                     processing_time=processing_time,
                     characters_processed=len(processed_text),
-                    api_calls_made=1
+                    api_calls_made=api_calls_made,
+                    cache_hit=cache_hit
                 )
 
         except Exception as e:
@@ -306,40 +457,59 @@ class ElevenLabsTTSPipeline:
                 processing_time=time.time() - start_time
             )
 
-    def _generate_audio_with_retry(self, text: str, voice_settings: VoiceSettings) -> bytes:
-        """Generate audio with retry logic and rate limit handling."""
+    def _generate_audio_with_retry(self, text: str, output_path: Path) -> int:
+        """
+        Generate audio into a file with retry logic and rate limit handling.
+
+        Returns:
+            Size of the written file in bytes
+        """
         last_exception = None
 
         for attempt in range(self.config.max_retries):
             try:
-                audio = self.client.text_to_speech.convert(
-                    text=text,
-                    voice_id=self.config.voice_id,
-                    model_id=self.config.model_id,
-                    voice_settings=voice_settings,
-                    output_format=self.config.output_format
-                )
-                return audio
+                # The SDK sends the request lazily and streams the response
+                # body, so the slot is held until all audio has been written
+                with self.rate_limiter.slot() as generation:
+                    audio = self.client.text_to_speech.convert(
+                        text=text,
+                        voice_id=self.config.voice_id,
+                        model_id=self.config.model_id,
+                        voice_settings=self._voice_settings,
+                        output_format=self.config.output_format
+                    )
+                    file_size = self._save_audio([audio] if isinstance(audio, bytes) else audio, output_path)
+
+                self.rate_limiter.on_success()
+                return file_size
 
             except Exception as e:
                 last_exception = e
-                error_str = str(e).lower()
-
-                if "rate limit" in error_str or "too many requests" in error_str:
-                    wait_time = self.config.rate_limit_delay * (2 ** attempt)
-                    logger.warning(f"Rate limit hit, waiting {wait_time}s (attempt {attempt + 1})")
+                error_kind = classify_api_error(e)
+
+                if error_kind == 'rate_limit':
+                    self.rate_limiter.on_rate_limited(generation)
+
+                    # Wait as long as the server asks, if it says
+                    wait_time = retry_after_seconds(getattr(e, 'headers', None))
+                    if wait_time is None:
+                        wait_time = backoff_delay(attempt, self.config.rate_limit_delay)
+                    logger.warning(
+                        f"Rate limit hit, waiting {wait_time:.1f}s (attempt {attempt + 1}, "
+                        f"concurrency {self.rate_limiter.limit})"
+                    )
                     time.sleep(wait_time)
                     continue
 
-                elif "authentication" in error_str or "unauthorized" in error_str:
+                elif error_kind == 'auth':
                     logger.error("Authentication failed - check API key")
                     raise
 
-                elif "quota" in error_str or "insufficient" in error_str:
+                elif error_kind == 'quota':
                     logger.error("API quota exceeded")
                     raise
 
-                elif "invalid voice" in error_str:
+                elif error_kind == 'voice_not_found':
                     logger.error(f"Invalid voice ID: {self.config.voice_id}")
                     raise
 
@@ -347,14 +517,46 @@ class ElevenLabsTTSPipeline:
                     logger.warning(f"Attempt {attempt + 1} failed: {e}")
                     if attempt == self.config.max_retries - 1:
                         raise
-                    time.sleep(self.config.retry_delay * (attempt + 1))
+                    time.sleep(backoff_delay(attempt, self.config.retry_delay))
 
         raise last_exception
 
-    def _save_audio(self, audio_data: bytes, output_path: Path) -> None:
-        """Save audio data to file."""
-        with open(output_path, 'wb') as f:
-            f.write(audio_data)
+    def _save_audio(self, chunks: Iterable[bytes], output_path: Path) -> int:
+        """
+        Write streamed audio to a file as it arrives.
+
+        Raw PCM output gets a WAV header. The audio goes to a .partial
+        sibling that is renamed into place once complete, so a failed
+        download never leaves a truncated output file.
+
+        Args:
+            chunks: Audio data chunks from the API
+            output_path: Destination file
+
+        Returns:
+            Size of the written file in bytes
+        """
+        output_format = self.config.output_format
+        partial_path = output_path.with_name(output_path.name + '.partial')
+        try:
+            with open(partial_path, 'wb', buffering=AUDIO_WRITE_BUFFER_SIZE) as f:
+                if output_format.startswith(PCM_FORMAT_PREFIX):
+                    with wave.open(f, 'wb') as wav:
+                        wav.setnchannels(1)
+                        wav.setsampwidth(2)
+                        wav.setframerate(int(output_format[len(PCM_FORMAT_PREFIX):]))
+                        for chunk in chunks:
+                            wav.writeframesraw(chunk)
+                else:
+                    for chunk in chunks:
+                        f.write(chunk)
+                file_size = f.tell()
+            os.replace(partial_path, output_path)
+        except BaseException:
+            partial_path.unlink(missing_ok=True)
+            raise
+
+        return file_size
 
     def _estimate_audio_duration(self, text: str) -> float:
         """Estimate audio duration based on text length."""
@@ -367,18 +569,23 @@ class ElevenLabsTTSPipeline:
         self,
         text_chunks: List[Dict[str, str]],
         output_dir: Path,
-        parallel: bool = False  # ElevenLabs rate limits make parallel risky
+        max_concurrency: Optional[int] = None
     ) -> List[ElevenLabsTTSResult]:
         """
         Process multiple text chunks with progress tracking.
 
+        Synthesis time is spent waiting on the API, so chunks are sent
+        concurrently over the shared connection pool, up to the plan's
+        concurrent request limit.
+
         Args:
             text_chunks: List of dictionaries with 'text' and 'id' keys
             output_dir: Output directory for audio files
-            parallel: Whether to use parallel processing (not recommended for ElevenLabs)
+            max_concurrency: Most chunks in flight at once (defaults to the
+                configured max_concurrency; 1 sends chunks one at a time)
 
         Returns:
-            List of ElevenLabsTTSResult objects
+            List of ElevenLabsTTSResult objects, in the order of text_chunks
         """
         if not self.is_initialized:
             logger.error("ElevenLabs client not initialized")
@@ -395,34 +602,61 @@ class ElevenLabsTTSPipeline:
                 current_item=f"Batch processing {len(text_chunks)} chunks"
             ))
 
-        results = []
+        results: List[Optional[ElevenLabsTTSResult]] = [None] * len(text_chunks)
+        completed = 0
         progress = ProgressLogger("ElevenLabs TTS processing", len(text_chunks))
-
-        # Sequential processing is recommended for ElevenLabs due to rate limits
+        progress_events = ProgressCoalescer(len(text_chunks))
+
+        # Identical text with identical settings gives identical audio, so
+        # each distinct chunk is synthesized once and shared with its repeats
+        texts = []
+        chunk_ids = []
+        output_paths = []
+        groups: Dict[str, List[int]] = {}
         for i, chunk in enumerate(text_chunks):
-            chunk_id = chunk.get('id', f"chunk_{i}")
-            output_path = output_dir / f"{chunk_id}.mp3"  # ElevenLabs typically outputs MP3
-
-            result = self.process_chunk(
-                chunk['text'],
-                str(output_path),
-                chunk_id
-            )
-            results.append(result)
-            progress.update()
-
-            # Emit progress event
-            if self.progress_tracker:
-                self.progress_tracker.emit_event(create_progress_event(
-                    PipelineType.TTS,
-                    completed_items=len(results),
-                    total_items=len(text_chunks),
-                    current_item=f"Processed {len(results)}/{len(text_chunks)} chunks"
-                ))
-
-            # Small delay between requests to respect rate limits
-            if i < len(text_chunks) - 1:  # Don't delay after last chunk
-                time.sleep(0.5)
+            text = chunk['text'] if chunk.get('preprocessed') else self._preprocess_text(chunk['text'])
+            texts.append(text)
+            chunk_ids.append(chunk.get('id', f"chunk_{i}"))
+            output_paths.append(output_dir / f"{chunk_ids[i]}.{self.audio_extension}")
+            groups.setdefault(self._cache_key(text), []).append(i)
+
+        if len(groups) < len(text_chunks):
+            logger.info(f"Synthesizing {len(groups)} distinct chunks for {len(text_chunks)} chunks")
+
+        max_workers = min(max(1, max_concurrency or self.config.max_concurrency), max(1, len(groups)))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_group = {}
+            for indices in groups.values():
+                first = indices[0]
+                future = executor.submit(
+                    self._process_chunk,
+                    texts[first],
+                    output_paths[first],
+                    chunk_ids[first],
+                    True
+                )
+                future_to_group[future] = indices
+
+            for future in as_completed(future_to_group):
+                indices = future_to_group[future]
+                result = future.result()
+                results[indices[0]] = result
+                for index in indices[1:]:
+                    results[index] = self._share_result(result, output_paths[index])
+
+                completed += len(indices)
+                progress.update(len(indices))
+
+                # Emit progress event, skipping updates that come in too fast
+                # to be seen
+                if self.progress_tracker and progress_events.should_emit(completed):
+                    self.progress_tracker.emit_event(create_progress_event(
+                        PipelineType.TTS,
+                        completed_items=completed,
+                        total_items=len(text_chunks),
+                        current_item=f"Processed {completed}/{len(text_chunks)} chunks"
+                    ))
 
         progress.finish()
 
@@ -439,6 +673,37 @@ class ElevenLabsTTSPipeline:
 
         return results
 
+    def _share_result(self, result: ElevenLabsTTSResult, output_path: Path) -> ElevenLabsTTSResult:
+        """
+        Reuse the audio of a synthesized chunk for a chunk with the same text.
+
+        Args:
+            result: Result of the chunk that was synthesized
+            output_path: Output path of the repeated chunk
+
+        Returns:
+            Result for the repeated chunk, which made no API calls
+        """
+        if not result.success:
+            return result
+
+        try:
+            link_or_copy(result.audio_path, output_path)
+        except OSError as e:
+            return ElevenLabsTTSResult(
+                success=False,
+                error_message=f"Could not copy audio of a repeated chunk: {e}"
+            )
+
+        return replace(
+            result,
+            audio_path=str(output_path),
+            processing_time=0.0,
+            characters_processed=0,
+            api_calls_made=0,
+            cache_hit=True
+        )
+
     def merge_audio_files(
         self,
         audio_files: List[str],
@@ -463,28 +728,45 @@ class ElevenLabsTTSPipeline:
                 logger.warning("No audio files to merge")
                 return False
 
-            # Load first audio file
-            combined = AudioSegment.from_file(audio_files[0])
-
-            # Add remaining files with crossfade
-            for audio_file in audio_files[1:]:
-                if not Path(audio_file).exists():
+            existing_files = []
+            for audio_file in audio_files:
+                if Path(audio_file).exists():
+                    existing_files.append(audio_file)
+                else:
                     logger.warning(f"Audio file not found: {audio_file}")
-                    continue
 
-                next_audio = AudioSegment.from_file(audio_file)
+            if not existing_files:
+                return False
 
-                if crossfade_ms > 0:
-                    combined = combined.append(next_audio, crossfade=crossfade_ms)
-                else:
-                    combined = combined + next_audio
+            output_path = Path(output_path)
+
+            # MP3 chapters from the API can be joined frame by frame, avoiding
+            # a lossy second encode
+            if crossfade_ms <= 0 and all(Path(f).suffix.lower() == '.mp3' for f in existing_files):
+                concatenate_mp3_files(existing_files, output_path)
+                logger.info(f"ElevenLabs audio merge completed without re-encoding: {output_path}")
+                return True
+
+            # Let ffmpeg stream the files when it is installed
+            if ffmpeg_merge(existing_files, output_path, crossfade_ms, bitrate=self.config.audiobook_bitrate):
+                logger.info(f"ElevenLabs audio merge completed with ffmpeg: {output_path}")
+                return True
+
+            # Without ffmpeg, stream the files in blocks through soundfile
+            if stream_merge(existing_files, output_path, crossfade_ms):
+                logger.info(f"ElevenLabs audio merge completed with soundfile: {output_path}")
+                return True
+
+            # Last resort: decode each file once and join the PCM data in a single buffer
+            segments = [AudioSegment.from_file(audio_file) for audio_file in existing_files]
+            combined = join_segments(segments, crossfade_ms)
+            del segments
 
             # Export merged audio
-            output_path = Path(output_path)
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
             # Export as MP3 with good quality
-            combined.export(str(output_path), format="mp3", bitrate="192k")
+            combined.export(str(output_path), format="mp3", bitrate=self.config.audiobook_bitrate)
 
             duration_minutes = len(combined) / 1000 / 60
             logger.info(f"ElevenLabs audio merge completed: {duration_minutes:.1f} minutes")
@@ -515,42 +797,22 @@ class ElevenLabsTTSPipeline:
         logger.info(f"Processing {len(chapters)} chapters with ElevenLabs TTS")
 
         # Prepare text chunks from chapters, splitting long chapters if needed
-        text_chunks = []
-        for i, chapter in enumerate(chapters):
-            chapter_num = chapter.get('chapter_num', i + 1)
-            chapter_title = chapter.get('title', f'Chapter {chapter_num}')
-            chapter_content = chapter['content']
-
-            # Clean title for filename
-            clean_title = "".join(c for c in chapter_title if c.isalnum() or c in ' -_')
-            clean_title = clean_title.replace(' ', '_')[:20]
-
-            # Split long chapters into smaller chunks
-            content_chunks = self.chunk_text(chapter_content)
-
-            for j, chunk in enumerate(content_chunks):
-                if len(content_chunks) > 1:
-                    chunk_id = f"chapter_{chapter_num:03d}_{clean_title}_part_{j+1:02d}"
-                else:
-                    chunk_id = f"chapter_{chapter_num:03d}_{clean_title}"
-
-                text_chunks.append({
-                    'id': chunk_id,
-                    'text': chunk,
-                    'title': chapter_title,
-                    'chapter_num': chapter_num,
-                    'part': j + 1 if len(content_chunks) > 1 else 1,
-                    'total_parts': len(content_chunks)
-                })
+        text_chunks = [chunk for chapter_chunks in self._prepare_chapters(chapters) for chunk in chapter_chunks]
 
         # Process all chunks
         chapter_dir = output_dir / "chapters"
-        results = self.batch_process(text_chunks, chapter_dir, parallel=False)
+        results = self.batch_process(text_chunks, chapter_dir)
 
         # Collect successful audio files
         successful_results = [r for r in results if r.success]
         audio_files = [r.audio_path for r in successful_results]
 
+        # Replace the word count estimates with the real durations where the
+        # file headers can be read
+        for result, duration in zip(successful_results, probe_durations(audio_files)):
+            if duration is not None:
+                result.duration = duration
+
         # Calculate statistics
         total_chars = sum(r.characters_processed for r in successful_results)
         total_api_calls = sum(r.api_calls_made for r in successful_results)
@@ -571,7 +833,7 @@ class ElevenLabsTTSPipeline:
         # Merge into final audiobook if requested and we have audio files
         if merge_final and audio_files:
             merged_file = output_dir / "audiobook_elevenlabs.mp3"
-            if self.merge_audio_files(audio_files, str(merged_file)):
+            if self.merge_audio_files(audio_files, str(merged_file), self.config.crossfade_ms):
                 processing_summary['merged_file'] = str(merged_file)
                 logger.info(f"Final ElevenLabs audiobook created: {merged_file}")
             else:
@@ -587,39 +849,43 @@ class ElevenLabsTTSPipeline:
 
         return processing_summary
 
-    def _preprocess_text(self, text: str) -> str:
+    def _prepare_chapters(self, chapters: List[Dict[str, str]]) -> List[List[Dict[str, Any]]]:
         """
-        Preprocess text for optimal ElevenLabs TTS synthesis.
+        Chunk and preprocess chapters, spreading them across processes.
+
+        Text preparation is CPU-bound, so large books are prepared in
+        worker processes. Small books are prepared in-process, where
+        starting workers would cost more than it saves.
 
         Args:
-            text: Raw text to preprocess
+            chapters: List of chapter dictionaries with 'title', 'content', etc.
 
         Returns:
-            Preprocessed text optimized for ElevenLabs TTS
+            Chunk dictionaries of each chapter, in the same order as chapters
         """
-        processed = text
-
-        # Handle pause markers (ElevenLabs supports SSML)
-        processed = re.sub(r'\[PAUSE: ([\d.]+)\]', r'<break time="\1s"/>', processed)
-
-        # Handle emphasis markers
-        processed = re.sub(r'\[EMPHASIS_STRONG: ([^\]]+)\]', r'<emphasis level="strong">\1</emphasis>', processed)
-        processed = re.sub(r'\[EMPHASIS_MILD: ([^\]]+)\]', r'<emphasis level="moderate">\1</emphasis>', processed)
+        max_chars = self.config.max_chunk_chars
+        cpu_count = os.cpu_count() or 1
+        max_workers = min(cpu_count, len(chapters))
+        total_chars = sum(len(chapter['content']) for chapter in chapters)
 
-        # Handle dialogue markers
-        processed = re.sub(r'\[DIALOGUE_START\]', '', processed)
-        processed = re.sub(r'\[DIALOGUE_END\]', '', processed)
+        if max_workers <= 1 or total_chars < PARALLEL_PREPARE_MIN_CHARS:
+            return [_prepare_chapter(i, chapter, max_chars) for i, chapter in enumerate(chapters)]
 
-        # Handle chapter markers
-        processed = re.sub(r'\[CHAPTER_START: ([^\]]+)\]', r'Chapter: \1. ', processed)
+        logger.info(f"Preparing {len(chapters)} chapters with {max_workers} worker processes")
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_prepare_chapter, range(len(chapters)), chapters, repeat(max_chars)))
 
-        # Handle image descriptions
-        processed = re.sub(r'\[IMAGE: ([^\]]+)\]', r'Image description: \1. ', processed)
+    def _preprocess_text(self, text: str) -> str:
+        """
+        Preprocess text for optimal ElevenLabs TTS synthesis.
 
-        # Clean up extra whitespace
-        processed = re.sub(r'\s+', ' ', processed).strip()
+        Args:
+            text: Raw text to preprocess
 
-        return processed
+        Returns:
+            Preprocessed text optimized for ElevenLabs TTS
+        """
+        return preprocess_text(text)
 
     def get_usage_stats(self) -> Dict[str, Any]:
         """Get API usage statistics for this session."""
@@ -629,6 +895,7 @@ class ElevenLabsTTSPipeline:
             "session_duration_seconds": session_duration,
             "total_characters_processed": self.total_characters_processed,
             "total_api_calls": self.total_api_calls,
+            "total_cache_hits": self.total_cache_hits,
             "average_chars_per_call": (
                 self.total_characters_processed / self.total_api_calls
                 if self.total_api_calls > 0 else 0
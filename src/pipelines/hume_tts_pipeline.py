@@ -7,12 +7,15 @@ using the Hume AI API with advanced emotional prosody features.
 
 import logging
 import os
+import random
+import threading
 import time
 import re
-import base64
+import binascii
+import functools
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
-from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Any, Tuple, Union
+from dataclasses import dataclass, replace
 import json
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pydub import AudioSegment
@@ -20,18 +23,211 @@ from tqdm import tqdm
 
 # Hume AI imports
 from hume.client import HumeClient
-from hume.tts import PostedUtteranceVoiceWithName
+from hume.core.api_error import ApiError
+from hume.environment import HumeClientEnvironment
+from hume.tts import PostedUtterance, PostedUtteranceVoiceWithName
 
+from utils.audio_cache import AudioCache, DEFAULT_CACHE_ROOT
+from utils.audio_files import concatenate_mp3_files, link_or_copy
+from utils.audio_merge import ffmpeg_merge, join_segments, stream_merge
 from utils.config import TTSConfig
+from utils.http_client import HTTP_MAX_KEEPALIVE_CONNECTIONS, create_http_client
 from utils.logger import PerformanceLogger, ProgressLogger
+from utils.rate_limiter import TokenBucket, backoff_delay, retry_after_seconds
 from utils.secrets import load_secrets
 from ui.progress_tracker import (
-    ProgressTracker, PipelineType, EventType,
+    ProgressCoalescer, ProgressTracker, PipelineType, EventType,
     create_start_event, create_progress_event, create_complete_event, create_error_event
 )
 
 logger = logging.getLogger(__name__)
 
+HUME_HTTP_TIMEOUT = 60.0  # Hume SDK default
+
+# Timeout for the request that opens the first pooled connection
+WARMUP_TIMEOUT = 5.0
+
+# Write buffer for audio streamed from the API
+AUDIO_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# How API error status codes are handled by the retry logic
+API_ERROR_STATUS_KINDS = {
+    401: 'auth',
+    402: 'quota',
+    403: 'auth',
+    429: 'rate_limit',
+    503: 'rate_limit',
+}
+
+# Up to this fraction of a Retry-After delay is added at random, so threads
+# throttled together do not all retry at the same moment
+RETRY_AFTER_JITTER = 0.25
+
+# Chunks shorter than this are sent together with their neighbours in one
+# multi-utterance request, so per-request overhead is shared between them
+COALESCE_CHUNK_CHARS = 1000
+
+# Chapter splits and duration estimates remembered for repeated texts
+TEXT_CACHE_SIZE = 1024
+
+# Text processing markers, matched in a single pass and rewritten as plain
+# narration for Hume
+MARKER_PATTERN = re.compile(
+    r'\[(?:'
+    r'PAUSE: (?P<pause>[\d.]+)'
+    r'|EMPHASIS_(?:STRONG|MILD): (?P<emphasis>[^\]]+)'
+    r'|DIALOGUE_(?:START|END)'
+    r'|CHAPTER_START: (?P<chapter>[^\]]+)'
+    r'|IMAGE: (?P<image>[^\]]+)'
+    r')\]'
+)
+MARKER_TEMPLATES = {
+    'pause': ' ... ',  # Hume may support natural pauses
+    'emphasis': '{}',
+    'chapter': 'Chapter: {}. ',
+    'image': 'Image description: {}. ',
+}
+WHITESPACE_PATTERN = re.compile(r'\s+')
+SENTENCE_BOUNDARY_PATTERN = re.compile(r'(?<=[.!?])\s+')
+
+# Characters dropped from chapter titles used in file names: everything
+# but letters and digits (as str.isalnum), spaces, hyphens and underscores
+TITLE_UNSAFE_PATTERN = re.compile(r'[^\w \-]+')
+
+
+# Known Hume AI voices (as of Octave 2), built once for all pipelines
+HUME_VOICES = (
+    {
+        "voice_id": "male_english_actor",
+        "name": "Male English Actor",
+        "provider": "HUME_AI",
+        "description": "Professional male voice with natural emotional expression"
+    },
+    {
+        "voice_id": "female_english_actor",
+        "name": "Female English Actor",
+        "provider": "HUME_AI",
+        "description": "Professional female voice with natural emotional expression"
+    },
+    {
+        "voice_id": "male_american_narrator",
+        "name": "Male American Narrator",
+        "provider": "HUME_AI",
+        "description": "Clear male narration voice"
+    },
+    {
+        "voice_id": "female_american_narrator",
+        "name": "Female American Narrator",
+        "provider": "HUME_AI",
+        "description": "Clear female narration voice"
+    }
+)
+
+
+def render_marker(match: re.Match) -> str:
+    """Get the replacement text for a MARKER_PATTERN match."""
+    group = match.lastgroup
+    if group is None:
+        # Dialogue markers are dropped
+        return ''
+    return MARKER_TEMPLATES[group].format(match.group(group))
+
+
+def classify_api_error(error: Exception) -> str:
+    """
+    Classify a synthesis error to decide how to handle it.
+
+    API errors are classified by their HTTP status code. Other exceptions
+    fall back to matching the error message.
+
+    Args:
+        error: Exception raised by a synthesis request
+
+    Returns:
+        One of 'rate_limit', 'quota', 'auth', 'voice_not_found' or 'retry'
+    """
+    if isinstance(error, ApiError) and error.status_code is not None:
+        return API_ERROR_STATUS_KINDS.get(error.status_code, 'retry')
+
+    error_str = str(error).lower()
+    if "rate limit" in error_str or "too many requests" in error_str:
+        return 'rate_limit'
+    if "authentication" in error_str or "unauthorized" in error_str:
+        return 'auth'
+    if "quota" in error_str or "insufficient" in error_str:
+        return 'quota'
+    if "invalid voice" in error_str:
+        return 'voice_not_found'
+    return 'retry'
+
+
+@functools.lru_cache(maxsize=TEXT_CACHE_SIZE)
+def _split_text(text: str, max_chars: int) -> Tuple[str, ...]:
+    """
+    Split text into chunks of at most max_chars characters.
+
+    Results are cached, so re-processing a chapter does not split it again.
+
+    Args:
+        text: Text longer than max_chars
+        max_chars: Maximum characters per chunk
+
+    Returns:
+        Text chunks in reading order
+    """
+    # Chunks are collected as lists of pieces with their joined length,
+    # so each chunk is built with a single join instead of repeated
+    # string concatenation
+    chunks = []
+    current_parts: List[str] = []
+    current_len = 0
+
+    # Split by sentences first
+    sentences = SENTENCE_BOUNDARY_PATTERN.split(text)
+
+    for sentence in sentences:
+        if current_len + len(sentence) + 1 <= max_chars:
+            current_len += len(sentence) + (1 if current_parts else 0)
+            current_parts.append(sentence)
+        else:
+            if current_parts:
+                chunks.append(' '.join(current_parts).strip())
+                current_parts = [sentence]
+                current_len = len(sentence)
+            else:
+                # Handle very long sentences - split by words
+                temp_parts: List[str] = []
+                temp_len = 0
+                for word in sentence.split():
+                    if temp_len + len(word) + 1 <= max_chars:
+                        temp_len += len(word) + (1 if temp_parts else 0)
+                        temp_parts.append(word)
+                    else:
+                        if temp_parts:
+                            chunks.append(' '.join(temp_parts))
+                            temp_parts = [word]
+                            temp_len = len(word)
+                        else:
+                            # Truncate extremely long words
+                            chunks.append(word[:max_chars])
+                if temp_parts:
+                    current_parts = temp_parts
+                    current_len = temp_len
+
+    if current_parts:
+        chunks.append(' '.join(current_parts).strip())
+
+    return tuple(chunk for chunk in chunks if chunk.strip())
+
+
+@functools.lru_cache(maxsize=TEXT_CACHE_SIZE)
+def _estimate_duration(text: str) -> float:
+    """Estimate the audio duration of text in seconds, caching the result."""
+    # Average speaking rate is about 150-160 words per minute
+    words = len(text.split())
+    estimated_duration = (words / 150) * 60  # seconds
+    return max(estimated_duration, 0.5)  # Minimum 0.5 seconds
+
 
 @dataclass
 class HumeTTSResult:
@@ -44,6 +240,7 @@ class HumeTTSResult:
     processing_time: float = 0.0
     characters_processed: int = 0
     api_calls_made: int = 0
+    cache_hit: bool = False
 
 
 @dataclass
@@ -60,6 +257,11 @@ class HumeTTSConfig:
     retry_delay: float = 1.0
     rate_limit_delay: float = 2.0
     use_streaming: bool = False  # Use streaming API for long content
+    max_concurrency: int = 4  # Requests in flight when batch processing in parallel
+    requests_per_second: float = 2.0  # Request rate allowed by Hume; 0 disables pacing
+    coalesce_max_chars: int = 4500  # Characters of short chunks sent per request; 0 disables coalescing
+    cache_dir: Optional[str] = f"{DEFAULT_CACHE_ROOT}/hume"  # None disables the audio cache
+    cache_max_bytes: Optional[int] = 2 * 1024 ** 3  # LRU eviction beyond this; None for no limit
 
 
 class HumeTTSPipeline:
@@ -80,13 +282,22 @@ class HumeTTSPipeline:
         """
         self.progress_tracker = progress_tracker
         self.client = None
+        self.http_client = None
         self.config = config or self._load_default_config()
         self.is_initialized = False
 
         # API usage tracking
         self.total_characters_processed = 0
         self.total_api_calls = 0
+        self.total_cache_hits = 0
         self.session_start_time = time.time()
+        self._stats_lock = threading.Lock()
+
+        # Every API request, including retries, takes a token, so parallel
+        # batches never exceed the account's request rate
+        self.request_bucket = TokenBucket(self.config.requests_per_second)
+
+        self.cache = self._create_cache()
 
         logger.info("Initializing Hume TTS pipeline")
         self._initialize_client()
@@ -107,7 +318,15 @@ class HumeTTSPipeline:
     def _initialize_client(self) -> None:
         """Initialize the Hume client."""
         try:
-            self.client = HumeClient(api_key=self.config.api_key)
+            # One pooled HTTP client shared by all requests, so concurrent
+            # and consecutive chunks reuse open connections. Keep enough idle
+            # connections for every concurrent request, or the extras are
+            # closed and reopened for each chunk over HTTP/1.1
+            self.http_client = create_http_client(
+                timeout=HUME_HTTP_TIMEOUT,
+                max_keepalive_connections=max(HTTP_MAX_KEEPALIVE_CONNECTIONS, self.config.max_concurrency)
+            )
+            self.client = HumeClient(api_key=self.config.api_key, httpx_client=self.http_client)
 
             # Test the connection by attempting to list voices
             try:
@@ -126,44 +345,73 @@ class HumeTTSPipeline:
             logger.error(f"Failed to initialize Hume client: {e}")
             raise RuntimeError(f"Cannot initialize Hume TTS: {e}")
 
+        self._warm_up_connection()
+
+    def _warm_up_connection(self) -> None:
+        """
+        Open a pooled connection to the Hume API ahead of the first chunk.
+
+        The TCP and TLS handshakes then happen while the book is still being
+        prepared. Failures are ignored, the first request connects instead.
+        """
+        try:
+            self.http_client.head(HumeClientEnvironment.PROD.base, timeout=WARMUP_TIMEOUT)
+        except Exception as e:
+            logger.debug(f"Could not open a connection to the Hume API ahead of time: {e}")
+
+    def close(self) -> None:
+        """Close pooled HTTP connections and the audio cache index."""
+        if self.http_client is not None:
+            self.http_client.close()
+            self.http_client = None
+        if self.cache is not None:
+            self.cache.close()
+        self.client = None
+        self.is_initialized = False
+
+    def __enter__(self) -> "HumeTTSPipeline":
+        """Use the pipeline as a context manager that closes it on exit."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Release connections and the cache index."""
+        self.close()
+
+    def _create_cache(self) -> Optional[AudioCache]:
+        """Create the synthesized audio cache, if configured."""
+        if not self.config.cache_dir:
+            return None
+
+        try:
+            return AudioCache(self.config.cache_dir, extension=self.config.output_format,
+                              max_bytes=self.config.cache_max_bytes)
+        except OSError as e:
+            logger.warning(f"Hume audio cache disabled, cannot use {self.config.cache_dir}: {e}")
+            return None
+
+    def _cache_key(self, text: str) -> str:
+        """Build the audio cache key for text with the configured voice settings."""
+        return AudioCache.make_key(
+            text,
+            voice_name=self.config.voice_name,
+            voice_provider=self.config.voice_provider,
+            model_version=self.config.model_version,
+            output_format=self.config.output_format,
+            sample_rate=self.config.sample_rate
+        )
+
     def get_available_voices(self) -> List[Dict[str, str]]:
         """
         Get list of available voices from Hume AI.
 
         Note: Hume's voice options are more limited and embedded in the API.
-        This returns a static list of known voices.
+        This returns a static list of known voices. The voice dictionaries
+        are shared between calls and must not be modified.
         """
         if not self.is_initialized:
             return []
 
-        # Known Hume AI voices (as of Octave 2)
-        voices = [
-            {
-                "voice_id": "male_english_actor",
-                "name": "Male English Actor",
-                "provider": "HUME_AI",
-                "description": "Professional male voice with natural emotional expression"
-            },
-            {
-                "voice_id": "female_english_actor",
-                "name": "Female English Actor",
-                "provider": "HUME_AI",
-                "description": "Professional female voice with natural emotional expression"
-            },
-            {
-                "voice_id": "male_american_narrator",
-                "name": "Male American Narrator",
-                "provider": "HUME_AI",
-                "description": "Clear male narration voice"
-            },
-            {
-                "voice_id": "female_american_narrator",
-                "name": "Female American Narrator",
-                "provider": "HUME_AI",
-                "description": "Clear female narration voice"
-            }
-        ]
-        return voices
+        return list(HUME_VOICES)
 
     def chunk_text(self, text: str) -> List[str]:
         """
@@ -180,42 +428,15 @@ class HumeTTSPipeline:
         if len(text) <= max_chars:
             return [text]
 
-        chunks = []
-        current_chunk = ""
-
-        # Split by sentences first
-        sentences = re.split(r'(?<=[.!?])\s+', text)
-
-        for sentence in sentences:
-            if len(current_chunk) + len(sentence) + 1 <= max_chars:
-                current_chunk += " " + sentence if current_chunk else sentence
-            else:
-                if current_chunk:
-                    chunks.append(current_chunk.strip())
-                    current_chunk = sentence
-                else:
-                    # Handle very long sentences - split by words
-                    words = sentence.split()
-                    temp_chunk = ""
-                    for word in words:
-                        if len(temp_chunk) + len(word) + 1 <= max_chars:
-                            temp_chunk += " " + word if temp_chunk else word
-                        else:
-                            if temp_chunk:
-                                chunks.append(temp_chunk.strip())
-                                temp_chunk = word
-                            else:
-                                # Truncate extremely long words
-                                chunks.append(word[:max_chars])
-                    if temp_chunk:
-                        current_chunk = temp_chunk
+        return list(_split_text(text, max_chars))
 
-        if current_chunk:
-            chunks.append(current_chunk.strip())
-
-        return [chunk for chunk in chunks if chunk.strip()]
-
-    def process_chunk(self, text: str, output_path: str, chunk_id: str = "") -> HumeTTSResult:
+    def process_chunk(
+        self,
+        text: str,
+        output_path: Union[str, Path],
+        chunk_id: str = "",
+        preprocessed: bool = False
+    ) -> HumeTTSResult:
         """
         Process a single text chunk through Hume TTS.
 
@@ -223,10 +444,23 @@ class HumeTTSPipeline:
             text: Text to convert to speech
             output_path: Path for output audio file
             chunk_id: Optional identifier for this chunk
+            preprocessed: Whether text has already been through _preprocess_text
 
         Returns:
             HumeTTSResult with processing information
         """
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        return self._process_chunk(text, output_path, chunk_id, preprocessed)
+
+    def _process_chunk(
+        self,
+        text: str,
+        output_path: Path,
+        chunk_id: str,
+        preprocessed: bool
+    ) -> HumeTTSResult:
+        """Process a chunk whose output directory already exists."""
         if not self.is_initialized:
             return HumeTTSResult(
                 success=False,
@@ -246,7 +480,7 @@ class HumeTTSPipeline:
         try:
             with PerformanceLogger(f"Hume TTS chunk processing: {chunk_id}"):
                 # Preprocess text
-                processed_text = self._preprocess_text(text)
+                processed_text = text if preprocessed else self._preprocess_text(text)
 
                 if not processed_text.strip():
                     logger.warning(f"Empty text after preprocessing: {chunk_id}")
@@ -255,17 +489,28 @@ class HumeTTSPipeline:
                         error_message="Empty text after preprocessing"
                     )
 
-                # Generate audio with retry logic
-                if self.config.use_streaming:
-                    audio_data = self._synthesize_streaming_with_retry(processed_text)
-                else:
-                    audio_data = self._synthesize_with_retry(processed_text)
+                # Identical text with identical settings gives the same audio,
+                # so reuse it from the cache instead of calling the API
+                cache_key = self._cache_key(processed_text) if self.cache else None
+                cache_hit = cache_key is not None and self.cache.copy_to(cache_key, output_path)
+
+                file_size = None
+                if not cache_hit:
+                    # Generate audio with retry logic
+                    if self.config.use_streaming:
+                        # Streamed audio is written to the file as it arrives
+                        file_size = self._synthesize_streaming_with_retry(processed_text, output_path)
+                    else:
+                        audio_data = self._synthesize_with_retry(processed_text)
 
-                # Save audio file
-                output_path = Path(output_path)
-                output_path.parent.mkdir(parents=True, exist_ok=True)
+                        # Save audio file
+                        file_size = self._decode_and_save_audio(audio_data, output_path)
 
-                self._decode_and_save_audio(audio_data, output_path)
+                    if cache_key is not None:
+                        try:
+                            self.cache.put_file(cache_key, output_path)
+                        except OSError as e:
+                            logger.warning(f"Could not cache Hume audio: {e}")
 
                 # Calculate duration (estimate based on average speaking rate)
                 # Hume doesn't provide duration info directly, so we estimate
@@ -274,8 +519,11 @@ class HumeTTSPipeline:
                 processing_time = time.time() - start_time
 
                 # Update tracking
-                self.total_characters_processed += len(processed_text)
-                self.total_api_calls += 1
+                api_calls_made = 0 if cache_hit else 1
+                with self._stats_lock:
+                    self.total_characters_processed += len(processed_text)
+                    self.total_api_calls += api_calls_made
+                    self.total_cache_hits += int(cache_hit)
 
                 logger.debug(
                     f"Hume TTS chunk completed: {chunk_id} "
@@ -284,12 +532,17 @@ class HumeTTSPipeline:
 
                 # Emit completion event
                 if self.progress_tracker:
+                    if file_size is None:
+                        try:
+                            file_size = output_path.stat().st_size
+                        except FileNotFoundError:
+                            file_size = 0
                     self.progress_tracker.emit_event(create_complete_event(
                         PipelineType.TTS,
                         current_item=chunk_id or "Unknown chunk",
                         duration=estimated_duration,
                         processing_time=processing_time,
-                        file_size=output_path.stat().st_size if output_path.exists() else 0
+                        file_size=file_size
                     ))
 
                 return HumeTTSResult(
@@ -299,7 +552,8 @@ class HumeTTSPipeline:
                     text_processed=processed_text,
                     processing_time=processing_time,
                     characters_processed=len(processed_text),
-                    api_calls_made=1
+                    api_calls_made=api_calls_made,
+                    cache_hit=cache_hit
                 )
 
         except Exception as e:
@@ -322,60 +576,59 @@ class HumeTTSPipeline:
 
     def _synthesize_with_retry(self, text: str) -> bytes:
         """Generate audio with retry logic and rate limit handling (non-streaming)."""
-        last_exception = None
+        return self._request_with_retry(lambda: self._synthesize(text))
 
-        for attempt in range(self.config.max_retries):
-            try:
-                # Create voice object
-                voice = PostedUtteranceVoiceWithName(
-                    name=self.config.voice_name,
-                    provider=self.config.voice_provider
-                )
+    def _synthesize_utterances_with_retry(self, texts: List[str]) -> Optional[List[bytes]]:
+        """
+        Generate audio for several texts in one request, with retry logic.
 
-                # Call Hume TTS API
-                response = self.client.tts.synthesize_json(
-                    text=text,
-                    voice=voice,
-                    version=self.config.model_version,
-                    format=self.config.output_format.upper()
-                )
+        Args:
+            texts: Preprocessed texts, one utterance each
 
-                # Extract audio data from response
-                # Hume returns base64-encoded audio in the response
-                if hasattr(response, 'audio_data'):
-                    audio_base64 = response.audio_data
-                elif hasattr(response, 'data'):
-                    audio_base64 = response.data
-                elif isinstance(response, dict):
-                    audio_base64 = response.get('audio_data') or response.get('data')
-                else:
-                    # Try to access as attribute or dict
-                    try:
-                        audio_base64 = response.audio_data
-                    except AttributeError:
-                        audio_base64 = response['audio_data']
+        Returns:
+            Decoded audio of each text, or None if the response does not
+            hold exactly one snippet group per utterance
+        """
+        return self._request_with_retry(lambda: self._synthesize_utterances(texts))
 
-                return audio_base64
+    def _request_with_retry(self, request: Callable[[], Any]) -> Any:
+        """
+        Send an API request with retry logic and rate limit handling.
+
+        Every attempt takes a token from the request bucket first.
+
+        Args:
+            request: Function sending the request and returning its result
+
+        Returns:
+            Result of the first successful attempt
+        """
+        last_exception = None
+
+        for attempt in range(self.config.max_retries):
+            try:
+                self.request_bucket.acquire()
+                return request()
 
             except Exception as e:
                 last_exception = e
-                error_str = str(e).lower()
+                error_kind = classify_api_error(e)
 
-                if "rate limit" in error_str or "too many requests" in error_str:
-                    wait_time = self.config.rate_limit_delay * (2 ** attempt)
-                    logger.warning(f"Rate limit hit, waiting {wait_time}s (attempt {attempt + 1})")
+                if error_kind == 'rate_limit':
+                    wait_time = self._compute_backoff(e, attempt)
+                    logger.warning(f"Rate limit hit, waiting {wait_time:.1f}s (attempt {attempt + 1})")
                     time.sleep(wait_time)
                     continue
 
-                elif "authentication" in error_str or "unauthorized" in error_str:
+                elif error_kind == 'auth':
                     logger.error("Authentication failed - check API key")
                     raise
 
-                elif "quota" in error_str or "insufficient" in error_str:
+                elif error_kind == 'quota':
                     logger.error("API quota exceeded")
                     raise
 
-                elif "invalid voice" in error_str:
+                elif error_kind == 'voice_not_found':
                     logger.error(f"Invalid voice: {self.config.voice_name}")
                     raise
 
@@ -387,92 +640,203 @@ class HumeTTSPipeline:
 
         raise last_exception
 
-    def _synthesize_streaming_with_retry(self, text: str) -> bytes:
-        """Generate audio with retry logic using streaming API."""
-        last_exception = None
+    def _synthesize(self, text: str) -> Union[str, bytes]:
+        """Send one synthesis request for text and return its base64 audio."""
+        # Create voice object
+        voice = PostedUtteranceVoiceWithName(
+            name=self.config.voice_name,
+            provider=self.config.voice_provider
+        )
 
-        for attempt in range(self.config.max_retries):
+        # Call Hume TTS API
+        response = self.client.tts.synthesize_json(
+            text=text,
+            voice=voice,
+            version=self.config.model_version,
+            format=self.config.output_format.upper()
+        )
+
+        # Extract audio data from response
+        # Hume returns base64-encoded audio in the response
+        if hasattr(response, 'audio_data'):
+            audio_base64 = response.audio_data
+        elif hasattr(response, 'data'):
+            audio_base64 = response.data
+        elif isinstance(response, dict):
+            audio_base64 = response.get('audio_data') or response.get('data')
+        else:
+            # Try to access as attribute or dict
             try:
-                # Create voice object
-                voice = PostedUtteranceVoiceWithName(
-                    name=self.config.voice_name,
-                    provider=self.config.voice_provider
-                )
+                audio_base64 = response.audio_data
+            except AttributeError:
+                audio_base64 = response['audio_data']
 
-                # Call Hume TTS streaming API
-                audio_chunks = []
-
-                for chunk in self.client.tts.synthesize_json_streaming(
-                    text=text,
-                    voice=voice,
-                    version=self.config.model_version,
-                    format=self.config.output_format.upper()
-                ):
-                    # Each chunk contains base64 audio data
-                    if hasattr(chunk, 'audio_data'):
-                        audio_chunks.append(chunk.audio_data)
-                    elif hasattr(chunk, 'data'):
-                        audio_chunks.append(chunk.data)
-                    elif isinstance(chunk, dict):
-                        audio_chunks.append(chunk.get('audio_data') or chunk.get('data'))
-                    else:
-                        # Try to access as attribute
-                        audio_chunks.append(chunk.audio_data)
-
-                # Combine all chunks
-                # Since they're base64 encoded, we need to decode each, combine, then re-encode
-                combined_audio = b''
-                for chunk_data in audio_chunks:
-                    if isinstance(chunk_data, str):
-                        combined_audio += base64.b64decode(chunk_data)
-                    else:
-                        combined_audio += chunk_data
+        return audio_base64
 
-                # Return as base64 for consistency
-                return base64.b64encode(combined_audio).decode('utf-8')
+    def _synthesize_utterances(self, texts: List[str]) -> Optional[List[bytes]]:
+        """Send one multi-utterance synthesis request and split its audio by utterance."""
+        voice = PostedUtteranceVoiceWithName(
+            name=self.config.voice_name,
+            provider=self.config.voice_provider
+        )
 
-            except Exception as e:
-                last_exception = e
-                error_str = str(e).lower()
+        # With split_utterances off, Hume returns exactly one snippet group
+        # per utterance, holding that utterance's audio
+        response = self.client.tts.synthesize_json(
+            utterances=[PostedUtterance(text=text, voice=voice) for text in texts],
+            split_utterances=False,
+            version=self.config.model_version,
+            format=self.config.output_format.upper()
+        )
 
-                if "rate limit" in error_str or "too many requests" in error_str:
-                    wait_time = self.config.rate_limit_delay * (2 ** attempt)
-                    logger.warning(f"Rate limit hit, waiting {wait_time}s (attempt {attempt + 1})")
-                    time.sleep(wait_time)
-                    continue
+        generations = response.get('generations') if isinstance(response, dict) else response.generations
+        snippet_groups = generations[0].snippets if generations else []
+        if len(snippet_groups) != len(texts):
+            logger.warning(
+                f"Expected audio for {len(texts)} utterances, got {len(snippet_groups)}; "
+                f"synthesizing them one by one"
+            )
+            return None
 
-                elif "authentication" in error_str or "unauthorized" in error_str:
-                    logger.error("Authentication failed - check API key")
-                    raise
+        return [b''.join(binascii.a2b_base64(snippet.audio) for snippet in group) for group in snippet_groups]
 
-                else:
-                    logger.warning(f"Streaming attempt {attempt + 1} failed: {e}")
-                    if attempt == self.config.max_retries - 1:
+    def _synthesize_streaming_with_retry(self, text: str, output_path: Path) -> int:
+        """
+        Generate audio with retry logic using streaming API.
+
+        Each streamed chunk is decoded once and written straight to a .partial
+        sibling of the output file, which is renamed into place once complete,
+        so the whole audio is never held in memory.
+
+        Args:
+            text: Text to synthesize
+            output_path: Destination audio file
+
+        Returns:
+            Size of the written file in bytes
+        """
+        last_exception = None
+        partial_path = output_path.with_name(output_path.name + '.partial')
+
+        try:
+            for attempt in range(self.config.max_retries):
+                try:
+                    # Create voice object
+                    voice = PostedUtteranceVoiceWithName(
+                        name=self.config.voice_name,
+                        provider=self.config.voice_provider
+                    )
+
+                    # Call Hume TTS streaming API
+                    self.request_bucket.acquire()
+                    stream = self.client.tts.synthesize_json_streaming(
+                        text=text,
+                        voice=voice,
+                        version=self.config.model_version,
+                        format=self.config.output_format.upper()
+                    )
+
+                    with open(partial_path, 'wb', buffering=AUDIO_WRITE_BUFFER_SIZE) as f:
+                        for chunk in stream:
+                            # Each chunk contains base64 audio data, padded on its
+                            # own, so chunks are decoded one by one rather than joined
+                            if hasattr(chunk, 'audio_data'):
+                                chunk_data = chunk.audio_data
+                            elif hasattr(chunk, 'data'):
+                                chunk_data = chunk.data
+                            elif isinstance(chunk, dict):
+                                chunk_data = chunk.get('audio_data') or chunk.get('data')
+                            else:
+                                # Try to access as attribute
+                                chunk_data = chunk.audio_data
+
+                            # a2b_base64 decodes ASCII text directly, without the
+                            # bytes copy b64decode makes first
+                            f.write(binascii.a2b_base64(chunk_data) if isinstance(chunk_data, str) else chunk_data)
+                        file_size = f.tell()
+
+                    os.replace(partial_path, output_path)
+                    logger.debug(f"Saved audio to {output_path} ({file_size} bytes)")
+                    return file_size
+
+                except Exception as e:
+                    last_exception = e
+                    error_kind = classify_api_error(e)
+
+                    if error_kind == 'rate_limit':
+                        wait_time = self._compute_backoff(e, attempt)
+                        logger.warning(f"Rate limit hit, waiting {wait_time:.1f}s (attempt {attempt + 1})")
+                        time.sleep(wait_time)
+                        continue
+
+                    elif error_kind == 'auth':
+                        logger.error("Authentication failed - check API key")
                         raise
-                    time.sleep(self.config.retry_delay * (attempt + 1))
 
-        raise last_exception
+                    else:
+                        logger.warning(f"Streaming attempt {attempt + 1} failed: {e}")
+                        if attempt == self.config.max_retries - 1:
+                            raise
+                        time.sleep(self.config.retry_delay * (attempt + 1))
+
+            raise last_exception
+        except BaseException:
+            partial_path.unlink(missing_ok=True)
+            raise
 
-    def _decode_and_save_audio(self, base64_audio: Union[str, bytes], output_path: Path) -> None:
+    def _compute_backoff(self, error: Exception, attempt: int) -> float:
+        """
+        Work out how long to wait after a rate limit error.
+
+        Honors the Retry-After header of the response, plus some jitter,
+        and otherwise backs off exponentially from rate_limit_delay.
+
+        Args:
+            error: Rate limit error raised by the request
+            attempt: Zero-based number of the attempt that failed
+
+        Returns:
+            Seconds to wait before the next attempt
+        """
+        wait_time = retry_after_seconds(getattr(error, 'headers', None))
+        if wait_time is None:
+            return backoff_delay(attempt, self.config.rate_limit_delay)
+        return wait_time + random.uniform(0, RETRY_AFTER_JITTER * wait_time)
+
+    def _decode_and_save_audio(self, base64_audio: Union[str, bytes], output_path: Path) -> int:
         """
         Decode base64 audio data and save to file.
 
+        The audio goes to a .partial sibling that is renamed into place, so
+        an output linked to a cache entry is replaced rather than rewritten
+        in place, and a failed write never leaves a truncated output file.
+
         Args:
             base64_audio: Base64 encoded audio data
             output_path: Path to save the audio file
+
+        Returns:
+            Size of the written file in bytes
         """
         try:
-            # Decode base64 audio
+            # Decode base64 audio in a single call
             if isinstance(base64_audio, str):
-                audio_bytes = base64.b64decode(base64_audio)
+                audio_bytes = binascii.a2b_base64(base64_audio)
             else:
                 audio_bytes = base64_audio
 
             # Write to file
-            with open(output_path, 'wb') as f:
-                f.write(audio_bytes)
+            partial_path = output_path.with_name(output_path.name + '.partial')
+            try:
+                with open(partial_path, 'wb') as f:
+                    f.write(audio_bytes)
+                os.replace(partial_path, output_path)
+            except BaseException:
+                partial_path.unlink(missing_ok=True)
+                raise
 
             logger.debug(f"Saved audio to {output_path} ({len(audio_bytes)} bytes)")
+            return len(audio_bytes)
 
         except Exception as e:
             logger.error(f"Failed to decode and save audio: {e}")
@@ -480,16 +844,13 @@ class HumeTTSPipeline:
 
     def _estimate_audio_duration(self, text: str) -> float:
         """Estimate audio duration based on text length."""
-        # Average speaking rate is about 150-160 words per minute
-        words = len(text.split())
-        estimated_duration = (words / 150) * 60  # seconds
-        return max(estimated_duration, 0.5)  # Minimum 0.5 seconds
+        return _estimate_duration(text)
 
     def batch_process(
         self,
         text_chunks: List[Dict[str, str]],
         output_dir: Path,
-        parallel: bool = False  # Hume rate limits make parallel risky
+        parallel: bool = True
     ) -> List[HumeTTSResult]:
         """
         Process multiple text chunks with progress tracking.
@@ -497,7 +858,8 @@ class HumeTTSPipeline:
         Args:
             text_chunks: List of dictionaries with 'text' and 'id' keys
             output_dir: Output directory for audio files
-            parallel: Whether to use parallel processing (not recommended for Hume)
+            parallel: Whether to send up to max_concurrency requests at once;
+                requests are paced to requests_per_second either way
 
         Returns:
             List of HumeTTSResult objects
@@ -517,34 +879,65 @@ class HumeTTSPipeline:
                 current_item=f"Batch processing {len(text_chunks)} chunks"
             ))
 
-        results = []
+        results: List[Optional[HumeTTSResult]] = [None] * len(text_chunks)
+        completed = 0
         progress = ProgressLogger("Hume TTS processing", len(text_chunks))
-
-        # Sequential processing is recommended for Hume due to rate limits
+        progress_events = ProgressCoalescer(len(text_chunks))
+
+        # Identical text with identical settings gives identical audio, so
+        # each distinct chunk is synthesized once and shared with its repeats
+        texts = []
+        chunk_ids = []
+        output_paths = []
+        groups: Dict[str, List[int]] = {}
         for i, chunk in enumerate(text_chunks):
-            chunk_id = chunk.get('id', f"chunk_{i}")
-            output_path = output_dir / f"{chunk_id}.{self.config.output_format}"
+            text = self._preprocess_text(chunk['text'])
+            texts.append(text)
+            chunk_ids.append(chunk.get('id', f"chunk_{i}"))
+            output_paths.append(output_dir / f"{chunk_ids[i]}.{self.config.output_format}")
+            groups.setdefault(text, []).append(i)
+
+        if len(groups) < len(text_chunks):
+            logger.info(f"Synthesizing {len(groups)} distinct chunks for {len(text_chunks)} chunks")
+
+        max_workers = max(1, self.config.max_concurrency) if parallel else 1
+
+        # Short chunks next to each other are synthesized in shared requests
+        group_list = list(groups.values())
+        batches = self._coalesce_chunks([texts[indices[0]] for indices in group_list])
+        if len(batches) < len(group_list):
+            logger.info(f"Sending {len(group_list)} distinct chunks in {len(batches)} requests")
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, max(1, len(batches)))) as executor:
+            future_to_groups = {}
+            for batch in batches:
+                firsts = [group_list[position][0] for position in batch]
+                future = executor.submit(
+                    self._process_utterances,
+                    [texts[first] for first in firsts],
+                    [output_paths[first] for first in firsts],
+                    [chunk_ids[first] for first in firsts]
+                )
+                future_to_groups[future] = [group_list[position] for position in batch]
 
-            result = self.process_chunk(
-                chunk['text'],
-                str(output_path),
-                chunk_id
-            )
-            results.append(result)
-            progress.update()
+            for future in as_completed(future_to_groups):
+                for indices, result in zip(future_to_groups[future], future.result()):
+                    results[indices[0]] = result
+                    for index in indices[1:]:
+                        results[index] = self._share_result(result, output_paths[index])
 
-            # Emit progress event
-            if self.progress_tracker:
-                self.progress_tracker.emit_event(create_progress_event(
-                    PipelineType.TTS,
-                    completed_items=len(results),
-                    total_items=len(text_chunks),
-                    current_item=f"Processed {len(results)}/{len(text_chunks)} chunks"
-                ))
+                    completed += len(indices)
+                    progress.update(len(indices))
 
-            # Small delay between requests to respect rate limits
-            if i < len(text_chunks) - 1:  # Don't delay after last chunk
-                time.sleep(0.5)
+                # Emit progress event, skipping updates that come in too fast
+                # to be seen
+                if self.progress_tracker and progress_events.should_emit(completed):
+                    self.progress_tracker.emit_event(create_progress_event(
+                        PipelineType.TTS,
+                        completed_items=completed,
+                        total_items=len(text_chunks),
+                        current_item=f"Processed {completed}/{len(text_chunks)} chunks"
+                    ))
 
         progress.finish()
 
@@ -561,6 +954,165 @@ class HumeTTSPipeline:
 
         return results
 
+    def _coalesce_chunks(self, texts: List[str]) -> List[List[int]]:
+        """
+        Group consecutive short texts into shared synthesis requests.
+
+        Texts of at least COALESCE_CHUNK_CHARS characters, and texts whose
+        audio is already cached, get a request of their own.
+
+        Args:
+            texts: Preprocessed texts in reading order
+
+        Returns:
+            Lists of text positions, one list per request
+        """
+        max_chars = self.config.coalesce_max_chars
+        if max_chars <= 0:
+            return [[i] for i in range(len(texts))]
+
+        batches = []
+        current: List[int] = []
+        current_chars = 0
+        for i, text in enumerate(texts):
+            # Probe the cache file directly: a lookup would record an access
+            # in the cache index, and the chunk is looked up again when
+            # it is synthesized
+            if len(text) >= COALESCE_CHUNK_CHARS or (
+                self.cache is not None and self.cache.path_for(self._cache_key(text)).exists()
+            ):
+                if current:
+                    batches.append(current)
+                    current, current_chars = [], 0
+                batches.append([i])
+                continue
+
+            if current and current_chars + len(text) > max_chars:
+                batches.append(current)
+                current, current_chars = [], 0
+            current.append(i)
+            current_chars += len(text)
+
+        if current:
+            batches.append(current)
+        return batches
+
+    def _process_utterances(
+        self,
+        texts: List[str],
+        output_paths: List[Path],
+        chunk_ids: List[str]
+    ) -> List[HumeTTSResult]:
+        """
+        Synthesize several preprocessed chunks with one multi-utterance request.
+
+        Falls back to a request per chunk if the shared request fails or
+        its audio cannot be matched to the chunks.
+
+        Args:
+            texts: Preprocessed texts, each shorter than the API limit
+            output_paths: Output file of each chunk
+            chunk_ids: Identifier of each chunk
+
+        Returns:
+            HumeTTSResult of each chunk, in the given order
+        """
+        if len(texts) == 1:
+            return [self._process_chunk(texts[0], output_paths[0], chunk_ids[0], True)]
+
+        start_time = time.time()
+        try:
+            with PerformanceLogger(f"Hume TTS multi-utterance processing: {len(texts)} chunks"):
+                audio = self._synthesize_utterances_with_retry(texts)
+        except Exception as e:
+            logger.warning(f"Multi-utterance request failed, synthesizing {len(texts)} chunks one by one: {e}")
+            audio = None
+
+        if audio is None:
+            return [
+                self._process_chunk(text, output_path, chunk_id, True)
+                for text, output_path, chunk_id in zip(texts, output_paths, chunk_ids)
+            ]
+
+        processing_time = time.time() - start_time
+        with self._stats_lock:
+            self.total_characters_processed += sum(len(text) for text in texts)
+            self.total_api_calls += 1
+
+        results = []
+        api_call_counted = False
+        for text, output_path, chunk_id, audio_bytes in zip(texts, output_paths, chunk_ids, audio):
+            try:
+                self._decode_and_save_audio(audio_bytes, output_path)
+            except OSError as e:
+                results.append(HumeTTSResult(
+                    success=False,
+                    error_message=f"Hume TTS processing failed for chunk {chunk_id}: {e}",
+                    processing_time=processing_time
+                ))
+                continue
+
+            if self.cache is not None:
+                try:
+                    self.cache.put_file(self._cache_key(text), output_path)
+                except OSError as e:
+                    logger.warning(f"Could not cache Hume audio: {e}")
+
+            estimated_duration = self._estimate_audio_duration(text)
+            if self.progress_tracker:
+                self.progress_tracker.emit_event(create_complete_event(
+                    PipelineType.TTS,
+                    current_item=chunk_id or "Unknown chunk",
+                    duration=estimated_duration,
+                    processing_time=processing_time,
+                    file_size=len(audio_bytes)
+                ))
+
+            results.append(HumeTTSResult(
+                success=True,
+                audio_path=str(output_path),
+                duration=estimated_duration,
+                text_processed=text,
+                processing_time=processing_time,
+                characters_processed=len(text),
+                # The shared request is counted once, on the first saved chunk
+                api_calls_made=0 if api_call_counted else 1
+            ))
+            api_call_counted = True
+
+        return results
+
+    def _share_result(self, result: HumeTTSResult, output_path: Path) -> HumeTTSResult:
+        """
+        Reuse the audio of a synthesized chunk for a chunk with the same text.
+
+        Args:
+            result: Result of the chunk that was synthesized
+            output_path: Output path of the repeated chunk
+
+        Returns:
+            Result for the repeated chunk, which made no API calls
+        """
+        if not result.success:
+            return result
+
+        try:
+            link_or_copy(result.audio_path, output_path)
+        except OSError as e:
+            return HumeTTSResult(
+                success=False,
+                error_message=f"Could not copy audio of a repeated chunk: {e}"
+            )
+
+        return replace(
+            result,
+            audio_path=str(output_path),
+            processing_time=0.0,
+            characters_processed=0,
+            api_calls_made=0,
+            cache_hit=True
+        )
+
     def merge_audio_files(
         self,
         audio_files: List[str],
@@ -585,24 +1137,46 @@ class HumeTTSPipeline:
                 logger.warning("No audio files to merge")
                 return False
 
-            # Load first audio file
-            combined = AudioSegment.from_file(audio_files[0])
-
-            # Add remaining files with crossfade
-            for audio_file in audio_files[1:]:
-                if not Path(audio_file).exists():
+            existing_files = []
+            for audio_file in audio_files:
+                if Path(audio_file).exists():
+                    existing_files.append(audio_file)
+                else:
                     logger.warning(f"Audio file not found: {audio_file}")
-                    continue
 
-                next_audio = AudioSegment.from_file(audio_file)
-
-                if crossfade_ms > 0:
-                    combined = combined.append(next_audio, crossfade=crossfade_ms)
-                else:
-                    combined = combined + next_audio
+            if not existing_files:
+                return False
 
-            # Export merged audio
             output_path = Path(output_path)
+            export_mp3 = self.config.output_format.lower() != 'wav'
+
+            if export_mp3:
+                # MP3 chunks from the API can be joined frame by frame, avoiding
+                # a decode and a lossy second encode
+                if crossfade_ms <= 0 and all(Path(f).suffix.lower() == '.mp3' for f in existing_files):
+                    concatenate_mp3_files(existing_files, output_path)
+                    logger.info(f"Hume audio merge completed without re-encoding: {output_path}")
+                    return True
+
+                # Let ffmpeg stream the files when it is installed
+                if ffmpeg_merge(existing_files, output_path, crossfade_ms):
+                    logger.info(f"Hume audio merge completed with ffmpeg: {output_path}")
+                    return True
+
+            # Without ffmpeg, stream the files in blocks through soundfile so
+            # memory use does not grow with the length of the book
+            if stream_merge(existing_files, output_path, crossfade_ms,
+                            output_format='MP3' if export_mp3 else 'WAV'):
+                logger.info(f"Hume audio merge completed with soundfile: {output_path}")
+                return True
+
+            # Last resort: decode the files in parallel (each decode runs in
+            # its own ffmpeg process) and join the PCM data in a single buffer
+            with ThreadPoolExecutor(max_workers=min(len(existing_files), os.cpu_count() or 1)) as executor:
+                segments = list(executor.map(AudioSegment.from_file, existing_files))
+            combined = join_segments(segments, crossfade_ms)
+            del segments
+
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
             # Export based on format
@@ -650,8 +1224,7 @@ class HumeTTSPipeline:
             chapter_content = chapter['content']
 
             # Clean title for filename
-            clean_title = "".join(c for c in chapter_title if c.isalnum() or c in ' -_')
-            clean_title = clean_title.replace(' ', '_')[:20]
+            clean_title = TITLE_UNSAFE_PATTERN.sub('', chapter_title).replace(' ', '_')[:20]
 
             # Split long chapters into smaller chunks
             content_chunks = self.chunk_text(chapter_content)
@@ -673,7 +1246,7 @@ class HumeTTSPipeline:
 
         # Process all chunks
         chapter_dir = output_dir / "chapters"
-        results = self.batch_process(text_chunks, chapter_dir, parallel=False)
+        results = self.batch_process(text_chunks, chapter_dir)
 
         # Collect successful audio files
         successful_results = [r for r in results if r.success]
@@ -713,6 +1286,10 @@ class HumeTTSPipeline:
             f"{session_duration:.1f}s session time"
         )
 
+        # The memoized texts belong to this book, so release them
+        _split_text.cache_clear()
+        _estimate_duration.cache_clear()
+
         return processing_summary
 
     def _preprocess_text(self, text: str) -> str:
@@ -725,29 +1302,9 @@ class HumeTTSPipeline:
         Returns:
             Preprocessed text optimized for Hume TTS
         """
-        processed = text
-
-        # Handle pause markers (Hume may support natural pauses)
-        processed = re.sub(r'\[PAUSE: ([\d.]+)\]', r' ... ', processed)
-
-        # Handle emphasis markers (convert to natural text emphasis)
-        processed = re.sub(r'\[EMPHASIS_STRONG: ([^\]]+)\]', r'\1', processed)
-        processed = re.sub(r'\[EMPHASIS_MILD: ([^\]]+)\]', r'\1', processed)
-
-        # Handle dialogue markers
-        processed = re.sub(r'\[DIALOGUE_START\]', '', processed)
-        processed = re.sub(r'\[DIALOGUE_END\]', '', processed)
-
-        # Handle chapter markers
-        processed = re.sub(r'\[CHAPTER_START: ([^\]]+)\]', r'Chapter: \1. ', processed)
-
-        # Handle image descriptions
-        processed = re.sub(r'\[IMAGE: ([^\]]+)\]', r'Image description: \1. ', processed)
-
-        # Clean up extra whitespace
-        processed = re.sub(r'\s+', ' ', processed).strip()
-
-        return processed
+        # Replace all TTS markers in one scan, then clean up extra whitespace
+        processed = MARKER_PATTERN.sub(render_marker, text)
+        return WHITESPACE_PATTERN.sub(' ', processed).strip()
 
     def get_usage_stats(self) -> Dict[str, Any]:
         """Get API usage statistics for this session."""
@@ -757,6 +1314,7 @@ class HumeTTSPipeline:
             "session_duration_seconds": session_duration,
             "total_characters_processed": self.total_characters_processed,
             "total_api_calls": self.total_api_calls,
+            "total_cache_hits": self.total_cache_hits,
             "average_chars_per_call": (
                 self.total_characters_processed / self.total_api_calls
                 if self.total_api_calls > 0 else 0
@@ -5,14 +5,19 @@ This module provides image description generation using local Vision-Language Mo
 for EPUB images with context-aware descriptions optimized for TTS.
 """
 
+import atexit
 import logging
 import hashlib
 import json
+import os
+import re
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Set, Tuple
+from dataclasses import dataclass, replace
 import time
 import pickle
+import sqlite3
+import threading
 
 from PIL import Image
 import numpy as np
@@ -26,6 +31,86 @@ from ui.progress_tracker import (
 
 logger = logging.getLogger(__name__)
 
+# Bytes read at a time when hashing image files
+HASH_BLOCK_SIZE = 1 << 20
+
+# Version of the cache key scheme; cached entries from other versions are dropped
+CACHE_KEY_VERSION = 2
+
+CACHE_DB_FILENAME = "cache.db"
+
+# Descriptions held in memory before they are written to the cache database
+CACHE_FLUSH_EVERY = 32
+
+# Context words hinting at what an image shows, one named group per category
+CONTEXT_HINT_PATTERN = re.compile(
+    r'\b(?:(?P<people>person|people|man|woman)|(?P<building>building|house|city)'
+    r'|(?P<nature>nature|tree|forest|mountain)|(?P<chart>chart|graph|diagram))s?\b',
+    re.IGNORECASE
+)
+
+# Description suffix per context category, in order of precedence
+CONTEXT_HINTS = {
+    'people': " showing people",
+    'building': " of a building or structure",
+    'nature': " of a natural scene",
+    'chart': " containing a chart or diagram",
+}
+
+# Index of the previous cache layout, one pickle file per description
+LEGACY_INDEX_FILENAME = "cache_index.json"
+
+
+def _fingerprint(digest_size: int = 8) -> "hashlib.blake2b":
+    """Create the hash used for cache keys, which need not be cryptographic."""
+    return hashlib.blake2b(digest_size=digest_size)
+
+
+def _hash_file(image_path: str) -> str:
+    """
+    Hash the contents of a file without reading it into memory at once.
+
+    Args:
+        image_path: Path to the file
+
+    Returns:
+        Hex digest of the file contents
+    """
+    with open(image_path, 'rb', buffering=0) as f:
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, _fingerprint).hexdigest()
+
+        # Python 3.10 has no file_digest, so read into a reused buffer
+        digest = _fingerprint()
+        buffer = bytearray(HASH_BLOCK_SIZE)
+        view = memoryview(buffer)
+        while size := f.readinto(buffer):
+            digest.update(view[:size])
+        return digest.hexdigest()
+
+
+def _dominant_color(image: Image.Image) -> Optional[Tuple[int, int, int]]:
+    """
+    Find the most frequent color of an RGB image.
+
+    Pixels are packed into 24-bit integers and counted with NumPy instead
+    of building a Python list of every distinct color.
+
+    Args:
+        image: RGB image
+
+    Returns:
+        Most frequent (r, g, b) color, or None for an empty image
+    """
+    pixels = np.asarray(image, dtype=np.uint8).reshape(-1, 3).astype(np.uint32)
+    if not len(pixels):
+        return None
+
+    packed = (pixels[:, 0] << 16) | (pixels[:, 1] << 8) | pixels[:, 2]
+    colors, counts = np.unique(packed, return_counts=True)
+    color = int(colors[counts.argmax()])
+    return (color >> 16) & 0xFF, (color >> 8) & 0xFF, color & 0xFF
+
 
 @dataclass
 class ImageDescription:
@@ -52,112 +137,212 @@ class ImageProcessingResult:
 
 
 class ImageDescriptionCache:
-    """Cache for image descriptions to avoid reprocessing."""
+    """
+    Cache for image descriptions to avoid reprocessing.
+
+    Descriptions are stored in a single SQLite database in WAL mode, so
+    caching one costs a single row write rather than a file per entry and
+    a rewrite of a JSON index.
 
-    def __init__(self, cache_dir: Path):
+    The keys of all descriptions are held in memory, so looking up an image
+    that was never described does not query the database. Descriptions
+    added by other processes after the cache was opened are not seen.
+
+    Images are identified by path, size and modification time, which change
+    whenever the file is rewritten, so a lookup costs one stat call. With
+    hash_contents the file contents are hashed instead, which also matches
+    copies of an image under other paths.
+    """
+
+    def __init__(self, cache_dir: Path, hash_contents: bool = False):
         """Initialize cache."""
         self.cache_dir = cache_dir
+        self.hash_contents = hash_contents
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.cache_index_file = cache_dir / "cache_index.json"
-        self.cache_index = self._load_cache_index()
+        self.db_path = cache_dir / CACHE_DB_FILENAME
+        self._lock = threading.Lock()
+        self._connection = self._connect()
+        self._remove_legacy_files()
+
+        # Rows not yet written, by cache key
+        self._pending: Dict[str, Tuple] = {}
+
+        # Keys of all cached descriptions, so misses need no database query
+        self._keys = self._load_keys()
+        atexit.register(self.flush)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the cache database, dropping entries with outdated keys."""
+        connection = sqlite3.connect(self.db_path, timeout=5.0, isolation_level=None, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS descriptions "
+            "(key TEXT PRIMARY KEY, description BLOB NOT NULL, timestamp REAL NOT NULL, "
+            "image_path TEXT NOT NULL, description_length INTEGER NOT NULL)"
+        )
+        connection.execute("CREATE INDEX IF NOT EXISTS descriptions_timestamp ON descriptions (timestamp)")
+
+        if connection.execute("PRAGMA user_version").fetchone()[0] != CACHE_KEY_VERSION:
+            dropped = connection.execute("DELETE FROM descriptions").rowcount
+            connection.execute(f"PRAGMA user_version = {CACHE_KEY_VERSION}")
+            if dropped:
+                logger.info(f"Dropped {dropped} cache entries with outdated keys")
+        return connection
+
+    def _load_keys(self) -> Set[str]:
+        """Read the keys of all stored descriptions."""
+        return {key for key, in self._connection.execute("SELECT key FROM descriptions")}
+
+    def _remove_legacy_files(self) -> None:
+        """Remove entries left by the pickle file and JSON index cache layout."""
+        legacy_index_file = self.cache_dir / LEGACY_INDEX_FILENAME
+        if not legacy_index_file.exists():
+            return
 
-    def _load_cache_index(self) -> Dict[str, Any]:
-        """Load cache index from disk."""
-        if self.cache_index_file.exists():
-            try:
-                with open(self.cache_index_file, 'r') as f:
-                    return json.load(f)
-            except Exception as e:
-                logger.warning(f"Failed to load cache index: {e}")
-        return {}
-
-    def _save_cache_index(self) -> None:
-        """Save cache index to disk."""
         try:
-            with open(self.cache_index_file, 'w') as f:
-                json.dump(self.cache_index, f, indent=2)
+            with open(legacy_index_file, 'r') as f:
+                index = json.load(f)
+            # Indexes without a version map keys directly to entries
+            keys = list(index.get('entries', {}) if 'version' in index else index)
         except Exception as e:
-            logger.warning(f"Failed to save cache index: {e}")
+            logger.warning(f"Failed to read legacy cache index: {e}")
+            keys = []
+
+        for key in keys:
+            (self.cache_dir / f"{key}.pkl").unlink(missing_ok=True)
+        legacy_index_file.unlink(missing_ok=True)
+        logger.info(f"Removed {len(keys)} cache entries in the legacy file format")
 
     def _generate_cache_key(self, image_path: str, context: str) -> str:
         """Generate cache key from image and context."""
         # Use image file hash + context hash
         try:
-            with open(image_path, 'rb') as f:
-                image_data = f.read()
-            image_hash = hashlib.md5(image_data).hexdigest()[:16]
+            if self.hash_contents:
+                image_hash = _hash_file(image_path)
+            else:
+                st = os.stat(image_path)
+                identity = f"{st.st_size}:{st.st_mtime_ns}:{os.path.abspath(image_path)}"
+                image_hash = hashlib.blake2b(identity.encode(), digest_size=8).hexdigest()
         except Exception:
             # Fallback to path-based hash
-            image_hash = hashlib.md5(image_path.encode()).hexdigest()[:16]
+            image_hash = hashlib.blake2b(image_path.encode(), digest_size=8).hexdigest()
 
-        context_hash = hashlib.md5(context.encode()).hexdigest()[:8]
+        context_hash = hashlib.blake2b(context.encode(), digest_size=4).hexdigest()
         return f"{image_hash}_{context_hash}"
 
     def get(self, image_path: str, context: str = "") -> Optional[ImageDescription]:
         """Get cached description if available."""
         cache_key = self._generate_cache_key(image_path, context)
 
-        if cache_key in self.cache_index:
-            cache_file = self.cache_dir / f"{cache_key}.pkl"
-            if cache_file.exists():
-                try:
-                    with open(cache_file, 'rb') as f:
-                        description = pickle.load(f)
-                    description.cache_hit = True
-                    logger.debug(f"Cache hit for image: {Path(image_path).name}")
-                    return description
-                except Exception as e:
-                    logger.warning(f"Failed to load cached description: {e}")
-                    # Remove invalid cache entry
-                    del self.cache_index[cache_key]
-                    cache_file.unlink(missing_ok=True)
+        try:
+            with self._lock:
+                if cache_key not in self._keys:
+                    return None
+                row = self._pending.get(cache_key) or self._connection.execute(
+                    "SELECT key, description FROM descriptions WHERE key = ?", (cache_key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to look up cached description: {e}")
+            return None
+
+        if row is None:
+            return None
 
-        return None
+        try:
+            description = pickle.loads(row[1])
+        except Exception as e:
+            logger.warning(f"Failed to load cached description: {e}")
+            # Remove invalid cache entry
+            try:
+                with self._lock:
+                    self._keys.discard(cache_key)
+                    self._pending.pop(cache_key, None)
+                    self._connection.execute("DELETE FROM descriptions WHERE key = ?", (cache_key,))
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to remove invalid cached description: {e}")
+            return None
+
+        description.cache_hit = True
+        logger.debug(f"Cache hit for image: {Path(image_path).name}")
+        return description
 
     def set(self, image_path: str, context: str, description: ImageDescription) -> None:
-        """Cache image description."""
+        """
+        Cache image description.
+
+        Descriptions are written to the database in batches of
+        CACHE_FLUSH_EVERY, and when flush or close is called.
+        """
         cache_key = self._generate_cache_key(image_path, context)
-        cache_file = self.cache_dir / f"{cache_key}.pkl"
 
         try:
-            with open(cache_file, 'wb') as f:
-                pickle.dump(description, f)
-
-            self.cache_index[cache_key] = {
-                'image_path': Path(image_path).name,  # Store only filename for privacy
-                'timestamp': time.time(),
-                'description_length': len(description.description)
-            }
-
-            self._save_cache_index()
+            data = pickle.dumps(description, protocol=pickle.HIGHEST_PROTOCOL)
+            with self._lock:
+                self._keys.add(cache_key)
+                self._pending[cache_key] = (
+                    cache_key,
+                    data,
+                    time.time(),
+                    Path(image_path).name,  # Store only filename for privacy
+                    len(description.description)
+                )
+                if len(self._pending) >= CACHE_FLUSH_EVERY:
+                    self._write_pending()
             logger.debug(f"Cached description for image: {Path(image_path).name}")
 
         except Exception as e:
             logger.warning(f"Failed to cache description: {e}")
 
+    def flush(self) -> None:
+        """Write descriptions cached since the last flush to the database."""
+        with self._lock:
+            self._write_pending()
+
+    def _write_pending(self) -> None:
+        """Write pending rows in one transaction; the lock must be held."""
+        if not self._pending:
+            return
+
+        rows = list(self._pending.values())
+        self._pending.clear()
+        try:
+            self._connection.execute("BEGIN")
+            self._connection.executemany("INSERT OR REPLACE INTO descriptions VALUES (?, ?, ?, ?, ?)", rows)
+            self._connection.execute("COMMIT")
+        except sqlite3.Error as e:
+            if self._connection.in_transaction:
+                self._connection.execute("ROLLBACK")
+            logger.warning(f"Failed to write {len(rows)} cached descriptions: {e}")
+
     def clear_old_entries(self, max_age_days: int = 30) -> None:
         """Clear cache entries older than specified days."""
-        current_time = time.time()
         max_age_seconds = max_age_days * 24 * 3600
 
-        old_keys = []
-        for key, entry in self.cache_index.items():
-            if current_time - entry.get('timestamp', 0) > max_age_seconds:
-                old_keys.append(key)
+        with self._lock:
+            cleared = self._connection.execute(
+                "DELETE FROM descriptions WHERE timestamp < ?", (time.time() - max_age_seconds,)
+            ).rowcount
+            if cleared:
+                self._keys = self._load_keys() | self._pending.keys()
 
-        for key in old_keys:
-            cache_file = self.cache_dir / f"{key}.pkl"
-            cache_file.unlink(missing_ok=True)
-            del self.cache_index[key]
+        if cleared:
+            logger.info(f"Cleared {cleared} old cache entries")
 
-        if old_keys:
-            logger.info(f"Cleared {len(old_keys)} old cache entries")
-            self._save_cache_index()
+    def close(self) -> None:
+        """Write pending descriptions and close the cache database."""
+        atexit.unregister(self.flush)
+        with self._lock:
+            self._write_pending()
+            self._connection.close()
 
 
 class BaseVLMModel:
     """Base class for Vision-Language Models."""
 
+    # Longest image side the model works with; larger images are shrunk
+    max_input_size = 1024
+
     def __init__(self, model_name: str, model_path: Optional[str] = None):
         """Initialize base VLM model."""
         self.model_name = model_name
@@ -195,6 +380,9 @@ class BaseVLMModel:
 class MockVLMModel(BaseVLMModel):
     """Mock VLM model for development and testing."""
 
+    # Longest image side used for dominant color detection
+    color_sample_size = 128
+
     def __init__(self, model_name: str = "mock-vlm"):
         """Initialize mock model."""
         super().__init__(model_name)
@@ -230,10 +418,13 @@ class MockVLMModel(BaseVLMModel):
             if mode != 'RGB':
                 image = image.convert('RGB')
 
-            # Get dominant color (simplified)
-            colors = image.getcolors(maxcolors=256*256*256)
-            if colors:
-                dominant_color = max(colors, key=lambda x: x[0])[1]
+            # Get dominant color (simplified) from a thumbnail, which has
+            # the same dominant color at a fraction of the pixels
+            if max(image.size) > self.color_sample_size:
+                image = image.copy()
+                image.thumbnail((self.color_sample_size, self.color_sample_size), Image.Resampling.BILINEAR)
+            dominant_color = _dominant_color(image)
+            if dominant_color:
                 r, g, b = dominant_color
                 if r > g and r > b:
                     color_desc = "reddish"
@@ -253,15 +444,9 @@ class MockVLMModel(BaseVLMModel):
 
         # Add context-based hints if available
         if context:
-            context_lower = context.lower()
-            if any(word in context_lower for word in ['person', 'people', 'man', 'woman']):
-                base_description += " showing people"
-            elif any(word in context_lower for word in ['building', 'house', 'city']):
-                base_description += " of a building or structure"
-            elif any(word in context_lower for word in ['nature', 'tree', 'forest', 'mountain']):
-                base_description += " of a natural scene"
-            elif any(word in context_lower for word in ['chart', 'graph', 'diagram']):
-                base_description += " containing a chart or diagram"
+            found = {match.lastgroup for match in CONTEXT_HINT_PATTERN.finditer(context)}
+            hint = next((hint for category, hint in CONTEXT_HINTS.items() if category in found), "")
+            base_description += hint
 
         # Ensure description fits max length
         if len(base_description) > max_length:
@@ -276,6 +461,8 @@ class MockVLMModel(BaseVLMModel):
 class LLaVAModel(BaseVLMModel):
     """LLaVA Vision-Language Model implementation."""
 
+    max_input_size = 336  # LLaVA-1.5 vision encoder resolution
+
     def __init__(self, model_name: str = "llava-1.5-7b", model_path: Optional[str] = None):
         """Initialize LLaVA model."""
         super().__init__(model_name, model_path)
@@ -309,6 +496,8 @@ class LLaVAModel(BaseVLMModel):
 class GemmaVLMModel(BaseVLMModel):
     """Gemma-3n-e4b Vision-Language Model via LM Studio API."""
 
+    max_input_size = 768
+
     def __init__(self, model_name: str = "gemma-3n-e4b", api_url: str = "http://127.0.0.1:1234",
                  auto_load_timeout: int = 10, skip_if_not_loaded: bool = False):
         """Initialize Gemma VLM model."""
@@ -459,11 +648,9 @@ class GemmaVLMModel(BaseVLMModel):
                 image = image.convert('RGB')
 
             # Resize if too large (for efficiency)
-            max_size = 768
-            if max(image.size) > max_size:
-                ratio = max_size / max(image.size)
-                new_size = tuple(int(dim * ratio) for dim in image.size)
-                image = image.resize(new_size, Image.Resampling.LANCZOS)
+            if max(image.size) > self.max_input_size:
+                image = image.copy()
+                image.thumbnail((self.max_input_size, self.max_input_size), Image.Resampling.BILINEAR)
 
             image.save(buffer, format='JPEG', quality=85)
             image_b64 = base64.b64encode(buffer.getvalue()).decode('utf-8')
@@ -615,7 +802,7 @@ class ImageDescriptionPipeline:
         """
         self.config = config
         self.cache_dir = cache_dir or Path(".vlm_cache")
-        self.cache = ImageDescriptionCache(self.cache_dir)
+        self.cache = ImageDescriptionCache(self.cache_dir, getattr(config, 'hash_image_contents', False))
         self.model: Optional[BaseVLMModel] = None
         self.progress_tracker = progress_tracker
 
@@ -696,31 +883,32 @@ class ImageDescriptionPipeline:
                 return cached_description
 
         try:
-            # Load and preprocess image
-            image = Image.open(image_path)
-
-            # Ensure image is in RGB mode
-            if image.mode != 'RGB':
-                image = image.convert('RGB')
+            max_size = self.model.max_input_size if self.model else BaseVLMModel.max_input_size
 
-            # Resize if too large (for efficiency)
-            max_size = 1024
-            if max(image.size) > max_size:
-                ratio = max_size / max(image.size)
-                new_size = tuple(int(dim * ratio) for dim in image.size)
-                image = image.resize(new_size, Image.Resampling.LANCZOS)
-
-            # Generate description
-            if self.model and self.model.is_loaded:
-                with PerformanceLogger(f"VLM description generation"):
-                    description_text, confidence = self.model.generate_description(
-                        image,
-                        context,
-                        self.config.max_description_length
-                    )
-            else:
-                description_text = "Image description unavailable (model not loaded)"
-                confidence = 0.0
+            # Load and preprocess image
+            with Image.open(image_path) as image:
+                # JPEG images can be decoded straight to RGB at a reduced scale
+                image.draft('RGB', (max_size, max_size))
+
+                # Ensure image is in RGB mode; converting also decodes it
+                if image.mode != 'RGB':
+                    image = image.convert('RGB')
+
+                # Resize to the model's input size (for efficiency); the vision
+                # encoder gains nothing from the slower LANCZOS filter
+                image.thumbnail((max_size, max_size), Image.Resampling.BILINEAR)
+
+                # Generate description
+                if self.model and self.model.is_loaded:
+                    with PerformanceLogger(f"VLM description generation"):
+                        description_text, confidence = self.model.generate_description(
+                            image,
+                            context,
+                            self.config.max_description_length
+                        )
+                else:
+                    description_text = "Image description unavailable (model not loaded)"
+                    confidence = 0.0
 
             # Post-process description for TTS
             description_text = self._post_process_description(description_text)
@@ -822,30 +1010,42 @@ class ImageDescriptionPipeline:
         if len(image_list) > 10:  # Only for larger batches
             self.cache.clear_old_entries(max_age_days=7)
 
-        if parallel and len(image_list) > 1:
+        # The same image with the same context gets the same description, so
+        # each distinct one is processed once and shared with its repeats
+        groups: Dict[str, List[Dict[str, str]]] = {}
+        for image_info in image_list:
+            cache_key = self.cache._generate_cache_key(image_info['file_path'], image_info.get('context', ''))
+            groups.setdefault(cache_key, []).append(image_info)
+
+        if len(groups) < len(image_list):
+            logger.info(f"Describing {len(groups)} distinct images for {len(image_list)} images")
+
+        if parallel and len(groups) > 1:
             # Parallel processing using ThreadPoolExecutor
             from concurrent.futures import ThreadPoolExecutor, as_completed
 
-            max_workers = min(4, len(image_list))  # Limit for memory usage
+            max_workers = min(4, len(groups))  # Limit for memory usage
             with ThreadPoolExecutor(max_workers=max_workers) as executor:
                 # Submit all tasks
-                future_to_image = {}
-                for image_info in image_list:
+                future_to_group = {}
+                for group in groups.values():
                     future = executor.submit(
                         self.process_image,
-                        image_info['file_path'],
-                        image_info.get('context', '')
+                        group[0]['file_path'],
+                        group[0].get('context', '')
                     )
-                    future_to_image[future] = image_info
+                    future_to_group[future] = group
 
                 # Collect results
-                for future in as_completed(future_to_image):
+                for future in as_completed(future_to_group):
+                    group = future_to_group[future]
                     try:
                         description = future.result()
-                        descriptions.append(description)
-                        if description.cache_hit:
-                            cache_hits += 1
-                        progress.update()
+                        for shared in self._share_description(description, group):
+                            descriptions.append(shared)
+                            if shared.cache_hit:
+                                cache_hits += 1
+                        progress.update(len(group))
 
                         # Emit progress event
                         if self.progress_tracker:
@@ -859,19 +1059,20 @@ class ImageDescriptionPipeline:
 
                     except Exception as e:
                         logger.error(f"Error in parallel image processing: {e}")
-                        progress.update()
+                        progress.update(len(group))
 
         else:
             # Sequential processing
-            for image_info in image_list:
+            for group in groups.values():
                 description = self.process_image(
-                    image_info['file_path'],
-                    image_info.get('context', '')
+                    group[0]['file_path'],
+                    group[0].get('context', '')
                 )
-                descriptions.append(description)
-                if description.cache_hit:
-                    cache_hits += 1
-                progress.update()
+                for shared in self._share_description(description, group):
+                    descriptions.append(shared)
+                    if shared.cache_hit:
+                        cache_hits += 1
+                progress.update(len(group))
 
                 # Emit progress event
                 if self.progress_tracker:
@@ -884,6 +1085,7 @@ class ImageDescriptionPipeline:
                     ))
 
         progress.finish()
+        self.cache.flush()
 
         total_processing_time = time.time() - start_time
         processed_images = len([d for d in descriptions if d.confidence > 0])
@@ -903,6 +1105,26 @@ class ImageDescriptionPipeline:
             total_processing_time=total_processing_time
         )
 
+    def _share_description(
+        self,
+        description: ImageDescription,
+        group: List[Dict[str, str]]
+    ) -> List[ImageDescription]:
+        """
+        Reuse the description of an image for its repeats in a batch.
+
+        Args:
+            description: Description generated for the first image of the group
+            group: Image dictionaries that share the description's cache key
+
+        Returns:
+            One description per image in the group, repeats marked as cache hits
+        """
+        return [description] + [
+            replace(description, image_path=image_info['file_path'], cache_hit=True)
+            for image_info in group[1:]
+        ]
+
     def _post_process_description(self, description: str) -> str:
         """
         Post-process description for TTS optimization.
@@ -965,6 +1187,7 @@ class ImageDescriptionPipeline:
         """Clean up resources."""
         if self.model:
             self.model.unload_model()
+        self.cache.close()
         logger.debug("VLM pipeline cleaned up")
 
 
@@ -6,6 +6,7 @@ text extraction, cleaning, TTS generation, and image description.
 """
 
 import logging
+import re
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
@@ -15,7 +16,7 @@ import concurrent.futures
 import threading
 
 from core.epub_processor import EPUBProcessor, ProcessingResult
-from core.text_cleaner import Chapter
+from core.text_cleaner import Chapter, count_words
 from pipelines.tts_pipeline import KokoroTTSPipeline, TTSResult, create_tts_pipeline
 from pipelines.image_pipeline import ImageDescriptionPipeline, ImageDescription, create_image_pipeline
 from utils.config import Config
@@ -25,6 +26,11 @@ from ui import TerminalUIManager, UIConfig, create_ui_manager
 
 logger = logging.getLogger(__name__)
 
+# Image placeholders left in cleaned text ([IMAGE: ...]) and raw markdown image refs (![...])
+IMAGE_PLACEHOLDER_PATTERN = re.compile(
+    r'\[IMAGE: (?P<placeholder>[^\]]+)\]|!\[(?P<markdown>[^\]]+)\]'
+)
+
 
 @dataclass
 class PipelineResult:
@@ -251,43 +257,23 @@ class PipelineOrchestrator(LoggerMixin):
         }
 
         # Update text content
-        updated_text = epub_result.text_content
-        for image_name, description in desc_map.items():
-            # Replace image placeholders with descriptions
-            placeholder_patterns = [
-                f"[IMAGE: Image of {image_name}]",
-                f"[IMAGE: {image_name}]",
-                f"![{image_name}]",
-                f"![Image of {image_name}]"
-            ]
-
-            for pattern in placeholder_patterns:
-                if pattern in updated_text:
-                    replacement = f"[IMAGE DESCRIPTION: {description}]"
-                    updated_text = updated_text.replace(pattern, replacement)
+        updated_text = self._replace_image_placeholders(
+            epub_result.text_content, desc_map, include_markdown=True
+        )
 
         # Update chapters with integrated descriptions
         updated_chapters = []
         for chapter in epub_result.chapters:
-            updated_content = chapter.content
-            for image_name, description in desc_map.items():
-                placeholder_patterns = [
-                    f"[IMAGE: Image of {image_name}]",
-                    f"[IMAGE: {image_name}]"
-                ]
-
-                for pattern in placeholder_patterns:
-                    if pattern in updated_content:
-                        replacement = f"[IMAGE DESCRIPTION: {description}]"
-                        updated_content = updated_content.replace(pattern, replacement)
+            updated_content = self._replace_image_placeholders(chapter.content, desc_map)
+            word_count = count_words(updated_content)
 
             # Create updated chapter
             updated_chapter = Chapter(
                 chapter_num=chapter.chapter_num,
                 title=chapter.title,
                 content=updated_content,
-                word_count=len(updated_content.split()),
-                estimated_duration=len(updated_content.split()) / 200.0,
+                word_count=word_count,
+                estimated_duration=word_count / 200.0,
                 confidence=chapter.confidence
             )
             updated_chapters.append(updated_chapter)
@@ -307,6 +293,47 @@ class PipelineOrchestrator(LoggerMixin):
         self.logger.info(f"Integrated {len(desc_map)} image descriptions into text")
         return updated_result
 
+    def _replace_image_placeholders(
+        self,
+        text: str,
+        desc_map: Dict[str, str],
+        include_markdown: bool = False
+    ) -> str:
+        """
+        Replace image placeholders with descriptions in a single scan.
+
+        Handles "[IMAGE: name]" and "[IMAGE: Image of name]", plus
+        "![name]" and "![Image of name]" when include_markdown is set.
+        Placeholders for images without a description are left unchanged.
+
+        Args:
+            text: Text containing image placeholders
+            desc_map: Mapping of image file name to description
+            include_markdown: Also replace markdown image references
+
+        Returns:
+            Text with descriptions substituted
+        """
+        if not desc_map or not text:
+            return text
+
+        def replace(match: re.Match) -> str:
+            name = match.group('placeholder')
+            if name is None:
+                if not include_markdown:
+                    return match.group(0)
+                name = match.group('markdown')
+
+            if name.startswith('Image of ') and name[len('Image of '):] in desc_map:
+                description = desc_map[name[len('Image of '):]]
+            elif name in desc_map:
+                description = desc_map[name]
+            else:
+                return match.group(0)
+            return f"[IMAGE DESCRIPTION: {description}]"
+
+        return IMAGE_PLACEHOLDER_PATTERN.sub(replace, text)
+
     def _process_images_parallel(self, image_info_list: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Process images in parallel - wrapper for use with ThreadPoolExecutor.
@@ -600,9 +627,9 @@ class PipelineOrchestrator(LoggerMixin):
 
     def cleanup(self) -> None:
         """Clean up all pipeline resources."""
-        if self.tts_pipeline:
-            # TTS cleanup if needed
-            pass
+        if self.tts_pipeline and hasattr(self.tts_pipeline, 'close'):
+            # Release pooled API connections
+            self.tts_pipeline.close()
 
         if self.image_pipeline:
             self.image_pipeline.cleanup()
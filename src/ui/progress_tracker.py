@@ -408,6 +408,51 @@ class ProgressTracker:
         return active
 
 
+class ProgressCoalescer:
+    """
+    Thin out per-item progress events of a large batch.
+
+    An update is worth emitting once enough items have completed since the
+    last emitted one (about 1% of the batch) or enough time has passed.
+    The final item is always emitted so subscribers see the batch finish.
+    """
+
+    def __init__(self, total: int, min_interval: float = 0.5, min_step: Optional[int] = None):
+        """
+        Initialize the coalescer.
+
+        Args:
+            total: Number of items in the batch
+            min_interval: Seconds after which an update is emitted regardless
+            min_step: Completed items after which an update is emitted
+                (defaults to 1% of total)
+        """
+        self.total = total
+        self.min_interval = min_interval
+        self.min_step = min_step or max(1, total // 100)
+        self._last_count = 0
+        self._last_time = time.monotonic()
+
+    def should_emit(self, completed: int) -> bool:
+        """
+        Check whether the update for this many completed items should be emitted.
+
+        Args:
+            completed: Items completed so far
+
+        Returns:
+            True if the caller should emit a progress event now
+        """
+        now = time.monotonic()
+        if (completed >= self.total
+                or completed - self._last_count >= self.min_step
+                or now - self._last_time >= self.min_interval):
+            self._last_count = completed
+            self._last_time = now
+            return True
+        return False
+
+
 # Convenience functions for common event patterns
 
 def create_start_event(pipeline: PipelineType, total_items: int, current_item: str = "", **kwargs) -> ProgressEvent:
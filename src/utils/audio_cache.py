@@ -0,0 +1,284 @@
+"""
+Content-addressed audio cache for epub2tts.
+
+This module stores synthesized audio on disk keyed by a hash of everything
+that determines the output (text, voice, model and settings), so re-running
+a book or re-synthesizing repeated text does not call a TTS API again.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+from utils.audio_files import link_or_copy
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_ROOT = "~/.cache/epub2tts"
+
+INDEX_FILENAME = "index.sqlite3"
+
+# Entries removed per eviction query
+EVICTION_BATCH_SIZE = 32
+
+
+class _CacheIndex:
+    """
+    SQLite index of cache entry sizes and last access times.
+
+    Used to evict least recently used entries once the cache grows past its
+    size limit. WAL mode and a busy timeout let several processes share
+    one cache directory.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._connection is None:
+            connection = sqlite3.connect(self.db_path, timeout=5.0, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries "
+                "(key TEXT PRIMARY KEY, size INTEGER NOT NULL, atime INTEGER NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS entries_atime ON entries (atime)")
+            self._connection = connection
+        return self._connection
+
+    def touch(self, key: str, size: int) -> None:
+        """Record an access to an entry, adding it if it is not indexed yet."""
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute(
+                    "INSERT INTO entries (key, size, atime) VALUES (?, ?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET size = excluded.size, atime = excluded.atime",
+                    (key, size, time.time_ns())
+                )
+
+    def evict(self, max_bytes: int, path_for: Callable[[str], Path]) -> int:
+        """
+        Remove least recently used entries until the total size fits.
+
+        Args:
+            max_bytes: Size limit for all entries
+            path_for: Function mapping a key to its cache file
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+                while total > max_bytes:
+                    rows = connection.execute(
+                        "SELECT key, size FROM entries ORDER BY atime LIMIT ?",
+                        (EVICTION_BATCH_SIZE,)
+                    ).fetchall()
+                    if not rows:
+                        break
+                    for key, size in rows:
+                        if total <= max_bytes:
+                            break
+                        path_for(key).unlink(missing_ok=True)
+                        connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+                        total -= size
+                        removed += 1
+        return removed
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+class AudioCache:
+    """
+    Disk cache mapping synthesis parameters to audio files.
+
+    Entries are written atomically (temporary file plus rename), so an
+    interrupted run never leaves a truncated file behind a valid key. Files
+    are spread over subdirectories named after the first two characters of
+    the key to keep directories small.
+
+    Files move in and out of the cache as hard links where possible, so
+    cached audio is stored once on disk. Files handed out by copy_to must be
+    replaced rather than modified in place, or the cached entry changes too.
+
+    With a size limit, accesses are tracked in an SQLite index and the least
+    recently used entries are evicted whenever a new entry pushes the cache
+    over the limit.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path],
+        extension: str = "mp3",
+        max_bytes: Optional[int] = None
+    ):
+        """
+        Initialize the audio cache.
+
+        Args:
+            cache_dir: Directory holding cached audio files
+            extension: File extension of cached audio
+            max_bytes: Size limit for cached audio, or None for no limit
+        """
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.extension = extension.lstrip('.')
+        self.max_bytes = max_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.index = _CacheIndex(self.cache_dir / INDEX_FILENAME) if max_bytes is not None else None
+
+    @staticmethod
+    def make_key(text: str, **params: Any) -> str:
+        """
+        Build the cache key for a synthesis request.
+
+        Args:
+            text: Text sent for synthesis
+            **params: Voice, model and settings that affect the audio
+
+        Returns:
+            Hex digest identifying the request
+        """
+        canonical = json.dumps(
+            {'text': text, 'params': params},
+            sort_keys=True,
+            ensure_ascii=False,
+            separators=(',', ':'),
+            default=str
+        )
+        return hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).hexdigest()
+
+    def path_for(self, key: str) -> Path:
+        """Get the cache file path for a key."""
+        return self.cache_dir / key[:2] / f"{key}.{self.extension}"
+
+    def get(self, key: str) -> Optional[Path]:
+        """
+        Look up a cached audio file.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Path of the cached file, or None on a miss
+        """
+        path = self.path_for(key)
+        try:
+            size = path.stat().st_size
+        except FileNotFoundError:
+            return None
+
+        if self.index is not None:
+            self.index.touch(key, size)
+        return path
+
+    def put(self, key: str, audio_data: bytes) -> Path:
+        """
+        Store audio data under a key.
+
+        Args:
+            key: Cache key from make_key
+            audio_data: Encoded audio bytes
+
+        Returns:
+            Path of the cached file
+        """
+        path = self.path_for(key)
+        path.parent.mkdir(exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(audio_data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        self._record(key, path)
+        return path
+
+    def put_file(self, key: str, source_path: Union[str, Path]) -> Path:
+        """
+        Store a copy of an audio file under a key.
+
+        Args:
+            key: Cache key from make_key
+            source_path: Audio file to cache
+
+        Returns:
+            Path of the cached file
+        """
+        path = self.path_for(key)
+        path.parent.mkdir(exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        os.close(fd)
+        try:
+            link_or_copy(source_path, tmp_name)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        self._record(key, path)
+        return path
+
+    def _record(self, key: str, path: Path) -> None:
+        """Index a new entry and evict old ones if the cache is over its limit."""
+        if self.index is None:
+            return
+
+        self.index.touch(key, path.stat().st_size)
+        removed = self.index.evict(self.max_bytes, self.path_for)
+        if removed:
+            logger.debug(f"Evicted {removed} least recently used audio cache entries")
+
+    def close(self) -> None:
+        """Release the cache index."""
+        if self.index is not None:
+            self.index.close()
+
+    def copy_to(self, key: str, output_path: Union[str, Path]) -> bool:
+        """
+        Copy a cached audio file to an output path, as a hard link if possible.
+
+        Args:
+            key: Cache key from make_key
+            output_path: Destination file
+
+        Returns:
+            True on a cache hit, False on a miss
+        """
+        cached = self.get(key)
+        if cached is None:
+            return False
+
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = output_path.with_name(output_path.name + '.tmp')
+        try:
+            link_or_copy(cached, tmp_path)
+            os.replace(tmp_path, output_path)
+        except FileNotFoundError:
+            # Removed by another process since the lookup
+            tmp_path.unlink(missing_ok=True)
+            return False
+        return True
+
@@ -0,0 +1,240 @@
+"""
+Audio file helpers for epub2tts.
+
+This module joins encoded audio files without decoding them. MP3 is a
+sequence of self-contained frames, so files with the same encoding settings
+can be concatenated byte for byte once their metadata tags are removed.
+"""
+
+import logging
+import os
+import shutil
+from pathlib import Path
+from typing import BinaryIO, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Read/write buffer for copying audio data
+COPY_BUFFER_SIZE = 4 * 1024 * 1024
+
+ID3V2_HEADER_SIZE = 10
+ID3V1_TAG_SIZE = 128
+
+
+def id3v2_tag_size(header: bytes) -> int:
+    """
+    Get the size of an ID3v2 tag from the first bytes of a file.
+
+    Args:
+        header: At least the first 10 bytes of the file
+
+    Returns:
+        Total tag size in bytes including header and footer, or 0 if the
+        file does not start with an ID3v2 tag
+    """
+    if len(header) < ID3V2_HEADER_SIZE or header[:3] != b'ID3':
+        return 0
+
+    flags = header[5]
+    size_bytes = header[6:10]
+    if any(byte & 0x80 for byte in size_bytes):
+        return 0
+
+    # The tag size is a 28-bit "syncsafe" integer (7 bits per byte)
+    size = 0
+    for byte in size_bytes:
+        size = (size << 7) | byte
+
+    footer = ID3V2_HEADER_SIZE if flags & 0x10 else 0
+    return ID3V2_HEADER_SIZE + size + footer
+
+
+def mp3_audio_range(path: Union[str, Path]) -> Tuple[int, int]:
+    """
+    Find the byte range of an MP3 file that holds audio frames.
+
+    Args:
+        path: MP3 file
+
+    Returns:
+        Tuple of (start, end) offsets excluding ID3v2 and ID3v1 tags
+    """
+    file_size = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        start = min(id3v2_tag_size(f.read(ID3V2_HEADER_SIZE)), file_size)
+
+        end = file_size
+        if end - start >= ID3V1_TAG_SIZE:
+            f.seek(end - ID3V1_TAG_SIZE)
+            if f.read(3) == b'TAG':
+                end -= ID3V1_TAG_SIZE
+
+    return start, end
+
+
+def copy_file_range(src: BinaryIO, out: BinaryIO, offset: int, length: int,
+                    buffer_size: int = COPY_BUFFER_SIZE) -> None:
+    """
+    Append a byte range of one open file to another.
+
+    Uses os.sendfile where available so the data is copied inside the
+    kernel, and a buffered read/write loop otherwise. Where supported, the
+    kernel is told the range is read sequentially, so it reads ahead, and
+    that it will not be read again, so the source pages are dropped from
+    the page cache instead of crowding it while a long book is joined.
+
+    Args:
+        src: Source file opened for binary reading
+        out: Destination file opened for binary writing
+        offset: Start of the range in the source
+        length: Number of bytes to copy
+        buffer_size: Copy buffer size for the fallback loop
+    """
+    if length <= 0:
+        return
+
+    _advise(src, offset, length, 'POSIX_FADV_SEQUENTIAL')
+    try:
+        _copy_range(src, out, offset, length, buffer_size)
+    finally:
+        _advise(src, offset, length, 'POSIX_FADV_DONTNEED')
+
+
+def _advise(f: BinaryIO, offset: int, length: int, advice: str) -> None:
+    """Pass an access pattern hint for a file range to the kernel, if supported."""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        os.posix_fadvise(f.fileno(), offset, length, getattr(os, advice))
+    except (AttributeError, OSError):
+        pass
+
+
+def _copy_range(src: BinaryIO, out: BinaryIO, offset: int, length: int, buffer_size: int) -> None:
+    """Copy a byte range with sendfile, falling back to buffered reads."""
+    if hasattr(os, 'sendfile'):
+        out.flush()
+        try:
+            copied = 0
+            while copied < length:
+                sent = os.sendfile(out.fileno(), src.fileno(), offset + copied, length - copied)
+                if sent == 0:
+                    break
+                copied += sent
+            return
+        except OSError:
+            # Some filesystems do not support sendfile between regular files;
+            # copy the rest with the buffered loop
+            offset += copied
+            length -= copied
+            out.seek(0, os.SEEK_END)
+
+    src.seek(offset)
+    remaining = length
+    while remaining > 0:
+        block = src.read(min(buffer_size, remaining))
+        if not block:
+            break
+        out.write(block)
+        remaining -= len(block)
+
+
+def concatenate_mp3_files(
+    audio_files: List[Union[str, Path]],
+    output_path: Union[str, Path],
+    buffer_size: int = COPY_BUFFER_SIZE
+) -> Optional[Path]:
+    """
+    Join MP3 files into one without re-encoding.
+
+    The first file keeps its leading ID3v2 tag. Tags of later files are
+    skipped so that no metadata ends up in the middle of the audio stream.
+    The inputs should share sample rate and channel layout, as files
+    produced by one TTS voice and output format do.
+
+    Args:
+        audio_files: MP3 files in playback order
+        output_path: Destination file
+        buffer_size: Copy buffer size
+
+    Returns:
+        Output path, or None if there was nothing to join
+    """
+    existing = [Path(audio_file) for audio_file in audio_files if Path(audio_file).is_file()]
+    if len(existing) < len(audio_files):
+        logger.warning(f"Skipping {len(audio_files) - len(existing)} missing audio files")
+    if not existing:
+        return None
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    partial_path = output_path.with_name(output_path.name + '.partial')
+
+    try:
+        with open(partial_path, 'wb') as out:
+            for index, audio_file in enumerate(existing):
+                start, end = mp3_audio_range(audio_file)
+                if index == 0:
+                    start = 0
+
+                with open(audio_file, 'rb') as src:
+                    copy_file_range(src, out, start, end - start, buffer_size)
+
+        os.replace(partial_path, output_path)
+    except BaseException:
+        partial_path.unlink(missing_ok=True)
+        raise
+
+    return output_path
+
+
+def link_or_copy(source_path: Union[str, Path], target_path: Union[str, Path]) -> None:
+    """
+    Hard link a file to a new path, copying it if linking is not possible.
+
+    Args:
+        source_path: Existing file
+        target_path: Path to create, replaced if it exists
+    """
+    target_path = Path(target_path)
+    target_path.unlink(missing_ok=True)
+    try:
+        os.link(source_path, target_path)
+    except FileNotFoundError:
+        raise
+    except OSError:
+        # Different filesystem, or links not supported
+        if not _clone_file(source_path, target_path):
+            shutil.copyfile(source_path, target_path)
+
+
+def _clone_file(source_path: Union[str, Path], target_path: Union[str, Path]) -> bool:
+    """
+    Copy a file inside the kernel with copy_file_range, if supported.
+
+    Filesystems with copy-on-write support (Btrfs, XFS, NFS 4.2 and others)
+    share the data blocks instead of copying them.
+
+    Args:
+        source_path: Existing file
+        target_path: Path to create
+
+    Returns:
+        True if the whole file was copied, False if the caller should copy it
+    """
+    if not hasattr(os, 'copy_file_range'):
+        return False
+
+    with open(source_path, 'rb') as src, open(target_path, 'wb') as out:
+        remaining = os.fstat(src.fileno()).st_size
+        try:
+            while remaining > 0:
+                copied = os.copy_file_range(src.fileno(), out.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        except OSError:
+            # Not supported between these files, e.g. across filesystems
+            # on older kernels
+            return False
+    return remaining == 0
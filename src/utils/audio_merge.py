@@ -0,0 +1,352 @@
+"""
+Decoded audio merging for epub2tts.
+
+Chaining pydub's AudioSegment.append copies the whole merged audio into a
+new segment for every file, so merging N files costs O(N²) in the total
+audio size. The helpers here write the PCM data of all segments once into
+a preallocated buffer and blend crossfades in place at the boundaries.
+
+When the ffmpeg binary is available, files can instead be merged by ffmpeg
+itself: without a crossfade the concat demuxer copies the MP3 frames
+without decoding, and with a crossfade ffmpeg streams the audio through an
+acrossfade filter chain instead of holding it all in Python. Without
+ffmpeg, soundfile can stream the files in fixed-size blocks so that memory
+use does not grow with the length of the book. Durations are likewise read
+from file headers with ffprobe or soundfile rather than by decoding.
+"""
+
+import itertools
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+from pydub import AudioSegment
+
+try:
+    import soundfile as sf
+    SOUNDFILE_AVAILABLE = True
+except (ImportError, OSError):
+    SOUNDFILE_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Merged audio is 16-bit PCM, the sample width of decoded MP3 audio
+PCM_SAMPLE_WIDTH = 2
+
+FFMPEG_PATH = shutil.which("ffmpeg")
+FFPROBE_PATH = shutil.which("ffprobe")
+
+# Concurrent ffprobe processes when probing many files
+PROBE_WORKERS = 8
+
+# Frames read per block when streaming files with soundfile
+STREAM_BLOCK_FRAMES = 65536
+
+
+def _blend(fade_out: np.ndarray, fade_in: np.ndarray) -> np.ndarray:
+    """
+    Crossfade two equally long blocks of 16-bit PCM frames.
+
+    The first block fades out while the second fades in, with linear gain
+    ramps as in AudioSegment.append.
+
+    Args:
+        fade_out: Frames of shape (frames, channels) ending the earlier audio
+        fade_in: Frames of the same shape starting the later audio
+
+    Returns:
+        Blended 16-bit frames
+    """
+    ramp = (np.arange(len(fade_in), dtype=np.float32) / len(fade_in))[:, np.newaxis]
+    mixed = fade_out * (1.0 - ramp) + fade_in * ramp
+    return np.clip(np.rint(mixed), -32768, 32767).astype(np.int16)
+
+
+def _crossfade_into(buffer: bytearray, start: int, head: bytes, channels: int) -> None:
+    """
+    Blend the start of the next segment into the end of the buffer.
+
+    Args:
+        buffer: Merged 16-bit PCM data
+        start: Byte offset where the overlap begins
+        head: Overlapping start of the next segment
+        channels: Interleaved channel count
+    """
+    frames = len(head) // (PCM_SAMPLE_WIDTH * channels)
+    tail = np.frombuffer(buffer, dtype=np.int16, count=frames * channels, offset=start)
+    blended = _blend(tail.reshape(frames, channels), np.frombuffer(head, dtype=np.int16).reshape(frames, channels))
+    buffer[start:start + len(head)] = blended.tobytes()
+
+
+def join_segments(segments: Sequence[AudioSegment], crossfade_ms: int = 0) -> AudioSegment:
+    """
+    Join audio segments into one, optionally crossfading between them.
+
+    Segments are converted to the first segment's frame rate and channel
+    count. A crossfade longer than either side of a boundary is shortened
+    to fit instead of raising as AudioSegment.append does.
+
+    Args:
+        segments: Segments in playback order
+        crossfade_ms: Crossfade duration between segments in milliseconds
+
+    Returns:
+        Joined audio segment
+
+    Raises:
+        ValueError: If no segments are given
+    """
+    if not segments:
+        raise ValueError("No audio segments to join")
+
+    first = segments[0].set_sample_width(PCM_SAMPLE_WIDTH)
+    segments: List[AudioSegment] = [first] + [
+        segment.set_frame_rate(first.frame_rate).set_channels(first.channels).set_sample_width(PCM_SAMPLE_WIDTH)
+        for segment in segments[1:]
+    ]
+    frame_width = first.frame_width
+    crossfade_frames = int(first.frame_count(ms=max(0, crossfade_ms)))
+
+    # Work out every overlap up front so the output is allocated once
+    overlaps = [0]
+    total_frames = len(first.raw_data) // frame_width
+    for segment in segments[1:]:
+        frames = len(segment.raw_data) // frame_width
+        overlap = min(crossfade_frames, total_frames, frames)
+        overlaps.append(overlap)
+        total_frames += frames - overlap
+
+    merged = bytearray(total_frames * frame_width)
+    position = 0
+    for segment, overlap in zip(segments, overlaps):
+        data = memoryview(segment.raw_data)[:len(segment.raw_data) // frame_width * frame_width]
+        overlap_bytes = overlap * frame_width
+        if overlap_bytes:
+            _crossfade_into(merged, position - overlap_bytes, data[:overlap_bytes], first.channels)
+
+        remainder = data[overlap_bytes:]
+        merged[position:position + len(remainder)] = remainder
+        position += len(remainder)
+
+    return first._spawn(merged)
+
+
+def _concat_list_entry(path: Path) -> str:
+    """Quote a path for an ffmpeg concat demuxer list file."""
+    quoted = str(path.resolve()).replace("'", "'\\''")
+    return f"file '{quoted}'\n"
+
+
+def _acrossfade_graph(count: int, crossfade_ms: int) -> str:
+    """
+    Build an ffmpeg filter graph crossfading inputs in order.
+
+    Args:
+        count: Number of inputs, at least two
+        crossfade_ms: Crossfade duration in milliseconds
+
+    Returns:
+        Filter graph whose final output is labelled [out]
+    """
+    duration = crossfade_ms / 1000
+    filters = []
+    previous = "[0]"
+    for index in range(1, count):
+        label = "[out]" if index == count - 1 else f"[a{index:02d}]"
+        filters.append(f"{previous}[{index}]acrossfade=d={duration}{label}")
+        previous = label
+    return ";".join(filters)
+
+
+def ffmpeg_merge(
+    audio_files: Sequence[Union[str, Path]],
+    output_path: Union[str, Path],
+    crossfade_ms: int = 0,
+    bitrate: str = "192k"
+) -> Optional[Path]:
+    """
+    Merge MP3 files with the ffmpeg command line tool.
+
+    Without a crossfade MP3 frames are copied as they are. Otherwise, or
+    when some inputs are not MP3 files, the audio is encoded at the given
+    bitrate.
+
+    Args:
+        audio_files: Existing audio files in playback order
+        output_path: Destination MP3 file
+        crossfade_ms: Crossfade duration between files in milliseconds
+        bitrate: Encoding bitrate used when the audio is encoded
+
+    Returns:
+        Output path, or None if ffmpeg is not installed or there was
+        nothing to merge
+
+    Raises:
+        subprocess.CalledProcessError: If ffmpeg fails
+    """
+    if not FFMPEG_PATH or not audio_files:
+        return None
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    partial_path = output_path.with_name(output_path.name + '.partial')
+    command = [FFMPEG_PATH, "-y", "-hide_banner", "-loglevel", "error"]
+    encode = ["-c:a", "libmp3lame", "-b:a", bitrate]
+    list_path = None
+
+    try:
+        if crossfade_ms > 0 and len(audio_files) > 1:
+            for audio_file in audio_files:
+                command += ["-i", str(audio_file)]
+            command += [
+                "-filter_complex", _acrossfade_graph(len(audio_files), crossfade_ms),
+                "-map", "[out]", *encode
+            ]
+        else:
+            with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False, encoding='utf-8') as list_file:
+                list_file.writelines(_concat_list_entry(Path(audio_file)) for audio_file in audio_files)
+                list_path = list_file.name
+            all_mp3 = all(Path(audio_file).suffix.lower() == '.mp3' for audio_file in audio_files)
+            command += ["-f", "concat", "-safe", "0", "-i", list_path, *(["-c", "copy"] if all_mp3 else encode)]
+
+        command += ["-f", "mp3", str(partial_path)]
+        subprocess.run(command, check=True, capture_output=True)
+        os.replace(partial_path, output_path)
+    except BaseException:
+        partial_path.unlink(missing_ok=True)
+        raise
+    finally:
+        if list_path:
+            os.unlink(list_path)
+
+    return output_path
+
+
+def stream_merge(
+    audio_files: Sequence[Union[str, Path]],
+    output_path: Union[str, Path],
+    crossfade_ms: int = 0,
+    block_frames: int = STREAM_BLOCK_FRAMES,
+    output_format: str = "MP3"
+) -> Optional[Path]:
+    """
+    Merge audio files into one audio file block by block with soundfile.
+
+    Only one block and the last crossfade_ms of audio are held in memory
+    at a time. All inputs must share the first file's sample rate and
+    channel count.
+
+    Args:
+        audio_files: Existing audio files in playback order
+        output_path: Destination audio file
+        crossfade_ms: Crossfade duration between files in milliseconds
+        block_frames: Frames read per block
+        output_format: soundfile format of the output, e.g. MP3 or WAV
+
+    Returns:
+        Output path, or None if soundfile cannot write the format or there
+        was nothing to merge
+
+    Raises:
+        ValueError: If the inputs differ in sample rate or channel count
+    """
+    if not SOUNDFILE_AVAILABLE or output_format not in sf.available_formats() or not audio_files:
+        return None
+
+    info = sf.info(str(audio_files[0]))
+    crossfade_frames = info.samplerate * max(0, crossfade_ms) // 1000
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    partial_path = output_path.with_name(output_path.name + '.partial')
+
+    try:
+        with sf.SoundFile(str(partial_path), 'w', samplerate=info.samplerate, channels=info.channels,
+                          format=output_format) as out:
+            # Audio held back so it can be crossfaded with the next file
+            pending = np.empty((0, info.channels), dtype=np.int16)
+
+            for index, audio_file in enumerate(audio_files):
+                with sf.SoundFile(str(audio_file)) as src:
+                    if (src.samplerate, src.channels) != (info.samplerate, info.channels):
+                        raise ValueError(f"Audio format of {audio_file} differs from {audio_files[0]}")
+
+                    blocks = src.blocks(block_frames, dtype='int16', always_2d=True)
+                    if index > 0 and crossfade_frames:
+                        head = src.read(crossfade_frames, dtype='int16', always_2d=True)
+                        overlap = min(len(pending), len(head))
+                        if overlap:
+                            start = len(pending) - overlap
+                            pending[start:] = _blend(pending[start:], head[:overlap])
+                        blocks = itertools.chain([head[overlap:]], blocks)
+
+                    for block in blocks:
+                        pending = np.concatenate([pending, block])
+                        keep = min(crossfade_frames, len(pending))
+                        out.write(pending[:len(pending) - keep])
+                        pending = pending[len(pending) - keep:]
+
+            out.write(pending)
+
+        os.replace(partial_path, output_path)
+    except BaseException:
+        partial_path.unlink(missing_ok=True)
+        raise
+
+    return output_path
+
+
+def _probe_duration(path: Union[str, Path]) -> Optional[float]:
+    """
+    Read the duration of one audio file without decoding it.
+
+    Args:
+        path: Audio file
+
+    Returns:
+        Duration in seconds, or None if it could not be read
+    """
+    if FFPROBE_PATH:
+        try:
+            completed = subprocess.run(
+                [FFPROBE_PATH, "-v", "error", "-show_entries", "format=duration",
+                 "-of", "csv=p=0", str(path)],
+                check=True, capture_output=True, text=True
+            )
+            return float(completed.stdout.strip())
+        except (OSError, subprocess.CalledProcessError, ValueError) as e:
+            logger.debug(f"ffprobe could not read the duration of {path}: {e}")
+
+    if SOUNDFILE_AVAILABLE:
+        try:
+            return sf.info(str(path)).duration
+        except (RuntimeError, TypeError) as e:
+            logger.debug(f"soundfile could not read the duration of {path}: {e}")
+
+    return None
+
+
+def probe_durations(audio_files: Sequence[Union[str, Path]]) -> List[Optional[float]]:
+    """
+    Read the durations of audio files from their headers.
+
+    Uses ffprobe when it is installed and soundfile otherwise. Neither
+    decodes the audio, so this is much cheaper than loading the files.
+
+    Args:
+        audio_files: Audio files
+
+    Returns:
+        Duration in seconds of each file, None where it could not be read
+    """
+    if len(audio_files) <= 1:
+        return [_probe_duration(audio_file) for audio_file in audio_files]
+
+    with ThreadPoolExecutor(max_workers=min(PROBE_WORKERS, len(audio_files))) as executor:
+        return list(executor.map(_probe_duration, audio_files))
@@ -4,6 +4,8 @@ Configuration management for epub2tts.
 This module handles loading and validating configuration from YAML files.
 """
 
+import copy
+import functools
 import logging
 from pathlib import Path
 from typing import Dict, Any, Optional
@@ -78,6 +80,14 @@ class TTSConfig:
     elevenlabs_similarity_boost: float = 0.75
     elevenlabs_style: float = 0.0
     elevenlabs_max_chunk_chars: int = 2500
+    elevenlabs_optimize_streaming_latency: Optional[int] = 2  # 0-4, None for the API default
+    elevenlabs_output_format: str = "mp3_44100_128"  # Must be an mp3_* format
+    elevenlabs_max_concurrency: int = 3  # Concurrent requests allowed by the plan
+    elevenlabs_cache_enabled: bool = True  # Reuse audio for previously synthesized text
+    elevenlabs_cache_dir: Optional[str] = None  # Defaults to ~/.cache/epub2tts/elevenlabs
+    elevenlabs_cache_max_mb: Optional[int] = 2048  # Evict least recently used audio beyond this; None for no limit
+    elevenlabs_reencode_merge: bool = False  # Decode and re-encode chapters when merging
+    elevenlabs_validate_voice: bool = False  # Look up the voice when the pipeline starts
 
     # Hume AI settings
     hume_model: str = "octave-2"  # Octave 2 model
@@ -119,6 +129,9 @@ class ImageConfig:
     auto_load_timeout: int = 10
     skip_if_not_loaded: bool = False
 
+    # Key cached descriptions on image contents rather than file size and mtime
+    hash_image_contents: bool = False
+
 
 @dataclass
 class OutputConfig:
@@ -283,6 +296,14 @@ class ConfigManager:
         if config.tts.output_format not in ["wav", "mp3"]:
             raise ValueError(f"Invalid output format: {config.tts.output_format}")
 
+        latency = config.tts.elevenlabs_optimize_streaming_latency
+        if latency is not None and not (0 <= latency <= 4):
+            raise ValueError(f"ElevenLabs optimize_streaming_latency must be between 0 and 4, got {latency}")
+
+        # Chapter files are written and merged as MP3
+        if not config.tts.elevenlabs_output_format.startswith("mp3_"):
+            raise ValueError(f"Invalid ElevenLabs output format: {config.tts.elevenlabs_output_format}")
+
         # Validate output settings
         if config.output.text_format not in ["plain", "ssml", "json"]:
             raise ValueError(f"Invalid text format: {config.output.text_format}")
@@ -305,6 +326,10 @@ def load_regex_patterns(patterns_file: Optional[Path] = None) -> Dict[str, Any]:
     """
     Load regex patterns from YAML file.
 
+    Parsed files are cached by path and modification time, so repeated
+    loads of an unchanged file skip the YAML parse. Each call returns its
+    own copy.
+
     Args:
         patterns_file: Path to patterns file
 
@@ -316,6 +341,31 @@ def load_regex_patterns(patterns_file: Optional[Path] = None) -> Dict[str, Any]:
         current_dir = Path(__file__).parent.parent.parent
         patterns_file = current_dir / "config" / "regex_patterns.yaml"
 
+    try:
+        mtime_ns = Path(patterns_file).stat().st_mtime_ns
+    except OSError:
+        # Let the read below report missing files
+        return _read_regex_patterns(patterns_file)
+
+    return copy.deepcopy(_read_regex_patterns_cached(str(patterns_file), mtime_ns))
+
+
+@functools.lru_cache(maxsize=8)
+def _read_regex_patterns_cached(patterns_file: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a patterns file once per (path, mtime) pair."""
+    return _read_regex_patterns(Path(patterns_file))
+
+
+def _read_regex_patterns(patterns_file: Path) -> Dict[str, Any]:
+    """
+    Read and parse a regex patterns YAML file.
+
+    Args:
+        patterns_file: Path to patterns file
+
+    Returns:
+        Dictionary containing regex patterns
+    """
     try:
         with open(patterns_file, 'r', encoding='utf-8') as f:
             patterns = yaml.safe_load(f)
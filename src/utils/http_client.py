@@ -0,0 +1,62 @@
+"""
+Pooled HTTP clients for the TTS API pipelines.
+
+API SDKs create a fresh connection pool per client by default and close idle
+connections after 5 seconds. Chunks of a book are often sent further apart
+than that, so the clients created here keep connections alive longer and are
+meant to be shared by every request of a pipeline, avoiding a new TCP and TLS
+handshake per chunk.
+"""
+
+import logging
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 8
+HTTP_KEEPALIVE_EXPIRY = 60.0
+HTTP_TIMEOUT = 240.0  # ElevenLabs SDK default
+
+
+def create_http_client(
+    timeout: float = HTTP_TIMEOUT,
+    max_keepalive_connections: int = HTTP_MAX_KEEPALIVE_CONNECTIONS
+) -> "httpx.Client":
+    """
+    Create a pooled HTTP client for API requests.
+
+    HTTP/2 is used when the optional h2 package is installed, so
+    concurrent requests can share a single connection.
+
+    Args:
+        timeout: Request timeout in seconds
+        max_keepalive_connections: Idle connections kept open, which should
+            cover the number of concurrent requests over HTTP/1.1
+
+    Returns:
+        Configured httpx client
+
+    Raises:
+        RuntimeError: If httpx is not installed
+    """
+    if not HTTPX_AVAILABLE:
+        raise RuntimeError("httpx is not available. Install with: pip install httpx")
+
+    options = {
+        'limits': httpx.Limits(
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY
+        ),
+        'timeout': timeout,
+        'follow_redirects': True
+    }
+    try:
+        return httpx.Client(http2=True, **options)
+    except ImportError:
+        logger.debug("h2 is not installed, using HTTP/1.1 connections")
+        return httpx.Client(**options)
@@ -0,0 +1,214 @@
+"""
+Adaptive request concurrency limiting for epub2tts.
+
+TTS APIs cap how many requests may be in flight per account, and the cap
+depends on the subscription tier. Instead of fixed sleeps between requests,
+the limiter below adjusts its concurrency with AIMD (additive increase,
+multiplicative decrease): it grows by one slot after a window of successful
+requests and halves when the API answers with a rate limit error. APIs that
+publish a request rate instead are paced with a token bucket.
+"""
+
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Iterator, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+# Longest wait between retries of a failed request (seconds)
+MAX_BACKOFF_DELAY = 30.0
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Thread-safe AIMD limit on the number of in-flight requests.
+
+    Rate limit errors from requests that were already running when the
+    limit was last cut are ignored, so one burst of 429 responses only
+    halves the limit once.
+    """
+
+    def __init__(
+        self,
+        max_inflight: int,
+        min_inflight: int = 1,
+        decrease_factor: float = 0.5,
+        increase_after: Optional[int] = None
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            max_inflight: Starting and highest concurrency, e.g. the plan limit
+            min_inflight: Lowest concurrency after decreases
+            decrease_factor: Factor applied to the limit on a rate limit error
+            increase_after: Successes needed to add one slot (defaults to
+                the current limit, i.e. roughly one round of requests)
+        """
+        self.max_inflight = max(1, max_inflight)
+        self.min_inflight = max(1, min(min_inflight, self.max_inflight))
+        self.decrease_factor = decrease_factor
+        self.increase_after = increase_after
+
+        self.limit = self.max_inflight
+        self.inflight = 0
+        self._successes = 0
+        self._generation = 0
+        self._condition = threading.Condition()
+
+    def acquire(self) -> int:
+        """
+        Wait for a free slot and take it.
+
+        Returns:
+            Generation token to pass to on_rate_limited
+        """
+        with self._condition:
+            while self.inflight >= self.limit:
+                self._condition.wait()
+            self.inflight += 1
+            return self._generation
+
+    def release(self) -> None:
+        """Give back a slot taken with acquire."""
+        with self._condition:
+            self.inflight -= 1
+            self._condition.notify()
+
+    @contextmanager
+    def slot(self) -> Iterator[int]:
+        """Hold a slot for the duration of a request."""
+        generation = self.acquire()
+        try:
+            yield generation
+        finally:
+            self.release()
+
+    def on_success(self) -> None:
+        """Record a successful request, growing the limit additively."""
+        with self._condition:
+            self._successes += 1
+            if self.limit < self.max_inflight and self._successes >= (self.increase_after or self.limit):
+                self.limit += 1
+                self._successes = 0
+                logger.debug(f"Request concurrency raised to {self.limit}")
+                self._condition.notify()
+
+    def on_rate_limited(self, generation: int) -> None:
+        """
+        Record a rate limit error, cutting the limit multiplicatively.
+
+        Args:
+            generation: Token returned by acquire for the failed request
+        """
+        with self._condition:
+            self._successes = 0
+            if generation != self._generation:
+                return
+
+            self._generation += 1
+            new_limit = max(self.min_inflight, int(self.limit * self.decrease_factor))
+            if new_limit < self.limit:
+                self.limit = new_limit
+                logger.info(f"Rate limited, request concurrency lowered to {self.limit}")
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket pacing requests to a fixed rate.
+
+    Each acquire takes one token, waiting for it to be refilled if the
+    bucket is empty. Waiting threads reserve their tokens in arrival order,
+    so the rate holds however many threads share the bucket.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """
+        Initialize the bucket, starting full.
+
+        Args:
+            rate: Tokens added per second; zero or less disables pacing
+            capacity: Most tokens held, i.e. the largest burst of requests
+        """
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Take a token, sleeping until one is available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait:
+            time.sleep(wait)
+        return wait
+
+
+def retry_after_seconds(headers: Optional[Mapping[str, str]]) -> Optional[float]:
+    """
+    Read the delay requested by a Retry-After response header.
+
+    Args:
+        headers: Response headers, or None if unavailable
+
+    Returns:
+        Seconds to wait, or None if the header is missing or invalid
+    """
+    if not headers:
+        return None
+
+    value = next((v for k, v in headers.items() if k.lower() == 'retry-after'), None)
+    if value is None:
+        return None
+
+    value = str(value).strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    # The header may also hold an HTTP date
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def backoff_delay(attempt: int, base_delay: float, max_delay: float = MAX_BACKOFF_DELAY) -> float:
+    """
+    Pick a retry delay with exponential backoff and full jitter.
+
+    The delay is drawn uniformly from zero to the exponential backoff, so
+    concurrent requests that failed together do not all retry at once.
+
+    Args:
+        attempt: Zero-based number of the attempt that failed
+        base_delay: Backoff for the first retry in seconds
+        max_delay: Upper bound for the backoff in seconds
+
+    Returns:
+        Seconds to wait before the next attempt
+    """
+    return random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
@@ -7,12 +7,26 @@ import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 import json
+import pickle
+import zipfile
 
 from src.core.epub_processor import EPUBProcessor, ProcessingResult
 from src.core.text_cleaner import Chapter, CleaningStats
 from src.utils.config import Config
 
 
+def _write_minimal_epub(epub_path: Path) -> None:
+    """Write a structurally valid EPUB container for validation tests."""
+    with zipfile.ZipFile(epub_path, 'w') as epub_zip:
+        epub_zip.writestr('mimetype', 'application/epub+zip')
+        epub_zip.writestr(
+            'META-INF/container.xml',
+            '<?xml version="1.0"?>\n<container version="1.0"/>'
+        )
+        # Pad past the suspiciously-small size check (>= 1KB)
+        epub_zip.writestr('OEBPS/content.xhtml', '<p>Valid content</p>' * 100)
+
+
 class TestEPUBProcessor:
     """Integration tests for EPUBProcessor."""
 
@@ -27,6 +41,15 @@ class TestEPUBProcessor:
         assert self.processor.cleaner is not None
         assert self.processor.temp_dir.exists()
 
+    def test_processor_pickle_roundtrip(self):
+        """Test the processor can be sent to worker processes."""
+        restored = pickle.loads(pickle.dumps(self.processor))
+
+        assert restored.config == self.config
+        assert restored.temp_dir == self.processor.temp_dir
+        assert restored.cleaner is not None
+        assert restored.progress_tracker is None
+
     def test_process_epub_file_not_found(self):
         """Test processing non-existent EPUB file."""
         non_existent_path = Path("/non/existent/file.epub")
@@ -229,12 +252,40 @@ class TestEPUBProcessor:
 
         with tempfile.NamedTemporaryFile(suffix='.epub', delete=False) as tmp_file:
             epub_path = Path(tmp_file.name)
-            # Write enough content to pass the size check (>= 1KB)
-            tmp_file.write(b"dummy epub content" * 100)
+        _write_minimal_epub(epub_path)
+
+        try:
+            issues = self.processor.validate_epub(epub_path, deep=True)
+            assert len(issues) == 0
+            mock_parse.assert_called_once()
+
+        finally:
+            epub_path.unlink()
+
+    @patch('src.core.epub_processor.parse_document')
+    def test_validate_epub_fast_path_skips_parse(self, mock_parse):
+        """Test default validation only checks the container structure."""
+        with tempfile.NamedTemporaryFile(suffix='.epub', delete=False) as tmp_file:
+            epub_path = Path(tmp_file.name)
+        _write_minimal_epub(epub_path)
 
         try:
             issues = self.processor.validate_epub(epub_path)
             assert len(issues) == 0
+            mock_parse.assert_not_called()
+
+        finally:
+            epub_path.unlink()
+
+    def test_validate_epub_not_a_zip(self):
+        """Test EPUB validation rejects files that are not ZIP archives."""
+        with tempfile.NamedTemporaryFile(suffix='.epub', delete=False) as tmp_file:
+            epub_path = Path(tmp_file.name)
+            tmp_file.write(b"dummy epub content" * 100)
+
+        try:
+            issues = self.processor.validate_epub(epub_path)
+            assert any("not a valid ZIP" in issue for issue in issues)
 
         finally:
             epub_path.unlink()
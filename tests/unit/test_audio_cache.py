@@ -0,0 +1,65 @@
+"""
+Unit tests for the audio cache.
+"""
+
+from src.utils.audio_cache import AudioCache
+
+
+class TestAudioCache:
+    """Unit tests for AudioCache class."""
+
+    def test_make_key_depends_on_text_and_params(self):
+        """Test keys are stable and change with any synthesis input."""
+        key = AudioCache.make_key("Hello.", voice_id="a", stability=0.5)
+
+        assert key == AudioCache.make_key("Hello.", stability=0.5, voice_id="a")
+        assert key != AudioCache.make_key("Hello!", voice_id="a", stability=0.5)
+        assert key != AudioCache.make_key("Hello.", voice_id="b", stability=0.5)
+        assert key != AudioCache.make_key("Hello.", voice_id="a", stability=0.75)
+
+    def test_put_get_and_copy(self, tmp_path):
+        """Test stored audio can be looked up and copied out."""
+        cache = AudioCache(tmp_path / "cache")
+        key = AudioCache.make_key("Some text", voice_id="a")
+
+        assert cache.get(key) is None
+        assert cache.copy_to(key, tmp_path / "out.mp3") is False
+
+        cache.put(key, b"audio bytes")
+        output_path = tmp_path / "nested" / "out.mp3"
+
+        assert cache.get(key).read_bytes() == b"audio bytes"
+        assert cache.copy_to(key, output_path) is True
+        assert output_path.read_bytes() == b"audio bytes"
+        assert cache.get(key).parent.name == key[:2]
+        assert list((tmp_path / "cache").rglob("*.tmp")) == []
+
+    def test_put_file_and_copy_share_storage(self, tmp_path):
+        """Test files are hard linked into and out of the cache."""
+        cache = AudioCache(tmp_path / "cache")
+        key = AudioCache.make_key("Linked", voice_id="a")
+        source_path = tmp_path / "source.mp3"
+        source_path.write_bytes(b"linked audio")
+        output_path = tmp_path / "out.mp3"
+        output_path.write_bytes(b"stale")
+
+        cached = cache.put_file(key, source_path)
+
+        assert cache.copy_to(key, output_path) is True
+        assert output_path.read_bytes() == b"linked audio"
+        assert output_path.stat().st_ino == cached.stat().st_ino == source_path.stat().st_ino
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Test the oldest entries are evicted once the size limit is exceeded."""
+        cache = AudioCache(tmp_path / "cache", max_bytes=250)
+        keys = [AudioCache.make_key(f"Chunk {i}") for i in range(3)]
+
+        cache.put(keys[0], b"a" * 100)
+        cache.put(keys[1], b"b" * 100)
+        assert cache.get(keys[0]) is not None  # Now more recent than keys[1]
+        cache.put(keys[2], b"c" * 100)
+
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) is not None
+        assert cache.get(keys[2]) is not None
+        cache.close()
@@ -0,0 +1,79 @@
+"""
+Unit tests for audio file helpers.
+"""
+
+import pytest
+
+from src.utils.audio_files import concatenate_mp3_files, id3v2_tag_size, link_or_copy
+
+
+def _id3v2_tag(payload: bytes) -> bytes:
+    """Build a minimal ID3v2.4 tag around a payload."""
+    size = len(payload)
+    syncsafe = bytes((size >> shift) & 0x7F for shift in (21, 14, 7, 0))
+    return b'ID3\x04\x00\x00' + syncsafe + payload
+
+
+def _id3v1_tag() -> bytes:
+    """Build an ID3v1 tag."""
+    return b'TAG' + b'\x00' * 125
+
+
+class TestAudioFiles:
+    """Unit tests for MP3 concatenation helpers."""
+
+    def test_id3v2_tag_size(self):
+        """Test tag sizes are decoded from the syncsafe header."""
+        tag = _id3v2_tag(b'x' * 300)
+
+        assert id3v2_tag_size(tag) == len(tag)
+        assert id3v2_tag_size(b'\xff\xfb\x90\x00' + b'\x00' * 6) == 0
+        assert id3v2_tag_size(b'ID3') == 0
+
+    def test_concatenate_strips_inner_tags(self, tmp_path):
+        """Test only the first file's ID3v2 tag survives concatenation."""
+        first = tmp_path / "a.mp3"
+        second = tmp_path / "b.mp3"
+        first.write_bytes(_id3v2_tag(b'meta-a') + b'FRAMES-A' + _id3v1_tag())
+        second.write_bytes(_id3v2_tag(b'meta-b') + b'FRAMES-B' + _id3v1_tag())
+
+        output_path = concatenate_mp3_files(
+            [first, tmp_path / "missing.mp3", second],
+            tmp_path / "out" / "book.mp3",
+            buffer_size=3
+        )
+
+        assert output_path.read_bytes() == _id3v2_tag(b'meta-a') + b'FRAMES-A' + b'FRAMES-B'
+        assert not (tmp_path / "out" / "book.mp3.partial").exists()
+
+    def test_concatenate_without_sendfile(self, tmp_path, monkeypatch):
+        """Test the buffered copy gives the same result as sendfile."""
+        monkeypatch.delattr("os.sendfile", raising=False)
+        first = tmp_path / "a.mp3"
+        second = tmp_path / "b.mp3"
+        first.write_bytes(b'FRAMES-A' * 100)
+        second.write_bytes(_id3v2_tag(b'meta-b') + b'FRAMES-B' * 100)
+
+        output_path = concatenate_mp3_files([first, second], tmp_path / "book.mp3", buffer_size=7)
+
+        assert output_path.read_bytes() == b'FRAMES-A' * 100 + b'FRAMES-B' * 100
+
+    @pytest.mark.parametrize("clone", [True, False])
+    def test_link_or_copy_without_links(self, tmp_path, monkeypatch, clone):
+        """Test files are copied when hard links are not possible."""
+        def no_link(source, target):
+            raise OSError("Invalid cross-device link")
+
+        monkeypatch.setattr("os.link", no_link)
+        if not clone:
+            monkeypatch.delattr("os.copy_file_range", raising=False)
+        source = tmp_path / "cached.mp3"
+        target = tmp_path / "out" / "chunk.mp3"
+        source.write_bytes(b'FRAMES' * 1000)
+        target.parent.mkdir()
+        target.write_bytes(b'stale')
+
+        link_or_copy(source, target)
+
+        assert target.read_bytes() == b'FRAMES' * 1000
+        assert source.stat().st_nlink == 1
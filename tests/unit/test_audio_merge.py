@@ -0,0 +1,152 @@
+"""
+Unit tests for decoded audio merging.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+from pydub import AudioSegment
+
+from src.utils import audio_merge
+from src.utils.audio_merge import ffmpeg_merge, join_segments, probe_durations, stream_merge
+
+
+def _segment(samples, frame_rate: int = 1000, channels: int = 1) -> AudioSegment:
+    """Build a 16-bit PCM segment from sample values."""
+    data = np.array(samples, dtype=np.int16).tobytes()
+    return AudioSegment(data=data, sample_width=2, frame_rate=frame_rate, channels=channels)
+
+
+class TestAudioMerge:
+    """Unit tests for join_segments."""
+
+    def test_join_without_crossfade(self):
+        """Test segments are concatenated back to back."""
+        joined = join_segments([_segment([1, 2, 3]), _segment([4, 5])])
+
+        assert joined.raw_data == np.array([1, 2, 3, 4, 5], dtype=np.int16).tobytes()
+
+    def test_crossfade_matches_append(self):
+        """Test the crossfade gives the same audio as AudioSegment.append."""
+        first = _segment([1000] * 50, channels=2)
+        second = _segment([-2000] * 60, channels=2)
+
+        joined = join_segments([first, second, first], crossfade_ms=10)
+        expected = first.append(second, crossfade=10).append(first, crossfade=10)
+
+        # pydub fades to -120 dB rather than silence, so samples may differ by one
+        np.testing.assert_allclose(
+            np.frombuffer(joined.raw_data, dtype=np.int16),
+            np.frombuffer(expected.raw_data, dtype=np.int16),
+            atol=1
+        )
+
+    def test_short_segments_limit_crossfade(self):
+        """Test a crossfade longer than a segment is shortened to fit."""
+        joined = join_segments([_segment([100] * 20), _segment([200] * 3)], crossfade_ms=10)
+
+        assert joined.frame_count() == 20
+
+    def test_join_requires_segments(self):
+        """Test joining nothing is an error."""
+        with pytest.raises(ValueError):
+            join_segments([])
+
+    def test_ffmpeg_merge_requires_ffmpeg(self, tmp_path, monkeypatch):
+        """Test merging is left to the caller when ffmpeg is missing."""
+        monkeypatch.setattr(audio_merge, "FFMPEG_PATH", None)
+
+        assert ffmpeg_merge([tmp_path / "a.mp3"], tmp_path / "book.mp3") is None
+
+    def test_ffmpeg_merge_commands(self, tmp_path, monkeypatch):
+        """Test frames are copied without crossfade and filtered with it."""
+        commands = []
+
+        def fake_run(command, **kwargs):
+            if "concat" in command:
+                commands.append(Path(command[command.index("-i") + 1]).read_text())
+            else:
+                commands.append(command[command.index("-filter_complex") + 1])
+            Path(command[-1]).write_bytes(b"merged")
+
+        monkeypatch.setattr(audio_merge, "FFMPEG_PATH", "ffmpeg")
+        monkeypatch.setattr(audio_merge.subprocess, "run", fake_run)
+        files = [tmp_path / "a.mp3", tmp_path / "it's.mp3", tmp_path / "c.mp3"]
+
+        assert ffmpeg_merge(files, tmp_path / "copy.mp3").read_bytes() == b"merged"
+        assert ffmpeg_merge(files, tmp_path / "fade.mp3", crossfade_ms=100).exists()
+        assert commands[0] == (
+            f"file '{tmp_path}/a.mp3'\n"
+            f"file '{tmp_path}/it'\\''s.mp3'\n"
+            f"file '{tmp_path}/c.mp3'\n"
+        )
+        assert commands[1] == "[0][1]acrossfade=d=0.1[a01];[a01][2]acrossfade=d=0.1[out]"
+
+    def test_stream_merge(self, tmp_path):
+        """Test files are streamed into one MP3 with soundfile."""
+        sf = pytest.importorskip("soundfile")
+        if 'MP3' not in sf.available_formats():
+            pytest.skip("libsndfile was built without MP3 support")
+
+        files = []
+        for index in range(3):
+            path = tmp_path / f"{index}.wav"
+            sf.write(str(path), np.full((22050, 1), 1000 * (index + 1), dtype=np.int16), 22050)
+            files.append(path)
+
+        output_path = stream_merge(files, tmp_path / "book.mp3", crossfade_ms=100, block_frames=4096)
+
+        # Two crossfades of 0.1 s overlap the three 1 s files
+        assert sf.info(str(output_path)).duration == pytest.approx(2.8, abs=0.1)
+
+    def test_stream_merge_wav_matches_join(self, tmp_path):
+        """Test streaming into WAV gives the same samples as join_segments."""
+        sf = pytest.importorskip("soundfile")
+
+        files = []
+        for index, length in enumerate([5000, 300, 7000]):
+            path = tmp_path / f"{index}.wav"
+            sf.write(str(path), np.full((length, 1), 1000 * (index + 1), dtype=np.int16), 8000)
+            files.append(path)
+
+        output_path = stream_merge(files, tmp_path / "book.wav", crossfade_ms=50, block_frames=1024,
+                                   output_format='WAV')
+        expected = join_segments([AudioSegment.from_file(str(path)) for path in files], crossfade_ms=50)
+
+        merged, _ = sf.read(str(output_path), dtype='int16')
+        np.testing.assert_array_equal(merged, np.frombuffer(expected.raw_data, dtype=np.int16))
+
+    def test_ffmpeg_merge_encodes_non_mp3(self, tmp_path, monkeypatch):
+        """Test frames are only copied when every input is an MP3 file."""
+        commands = []
+
+        def fake_run(command, **kwargs):
+            commands.append(command)
+            Path(command[-1]).write_bytes(b"merged")
+
+        monkeypatch.setattr(audio_merge, "FFMPEG_PATH", "ffmpeg")
+        monkeypatch.setattr(audio_merge.subprocess, "run", fake_run)
+
+        ffmpeg_merge([tmp_path / "a.wav", tmp_path / "b.wav"], tmp_path / "book.mp3", bitrate="64k")
+
+        assert "copy" not in commands[0]
+        assert commands[0][commands[0].index("-b:a") + 1] == "64k"
+
+    def test_probe_durations(self, tmp_path, monkeypatch):
+        """Test durations come from ffprobe, with None for unreadable files."""
+        def fake_run(command, **kwargs):
+            path = Path(command[-1])
+            if not path.exists():
+                raise audio_merge.subprocess.CalledProcessError(1, command)
+            return audio_merge.subprocess.CompletedProcess(command, 0, stdout=path.read_text())
+
+        monkeypatch.setattr(audio_merge, "FFPROBE_PATH", "ffprobe")
+        monkeypatch.setattr(audio_merge, "SOUNDFILE_AVAILABLE", False)
+        monkeypatch.setattr(audio_merge.subprocess, "run", fake_run)
+        (tmp_path / "a.mp3").write_text("12.5\n")
+        (tmp_path / "b.mp3").write_text("3.25\n")
+
+        durations = probe_durations([tmp_path / "a.mp3", tmp_path / "missing.mp3", tmp_path / "b.mp3"])
+
+        assert durations == [12.5, None, 3.25]
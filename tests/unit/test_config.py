@@ -153,6 +153,20 @@ class TestConfigManager:
         with pytest.raises(ValueError, match="Invalid output format"):
             self.config_manager._validate_config(config)
 
+    def test_validate_config_invalid_elevenlabs_settings(self):
+        """Test configuration validation with invalid ElevenLabs request options."""
+        config = Config()
+        config.tts.elevenlabs_optimize_streaming_latency = 5
+
+        with pytest.raises(ValueError, match="optimize_streaming_latency"):
+            self.config_manager._validate_config(config)
+
+        config.tts.elevenlabs_optimize_streaming_latency = None
+        config.tts.elevenlabs_output_format = "pcm_44100"
+
+        with pytest.raises(ValueError, match="Invalid ElevenLabs output format"):
+            self.config_manager._validate_config(config)
+
     def test_validate_config_invalid_text_format(self):
         """Test configuration validation with invalid text format."""
         config = Config()
@@ -0,0 +1,144 @@
+"""
+Unit tests for the Hume TTS pipeline.
+"""
+
+import base64
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from src.pipelines import hume_tts_pipeline
+from src.pipelines.hume_tts_pipeline import HumeTTSConfig, HumeTTSPipeline
+
+
+def _audio(text: str) -> str:
+    """Encode the fake audio returned for a text."""
+    return base64.b64encode(text.upper().encode()).decode()
+
+
+def _fake_synthesize_json(text=None, utterances=None, **kwargs):
+    """Answer synthesis requests with the upper-cased text as audio."""
+    if utterances is None:
+        return SimpleNamespace(audio_data=_audio(text))
+
+    # One snippet group per utterance, its audio split over two snippets
+    snippets = [
+        [SimpleNamespace(audio=_audio(u.text[:2])), SimpleNamespace(audio=_audio(u.text[2:]))]
+        for u in utterances
+    ]
+    return SimpleNamespace(generations=[SimpleNamespace(snippets=snippets)])
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Replace the Hume SDK client and the pooled HTTP client with mocks."""
+    client = Mock()
+    client.tts.synthesize_json.side_effect = _fake_synthesize_json
+    monkeypatch.setattr(hume_tts_pipeline, "HumeClient", lambda **kwargs: client)
+    monkeypatch.setattr(hume_tts_pipeline, "create_http_client", lambda **kwargs: Mock())
+    return client
+
+
+@pytest.fixture
+def pipeline(client, tmp_path):
+    """Create a pipeline with an audio cache, no pacing and no retry delay."""
+    config = HumeTTSConfig(
+        api_key="test",
+        cache_dir=str(tmp_path / "cache"),
+        requests_per_second=0,
+        retry_delay=0,
+        max_concurrency=1,
+        coalesce_max_chars=20
+    )
+    with HumeTTSPipeline(config) as pipeline:
+        yield pipeline
+
+
+class TestHumeTTSPipeline:
+    """Unit tests for HumeTTSPipeline class."""
+
+    def test_resynthesis_keeps_linked_cache_entry(self, pipeline, tmp_path):
+        """Test new audio for an output file does not overwrite the cache entry linked to it."""
+        output_path = tmp_path / "out" / "chunk.mp3"
+
+        assert pipeline.process_chunk("old text", output_path).success
+        assert pipeline.process_chunk("new text", output_path).success
+
+        assert output_path.read_bytes() == b"NEW TEXT"
+        assert pipeline.cache.get(pipeline._cache_key("old text")).read_bytes() == b"OLD TEXT"
+        assert pipeline.cache.get(pipeline._cache_key("new text")).read_bytes() == b"NEW TEXT"
+        assert list(output_path.parent.glob("*.partial")) == []
+
+    def test_coalesce_chunks_respects_limits(self, pipeline, monkeypatch):
+        """Test short texts are grouped up to the limit and long or cached texts go alone."""
+        texts = ["a" * 8, "b" * 8, "c" * 8, "x" * hume_tts_pipeline.COALESCE_CHUNK_CHARS, "d" * 5, "e" * 5]
+
+        assert pipeline._coalesce_chunks(texts) == [[0, 1], [2], [3], [4, 5]]
+
+        pipeline.cache.put(pipeline._cache_key("e" * 5), b"cached")
+        # Grouping only probes the cache files, without recording a lookup
+        monkeypatch.setattr(pipeline.cache, "get", Mock(side_effect=AssertionError("cache index touched")))
+        assert pipeline._coalesce_chunks(texts) == [[0, 1], [2], [3], [4], [5]]
+
+        pipeline.config.coalesce_max_chars = 0
+        assert pipeline._coalesce_chunks(texts[:3]) == [[0], [1], [2]]
+
+    def test_batch_shares_requests(self, pipeline, client, tmp_path):
+        """Test short chunks are synthesized together and split into their own files."""
+        texts = ["Alpha.", "Beta.", "Gamma.", "Delta."]
+
+        results = pipeline.batch_process(
+            [{'id': f"c{i}", 'text': text} for i, text in enumerate(texts)], tmp_path / "out"
+        )
+
+        calls = client.tts.synthesize_json.call_args_list
+        assert [u.text for u in calls[0].kwargs['utterances']] == texts[:3]
+        assert calls[0].kwargs['split_utterances'] is False
+        assert calls[1].kwargs['text'] == "Delta."
+        assert len(calls) == 2
+        assert [r.success for r in results] == [True] * 4
+        assert [(tmp_path / "out" / f"c{i}.mp3").read_bytes() for i in range(4)] == [
+            text.upper().encode() for text in texts
+        ]
+        # The shared request counts as one API call, on its first chunk
+        assert [r.api_calls_made for r in results] == [1, 0, 0, 1]
+        assert pipeline.total_api_calls == 2
+
+    def test_group_count_mismatch_falls_back(self, pipeline, client, tmp_path):
+        """Test chunks are synthesized one by one when the audio cannot be matched to them."""
+        def drop_last_group(**kwargs):
+            response = _fake_synthesize_json(**kwargs)
+            if 'utterances' in kwargs:
+                response.generations[0].snippets.pop()
+            return response
+
+        client.tts.synthesize_json.side_effect = drop_last_group
+        texts = ["Alpha.", "Beta.", "Gamma."]
+
+        results = pipeline._process_utterances(
+            texts, [tmp_path / f"c{i}.mp3" for i in range(3)], ["c0", "c1", "c2"]
+        )
+
+        single_texts = [c.kwargs.get('text') for c in client.tts.synthesize_json.call_args_list[1:]]
+        assert single_texts == texts
+        assert [r.api_calls_made for r in results] == [1, 1, 1]
+        assert [(tmp_path / f"c{i}.mp3").read_bytes() for i in range(3)] == [b"ALPHA.", b"BETA.", b"GAMMA."]
+
+    def test_failed_shared_request_falls_back(self, pipeline, client, tmp_path):
+        """Test chunks are synthesized one by one when the shared request keeps failing."""
+        def fail_utterances(**kwargs):
+            if 'utterances' in kwargs:
+                raise RuntimeError("server error")
+            return _fake_synthesize_json(**kwargs)
+
+        client.tts.synthesize_json.side_effect = fail_utterances
+        texts = ["Alpha.", "Beta."]
+
+        results = pipeline._process_utterances(texts, [tmp_path / "c0.mp3", tmp_path / "c1.mp3"], ["c0", "c1"])
+
+        calls = client.tts.synthesize_json.call_args_list
+        assert sum('utterances' in c.kwargs for c in calls) == pipeline.config.max_retries
+        assert [r.success for r in results] == [True, True]
+        assert (tmp_path / "c0.mp3").read_bytes() == b"ALPHA."
+        assert (tmp_path / "c1.mp3").read_bytes() == b"BETA."
@@ -0,0 +1,174 @@
+"""
+Unit tests for the image description cache.
+"""
+
+import json
+import pickle
+import sqlite3
+from unittest.mock import Mock
+
+import pytest
+
+from src.pipelines import image_pipeline
+from src.pipelines.image_pipeline import ImageDescription, ImageDescriptionCache
+
+
+def _description(text: str = "A red square.") -> ImageDescription:
+    """Build a description as the pipeline would cache it."""
+    return ImageDescription(
+        image_path="cover.png",
+        description=text,
+        context="",
+        confidence=0.9,
+        processing_time=0.1,
+        model_used="mock"
+    )
+
+
+def _stored_rows(cache_dir) -> int:
+    """Count the descriptions written to the cache database."""
+    connection = sqlite3.connect(cache_dir / image_pipeline.CACHE_DB_FILENAME)
+    try:
+        return connection.execute("SELECT COUNT(*) FROM descriptions").fetchone()[0]
+    finally:
+        connection.close()
+
+
+@pytest.fixture
+def image_path(tmp_path):
+    """Create an image file to describe."""
+    path = tmp_path / "cover.png"
+    path.write_bytes(b"not really a png")
+    return str(path)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Open a cache and close it after the test."""
+    cache = ImageDescriptionCache(tmp_path / "cache")
+    yield cache
+    cache.close()
+
+
+class TestImageDescriptionCache:
+    """Unit tests for ImageDescriptionCache class."""
+
+    def test_set_and_get(self, cache, image_path):
+        """Test cached descriptions are found for the same image and context only."""
+        assert cache.get(image_path, "context") is None
+
+        cache.set(image_path, "context", _description())
+        description = cache.get(image_path, "context")
+
+        assert description.description == "A red square."
+        assert description.cache_hit is True
+        assert cache.get(image_path, "other context") is None
+
+    def test_rewritten_image_misses(self, cache, image_path):
+        """Test a rewritten image file no longer matches its cached description."""
+        cache.set(image_path, "", _description())
+
+        with open(image_path, 'ab') as f:
+            f.write(b" with more bytes")
+
+        assert cache.get(image_path, "") is None
+
+    def test_writes_are_batched(self, cache, image_path, tmp_path):
+        """Test descriptions are written once enough are pending or on flush."""
+        for i in range(image_pipeline.CACHE_FLUSH_EVERY - 1):
+            cache.set(image_path, f"context {i}", _description())
+
+        assert _stored_rows(tmp_path / "cache") == 0
+        assert cache.get(image_path, "context 0") is not None
+
+        cache.set(image_path, "last context", _description())
+        assert _stored_rows(tmp_path / "cache") == image_pipeline.CACHE_FLUSH_EVERY
+
+        cache.set(image_path, "after flush", _description())
+        cache.flush()
+        assert _stored_rows(tmp_path / "cache") == image_pipeline.CACHE_FLUSH_EVERY + 1
+
+    def test_close_writes_pending_descriptions(self, tmp_path, image_path):
+        """Test descriptions pending at close are found after reopening."""
+        cache = ImageDescriptionCache(tmp_path / "cache")
+        cache.set(image_path, "", _description())
+        cache.close()
+
+        reopened = ImageDescriptionCache(tmp_path / "cache")
+        try:
+            assert reopened.get(image_path, "").description == "A red square."
+        finally:
+            reopened.close()
+
+    def test_outdated_key_version_is_dropped(self, tmp_path, image_path):
+        """Test entries stored under another key version are removed on open."""
+        cache = ImageDescriptionCache(tmp_path / "cache")
+        cache.set(image_path, "", _description())
+        cache.close()
+
+        connection = sqlite3.connect(tmp_path / "cache" / image_pipeline.CACHE_DB_FILENAME)
+        connection.execute(f"PRAGMA user_version = {image_pipeline.CACHE_KEY_VERSION - 1}")
+        connection.close()
+
+        reopened = ImageDescriptionCache(tmp_path / "cache")
+        try:
+            assert reopened.get(image_path, "") is None
+            assert _stored_rows(tmp_path / "cache") == 0
+        finally:
+            reopened.close()
+
+    @pytest.mark.parametrize("versioned", [True, False])
+    def test_legacy_files_are_removed(self, tmp_path, versioned):
+        """Test pickle files listed in an old JSON index are deleted with the index."""
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        entries = {"0123456789abcdef_01234567": {"timestamp": 1.0}}
+        index = {'version': 2, 'entries': entries} if versioned else entries
+        (cache_dir / image_pipeline.LEGACY_INDEX_FILENAME).write_text(json.dumps(index))
+        (cache_dir / "0123456789abcdef_01234567.pkl").write_bytes(pickle.dumps(_description()))
+        (cache_dir / "unrelated.txt").write_text("keep")
+
+        ImageDescriptionCache(cache_dir).close()
+
+        assert sorted(path.name for path in cache_dir.iterdir() if not path.name.startswith("cache.db")) == [
+            "unrelated.txt"
+        ]
+
+    def test_unknown_keys_skip_the_database(self, cache, image_path):
+        """Test a miss for a key never stored does not query the database."""
+        connection = cache._connection
+        cache._connection = Mock(side_effect=AssertionError("database queried"))
+        try:
+            assert cache.get(image_path, "never stored") is None
+            cache._connection.execute.assert_not_called()
+        finally:
+            cache._connection = connection
+
+    def test_invalid_entry_is_removed(self, cache, image_path, tmp_path):
+        """Test a description that cannot be unpickled is treated as a miss and deleted."""
+        cache.set(image_path, "", _description())
+        cache.flush()
+        cache._connection.execute("UPDATE descriptions SET description = x'00'")
+
+        assert cache.get(image_path, "") is None
+        assert _stored_rows(tmp_path / "cache") == 0
+        assert cache.get(image_path, "") is None
+
+    def test_invalid_entry_with_locked_database(self, cache, image_path):
+        """Test a failure to delete an invalid entry does not escape the lookup."""
+        cache.set(image_path, "", _description())
+        cache.flush()
+        cache._connection.execute("UPDATE descriptions SET description = x'00'")
+
+        connection = cache._connection
+
+        def execute(sql, *args):
+            if sql.startswith("DELETE"):
+                raise sqlite3.OperationalError("database is locked")
+            return connection.execute(sql, *args)
+
+        cache._connection = Mock(execute=Mock(side_effect=execute))
+        try:
+            assert cache.get(image_path, "") is None
+        finally:
+            cache._connection = connection
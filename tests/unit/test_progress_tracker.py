@@ -0,0 +1,32 @@
+"""
+Unit tests for progress event coalescing.
+"""
+
+from src.ui import progress_tracker
+from src.ui.progress_tracker import ProgressCoalescer
+
+
+class TestProgressCoalescer:
+    """Unit tests for ProgressCoalescer class."""
+
+    def test_emits_every_step_and_the_final_item(self, monkeypatch):
+        """Test updates are thinned to about 1% steps with the last one kept."""
+        monkeypatch.setattr(progress_tracker.time, "monotonic", lambda: 0.0)
+        coalescer = ProgressCoalescer(1050)
+
+        emitted = [completed for completed in range(1, 1051) if coalescer.should_emit(completed)]
+
+        assert emitted[:3] == [10, 20, 30]
+        assert emitted[-1] == 1050
+        assert len(emitted) == 105
+
+    def test_emits_after_interval(self, monkeypatch):
+        """Test a slow batch still emits updates after the interval."""
+        now = [0.0]
+        monkeypatch.setattr(progress_tracker.time, "monotonic", lambda: now[0])
+        coalescer = ProgressCoalescer(1000, min_interval=0.5)
+
+        assert not coalescer.should_emit(1)
+        now[0] = 0.6
+        assert coalescer.should_emit(2)
+        assert not coalescer.should_emit(3)
@@ -0,0 +1,73 @@
+"""
+Unit tests for the adaptive concurrency limiter.
+"""
+
+import pytest
+
+from src.utils import rate_limiter
+from src.utils.rate_limiter import AdaptiveConcurrencyLimiter, TokenBucket, backoff_delay, retry_after_seconds
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Unit tests for AdaptiveConcurrencyLimiter class."""
+
+    def test_rate_limit_halves_once_per_burst(self):
+        """Test a burst of rate limit errors only cuts the limit once."""
+        limiter = AdaptiveConcurrencyLimiter(8)
+        generations = [limiter.acquire() for _ in range(4)]
+
+        for generation in generations:
+            limiter.on_rate_limited(generation)
+            limiter.release()
+
+        assert limiter.limit == 4
+
+        limiter.on_rate_limited(limiter.acquire())
+        assert limiter.limit == 2
+
+    def test_successes_grow_limit_up_to_maximum(self):
+        """Test the limit recovers additively and stops at the maximum."""
+        limiter = AdaptiveConcurrencyLimiter(4, increase_after=2)
+        limiter.on_rate_limited(limiter.acquire())
+        limiter.release()
+        assert limiter.limit == 2
+
+        for _ in range(10):
+            with limiter.slot():
+                limiter.on_success()
+
+        assert limiter.limit == 4
+        assert limiter.inflight == 0
+
+    def test_retry_after_seconds(self):
+        """Test Retry-After headers are parsed as seconds or HTTP dates."""
+        assert retry_after_seconds({"Retry-After": "3"}) == 3.0
+        assert retry_after_seconds({"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0.0
+        assert retry_after_seconds({"retry-after": "soon"}) is None
+        assert retry_after_seconds(None) is None
+
+    def test_backoff_delay_is_jittered_and_capped(self):
+        """Test backoff delays stay within the exponential window and the cap."""
+        delays = [backoff_delay(3, 1.0, max_delay=5.0) for _ in range(200)]
+
+        assert all(0 <= delay <= 5.0 for delay in delays)
+        assert len(set(delays)) > 1
+        assert backoff_delay(0, 0.0) == 0.0
+
+
+class TestTokenBucket:
+    """Unit tests for TokenBucket class."""
+
+    def test_requests_are_paced_to_rate(self, monkeypatch):
+        """Test waits grow with each token taken from an empty bucket."""
+        clock = [100.0]
+        monkeypatch.setattr(rate_limiter.time, "monotonic", lambda: clock[0])
+        monkeypatch.setattr(rate_limiter.time, "sleep", lambda seconds: None)
+        bucket = TokenBucket(2.0, capacity=2)
+
+        waits = [bucket.acquire() for _ in range(4)]
+        assert waits == pytest.approx([0.0, 0.0, 0.5, 1.0])
+
+        clock[0] += 10.0
+        assert bucket.acquire() == 0.0
+        assert TokenBucket(0).acquire() == 0.0
@@ -6,7 +6,7 @@ import pytest
 from unittest.mock import patch, Mock
 from pathlib import Path
 
-from src.core.text_cleaner import TextCleaner, Chapter, CleaningStats
+from src.core.text_cleaner import TextCleaner, Chapter, CleaningStats, count_words
 
 
 class TestTextCleaner:
@@ -78,6 +78,46 @@ class TestTextCleaner:
         assert " percent " in cleaned
         assert " and " in cleaned
 
+    def test_fix_encoding_skips_plain_ascii(self):
+        """Test ftfy only runs on text it could change."""
+        with patch('ftfy.fix_text', side_effect=lambda text: text) as mock_fix:
+            self.cleaner._fix_encoding("Plain ASCII text.\n")
+            mock_fix.assert_not_called()
+
+            self.cleaner._fix_encoding("Caf\u00c3\u00a9 &amp; more")
+            mock_fix.assert_called_once()
+
+    def test_tts_replacements_keep_sequential_order(self):
+        """Test translate tables give the same result as ordered replaces."""
+        replacements = {'\u2019': "'", "'": '"', 'ab': 'x', '&': ' and '}
+        steps = TextCleaner._compile_tts_replacements(replacements)
+
+        with patch.dict(self.cleaner.compiled_patterns, {'tts_replacements': steps}):
+            result = self.cleaner._apply_tts_replacements("it\u2019s ab & 'q'")
+
+        expected = "it\u2019s ab & 'q'"
+        for key, value in replacements.items():
+            expected = expected.replace(key, value)
+        assert result == expected
+
+    def test_tts_replacements_automaton_matches_sequential_replace(self):
+        """Test fused multi-character replacements match ordered replaces."""
+        pytest.importorskip('ahocorasick')
+        replacements = {f'<{name}>': f' {name.upper()} ' for name in
+                        ['eg', 'ie', 'etc', 'vs', 'cf', 'al', 'ca', 'ch',
+                         'ed', 'fig', 'no', 'pp', 'st', 'vol']}
+        steps = TextCleaner._compile_tts_replacements(replacements)
+        assert [step[0] for step in steps] == ['automaton']
+
+        text = "See <fig> 3 <cf> <vol>, <eg> <eg><ie> and <unknown> <st"
+        with patch.dict(self.cleaner.compiled_patterns, {'tts_replacements': steps}):
+            result = self.cleaner._apply_tts_replacements(text)
+
+        expected = text
+        for key, value in replacements.items():
+            expected = expected.replace(key, value)
+        assert result == expected
+
     def test_add_pause_markers_questions(self):
         """Test pause marker insertion after questions."""
         text = "What is this? This is a test."
@@ -92,6 +132,20 @@ class TestTextCleaner:
 
         assert "[PAUSE: 0.5]" in result
 
+    def test_normalize_whitespace(self):
+        """Test space runs, blank lines and line edges are normalized."""
+        text = "  First  line \n\n\n\n second\tline\t\n"
+        result = self.cleaner._normalize_whitespace(text)
+
+        assert result == "First line\n\nsecond\tline"
+
+    def test_add_pause_markers_literal_markers(self):
+        """Test pause markers for dialogue, header and paragraph markers."""
+        text = "Title[HEADER_END]\n\nHi[DIALOGUE_END] there"
+        result = self.cleaner.add_pause_markers(text)
+
+        assert result == "Title[PAUSE: 1.0]\n[PAUSE: 0.5]\nHi[DIALOGUE_END][PAUSE: 0.3] there"
+
     def test_segment_chapters_with_markers(self):
         """Test chapter segmentation using chapter markers."""
         text = """
@@ -121,6 +175,22 @@ class TestTextCleaner:
         assert chapters[0].title == "Full Text"
         assert chapters[0].chapter_num == 1
 
+    def test_detect_chapters_uses_first_matching_pattern(self):
+        """Test pattern detection picks the first pattern that matches."""
+        rules = {'chapter_detection': {'patterns': [r'^Book\s+\d+', r'^Part\s+[IVX]+', r'^Section\s+\d+']}}
+        with patch('src.core.text_cleaner.load_regex_patterns', return_value=rules):
+            cleaner = TextCleaner()
+
+        text = "Part I\nSection 1\nFirst part.\nPart II\nSection 2\nSecond part."
+        chapters = cleaner._detect_chapters_by_patterns(text)
+
+        with patch.dict(cleaner.compiled_patterns, {'hyperscan': {}}):
+            fallback = cleaner._detect_chapters_by_patterns(text)
+
+        assert [chapter.title for chapter in chapters] == ["Part I", "Part II"]
+        assert [chapter.content for chapter in chapters] == [chapter.content for chapter in fallback]
+        assert cleaner.validate_patterns() == []
+
     def test_create_chapter(self):
         """Test chapter creation with metadata calculation."""
         content = "This is a test chapter. " * 100  # ~500 words
@@ -133,6 +203,18 @@ class TestTextCleaner:
         assert chapter.estimated_duration > 0
         assert chapter.confidence == 1.0
 
+    def test_count_words_matches_split(self):
+        """Test vectorized word counting agrees with str.split()."""
+        texts = [
+            "",
+            "one",
+            "  leading and trailing  ",
+            "word " * 2000,
+            "café naïve　漢字 \U0001F600 end\n" * 400,
+        ]
+        for text in texts:
+            assert count_words(text) == len(text.split())
+
     def test_cleaning_stats(self):
         """Test cleaning statistics tracking."""
         text = "Original text[1] with **bold** content."
@@ -145,6 +227,65 @@ class TestTextCleaner:
         assert stats.cleaned_length > 0
         assert stats.patterns_applied > 0
 
+    def test_parallel_cleaning_keeps_stats_per_text(self):
+        """Test texts cleaned alongside parallel_cleaning keep their own stats."""
+        texts = ["First[1] text.", "Second **bold** text."]
+
+        with self.cleaner.parallel_cleaning(texts, max_workers=1) as results:
+            other, other_stats = self.cleaner.clean_text_with_stats("Other[2] text & more.")
+            cleaned = list(results)
+
+        assert other == self.cleaner.clean_text("Other[2] text & more.")
+        assert other_stats.original_length == len("Other[2] text & more.")
+        assert [text for text, _ in cleaned] == [self.cleaner.clean_text(text) for text in texts]
+        assert [stats.original_length for _, stats in cleaned] == [len(text) for text in texts]
+
+    def test_hyperscan_matches_regex_only_output(self):
+        """Test that Hyperscan pattern location does not change cleaning results."""
+        text = "Footnote[1] with **bold** text, and no other markup."
+        with_hyperscan = self.cleaner.clean_text(text)
+
+        with patch.dict(self.cleaner.compiled_patterns, {'hyperscan': {}}):
+            without_hyperscan = self.cleaner.clean_text(text)
+
+        assert with_hyperscan == without_hyperscan
+
+    def test_re2_engine_rules(self):
+        """Test RE2 rules match regex output and unsupported ones fall back."""
+        pytest.importorskip('re2')
+        rules = {
+            'cleaning_rules': {
+                'remove': [
+                    {'pattern': r'<[^>]+>', 'name': 'tags', 'engine': 're2'},
+                    {'pattern': r'(x)\1', 'name': 'backref', 'engine': 're2'}
+                ],
+                'transform': [
+                    {'pattern': r'^#{1,6}\s+(.+)$', 'name': 'headers', 'engine': 're2',
+                     'multiline': True, 'replacement': r'[HEADER: \1]'}
+                ]
+            }
+        }
+        with patch('src.core.text_cleaner.load_regex_patterns', return_value=rules):
+            cleaner = TextCleaner()
+
+        engines = [config['engine'] for config in cleaner.compiled_patterns['remove']]
+        assert engines == ['re2', 'regex']
+        assert cleaner.compiled_patterns['transform'][0]['engine'] == 're2'
+
+        text = "<p>Intro xx</p>\n# Title\nBody"
+        assert cleaner._apply_removal_patterns(text) == "Intro \n# Title\nBody"
+        assert cleaner._apply_transformation_patterns(text) == "<p>Intro xx</p>\n[HEADER: Title]\nBody"
+
+    def test_literal_anchor(self):
+        """Test extraction of the literal prefix every match must contain."""
+        assert TextCleaner._literal_anchor(r'^Page \d+.*$') == 'Page '
+        assert TextCleaner._literal_anchor(r'\*\*(.+?)\*\*') == '**'
+        assert TextCleaner._literal_anchor(r'ab?c') == 'a'
+        assert TextCleaner._literal_anchor(r'ab+c') == 'ab'
+        assert TextCleaner._literal_anchor(r'\[?\d+\]') == ''
+        assert TextCleaner._literal_anchor(r'cat|dog') == ''
+        assert TextCleaner._literal_anchor(r'(?i)chapter') == ''
+
     def test_validate_patterns_success(self):
         """Test pattern validation with valid patterns."""
         errors = self.cleaner.validate_patterns()